@@ -1,7 +1,7 @@
 import os
 import time
 from dataclasses import replace
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
 import numpy as np
 from PyQt6.QtCore import QObject, QThread, pyqtSignal, QMetaObject, Q_ARG, Qt
@@ -52,7 +52,7 @@ class AppController(QObject):
     thumbnail_requested = pyqtSignal(list)
     thumbnail_update_requested = pyqtSignal(ThumbnailUpdateTask)
     tool_sync_requested = pyqtSignal()
-    config_updated = pyqtSignal()
+    config_updated = pyqtSignal(str)  # Changed config section name, "*" for multi-section changes
     status_message_requested = pyqtSignal(str, int)
     status_progress_requested = pyqtSignal(int, int)
 
@@ -83,6 +83,7 @@ class AppController(QObject):
         self.thumb_worker = ThumbnailWorker(self.asset_store)
         self.thumb_worker.moveToThread(self.thumb_thread)
         self.thumb_thread.start()
+        self._thumbs_pending: Set[str] = set()
 
         self.norm_thread = QThread()
         self.norm_worker = NormalizationWorker(self.preview_service, self.session.repo)
@@ -96,6 +97,9 @@ class AppController(QObject):
 
         self._is_rendering = False
         self._pending_render_task: Any = None
+        # Bumped per finished render; views key per-frame caches on it, since
+        # producers may hand back the same array object for a new frame
+        self._render_seq = 0
 
         self._connect_signals()
 
@@ -105,7 +109,6 @@ class AppController(QObject):
     def _connect_signals(self) -> None:
         self.render_requested.connect(self.render_worker.process)
         self.render_worker.finished.connect(self._on_render_finished)
-        self.render_worker.metrics_updated.connect(self._on_metrics_updated)
         self.render_worker.error.connect(self._on_render_error)
 
         self.export_worker.progress.connect(self.export_progress.emit)
@@ -116,6 +119,7 @@ class AppController(QObject):
         self.thumb_worker.progress.connect(self._on_thumbnail_progress)
         self.thumbnail_update_requested.connect(self.thumb_worker.update_rendered)
         self.thumb_worker.finished.connect(self._on_thumbnails_finished)
+        self.session.asset_model.visible_range_changed.connect(lambda *_: self.generate_missing_thumbnails())
 
         self.normalization_requested.connect(self.norm_worker.process)
         self.norm_worker.progress.connect(self._on_normalization_progress)
@@ -128,12 +132,20 @@ class AppController(QObject):
         self.discovery_worker.error.connect(self._on_render_error)
 
         self.session.file_selected.connect(self.load_file)
-        self.session.state_changed.connect(self.config_updated.emit)
+        self.session.section_changed.connect(self.config_updated.emit)
         self.session.state_changed.connect(self.request_render)
 
     def generate_missing_thumbnails(self) -> None:
-        missing = [f for f in self.state.uploaded_files if f["name"] not in self.state.thumbnails]
+        """
+        Requests thumbnails for the rows the file browser shows (all rows if no view reported a range).
+        """
+        files = self.state.uploaded_files
+        visible = self.session.asset_model.visible_range()
+        if visible is not None:
+            files = files[visible[0] : visible[1] + 1]
+        missing = [f for f in files if f["name"] not in self.state.thumbnails and f["name"] not in self._thumbs_pending]
         if missing:
+            self._thumbs_pending.update(f["name"] for f in missing)
             self.set_status("GENERATING THUMBNAILS...")
             self.thumbnail_requested.emit(missing)
 
@@ -141,13 +153,16 @@ class AppController(QObject):
         self.set_status(f"THUMBNAIL {current}/{total}: {name}")
         self.status_progress_requested.emit(current, total)
 
-    def _on_thumbnails_finished(self, new_thumbs: Dict[str, Any]) -> None:
+    def _on_thumbnails_finished(self, new_thumbs: Dict[str, Any], requested: List[str]) -> None:
         self.set_status("GALLERIES UPDATED", 3000)
         self.status_progress_requested.emit(0, 0)
         for name, pil_img in new_thumbs.items():
             if pil_img:
                 u8_arr = np.array(pil_img.convert("RGB"))
                 self.state.thumbnails[name] = QIcon(QPixmap.fromImage(ImageConverter.to_qimage(u8_arr)))
+        # Release the whole batch, so names that failed are requested again later
+        self._thumbs_pending.difference_update(requested)
+        self.session.asset_model.trim_thumbnails()
         self.session.asset_model.refresh()
 
     def request_asset_discovery(self, paths: List[str]) -> None:
@@ -571,6 +586,8 @@ class AppController(QObject):
         should_update_thumb = not self._first_render_done
         self._first_render_done = True
 
+        self._render_seq += 1
+        metrics["render_seq"] = self._render_seq
         self.state.last_metrics.update(metrics)
         self.set_status("READY", 1000)
         self.image_updated.emit()
@@ -578,17 +595,23 @@ class AppController(QObject):
         if should_update_thumb:
             self._update_thumbnail_from_state(force_readback=True)
 
+        # Only dispatch once this frame is presented: on the GPU path base_positive
+        # is a pooled texture the next render writes into
+        self._dispatch_pending_render()
+
+        self._apply_render_metrics(metrics)
+
+    def _dispatch_pending_render(self) -> None:
         if self._pending_render_task:
             task = self._pending_render_task
             self._pending_render_task = None
             self._is_rendering = True
             self.render_requested.emit(task)
 
-    def _on_metrics_updated(self, metrics: Dict[str, Any]) -> None:
+    def _apply_render_metrics(self, metrics: Dict[str, Any]) -> None:
         """
-        Handles late-arriving metrics and persists analysis results.
+        Publishes render metrics once the frame is out and persists analysis results.
         """
-        self.state.last_metrics.update(metrics)
         self.metrics_available.emit(metrics)
 
         # If render produced fresh log bounds or shadow cast, persist them locally
@@ -656,6 +679,7 @@ class AppController(QObject):
         self.export_thread.wait()
         self.thumb_thread.quit()
         self.thumb_thread.wait()
+        self.thumb_worker.cleanup()
         self.norm_thread.quit()
         self.norm_thread.wait()
         self.discovery_thread.quit()
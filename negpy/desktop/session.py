@@ -1,6 +1,7 @@
+from collections import OrderedDict
 from enum import Enum, auto
-from dataclasses import dataclass, field, replace
-from typing import Dict, Any, List, Optional
+from dataclasses import dataclass, field, fields, replace
+from typing import AbstractSet, Dict, Any, List, Optional, Set, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal, QAbstractListModel, QModelIndex, Qt
 from negpy.domain.models import WorkspaceConfig
 from negpy.infrastructure.storage.repository import StorageRepository
@@ -26,7 +27,7 @@ class AppState:
     is_processing: bool = False
     active_tool: ToolMode = ToolMode.NONE
     uploaded_files: List[Dict[str, Any]] = field(default_factory=list)
-    thumbnails: Dict[str, Any] = field(default_factory=dict)  # filename -> QIcon/QPixmap
+    thumbnails: "OrderedDict[str, Any]" = field(default_factory=OrderedDict)  # filename -> QIcon/QPixmap, least recently shown first
     selected_file_idx: int = -1
     selected_indices: List[int] = field(default_factory=list)
     active_adjustment_idx: int = 0
@@ -47,11 +48,17 @@ class AppState:
 class AssetListModel(QAbstractListModel):
     """
     Model for the uploaded files list with thumbnail support.
+    Tracks the rows the view currently shows so thumbnails are only decoded and kept around for those.
     """
 
+    MAX_THUMBNAILS = 512
+
+    visible_range_changed = pyqtSignal(int, int)
+
     def __init__(self, state: AppState):
         super().__init__()
         self._state = state
+        self._visible: Optional[Tuple[int, int]] = None
 
     def rowCount(self, parent=QModelIndex()) -> int:
         return len(self._state.uploaded_files)
@@ -66,7 +73,10 @@ class AssetListModel(QAbstractListModel):
             return file_info["name"]
 
         if role == Qt.ItemDataRole.DecorationRole:
-            return self._state.thumbnails.get(file_info["name"])
+            thumb = self._state.thumbnails.get(file_info["name"])
+            if thumb is not None:
+                self._state.thumbnails.move_to_end(file_info["name"])
+            return thumb
 
         if role == Qt.ItemDataRole.ToolTipRole:
             return file_info["path"]
@@ -76,6 +86,32 @@ class AssetListModel(QAbstractListModel):
     def refresh(self) -> None:
         self.layoutChanged.emit()
 
+    def visible_range(self) -> Optional[Tuple[int, int]]:
+        """
+        Inclusive (first, last) rows wanted by the view, or None when no view has reported yet.
+        """
+        return self._visible
+
+    def set_visible_range(self, first: int, last: int) -> None:
+        if (first, last) != self._visible:
+            self._visible = (first, last)
+            self.visible_range_changed.emit(first, last)
+
+    def trim_thumbnails(self) -> None:
+        """
+        Drops least recently shown thumbnails outside the visible range until the cache fits MAX_THUMBNAILS.
+        """
+        thumbs = self._state.thumbnails
+        excess = len(thumbs) - self.MAX_THUMBNAILS
+        if excess <= 0:
+            return
+        keep: Set[str] = set()
+        if self._visible is not None:
+            first, last = self._visible
+            keep = {f["name"] for f in self._state.uploaded_files[first : last + 1]}
+        for name in [n for n in thumbs if n not in keep][:excess]:
+            del thumbs[name]
+
 
 class DesktopSessionManager(QObject):
     """
@@ -83,26 +119,43 @@ class DesktopSessionManager(QObject):
     """
 
     state_changed = pyqtSignal()
+    section_changed = pyqtSignal(str)  # Config section touched since last notify, "*" if several/unknown
     settings_saved = pyqtSignal()
     file_selected = pyqtSignal(str)  # Emits file path when active file changes
+    file_switching = pyqtSignal()  # Emitted before the active file changes, while state still holds the outgoing file
 
     def __init__(self, repo: StorageRepository):
         super().__init__()
         self.repo = repo
         self.state = AppState()
         self.asset_model = AssetListModel(self.state)
+        self._dirty_sections: Set[str] = set()
+        self._uploaded_paths: Set[str] = set()  # Mirrors uploaded_files paths, mutated on the GUI thread only
 
         # Load global hardware settings
         saved_gpu = self.repo.get_global_setting("gpu_enabled")
         if saved_gpu is not None:
             self.state.gpu_enabled = bool(saved_gpu)
 
+    @property
+    def uploaded_paths(self) -> AbstractSet[str]:
+        """Paths of all loaded files, kept in sync by add/remove/clear."""
+        return self._uploaded_paths
+
+    def _notify_changed(self, section: str = "*") -> None:
+        """
+        Emits section_changed followed by state_changed.
+        """
+        self._dirty_sections.clear()
+        self.section_changed.emit(section)
+        self.state_changed.emit()
+
     def set_gpu_enabled(self, enabled: bool) -> None:
         """Updates and persists the hardware acceleration preference."""
         if self.state.gpu_enabled != enabled:
             self.state.gpu_enabled = enabled
             self.repo.save_global_setting("gpu_enabled", enabled)
-            self.state_changed.emit()
+            self._notify_changed()
 
     def _apply_sticky_settings(self, config: WorkspaceConfig, only_global: bool = False) -> WorkspaceConfig:
         """
@@ -263,6 +316,9 @@ class DesktopSessionManager(QObject):
         Changes active file and hydrates state from repository.
         """
         if 0 <= index < len(self.state.uploaded_files):
+            # Let debounced edits land on the outgoing file before it is saved
+            self.file_switching.emit()
+
             # Save current before switching
             if self.state.current_file_hash:
                 self.repo.save_file_settings(self.state.current_file_hash, self.state.config)
@@ -282,12 +338,12 @@ class DesktopSessionManager(QObject):
                 self.state.config = self._apply_sticky_settings(WorkspaceConfig(), only_global=False)
 
             self.file_selected.emit(file_info["path"])
-            self.state_changed.emit()
+            self._notify_changed()
 
     def update_selection(self, indices: List[int]) -> None:
         """Updates the list of currently selected indices."""
         self.state.selected_indices = indices
-        self.state_changed.emit()
+        self._notify_changed()
 
     def sync_selected_settings(self) -> None:
         """
@@ -348,6 +404,9 @@ class DesktopSessionManager(QObject):
         """
         Updates global config and optionally saves to disk.
         """
+        old = self.state.config
+        # Untouched sections keep their identity through dataclasses.replace
+        self._dirty_sections.update(f.name for f in fields(config) if getattr(config, f.name) is not getattr(old, f.name))
         self.state.config = config
 
         if persist:
@@ -357,7 +416,9 @@ class DesktopSessionManager(QObject):
                 self.settings_saved.emit()
 
         if render:
-            self.state_changed.emit()
+            # Only tag a specific section when exactly one changed since the last notification
+            section = next(iter(self._dirty_sections)) if len(self._dirty_sections) == 1 else "*"
+            self._notify_changed(section)
 
     def reset_settings(self) -> None:
         """
@@ -369,7 +430,7 @@ class DesktopSessionManager(QObject):
         import copy
 
         self.state.clipboard = copy.deepcopy(self.state.config)
-        self.state_changed.emit()
+        self._notify_changed()
 
     def paste_settings(self) -> None:
         if self.state.clipboard:
@@ -389,6 +450,7 @@ class DesktopSessionManager(QObject):
                 if any(f["hash"] == info["hash"] for f in self.state.uploaded_files):
                     continue
                 self.state.uploaded_files.append(info)
+                self._uploaded_paths.add(info["path"])
         else:
             for path in file_paths:
                 try:
@@ -400,19 +462,21 @@ class DesktopSessionManager(QObject):
                         continue
 
                     self.state.uploaded_files.append({"name": os.path.basename(path), "path": path, "hash": f_hash})
+                    self._uploaded_paths.add(path)
                 except Exception as e:
                     from negpy.kernel.system.logging import get_logger
 
                     get_logger(__name__).error(f"Failed to add {path}: {e}")
 
         self.asset_model.refresh()
-        self.state_changed.emit()
+        self._notify_changed()
 
     def clear_files(self) -> None:
         """
         Purges all loaded files from the session.
         """
         self.state.uploaded_files.clear()
+        self._uploaded_paths.clear()
         self.state.thumbnails.clear()
         self.state.selected_file_idx = -1
         self.state.current_file_path = None
@@ -420,7 +484,7 @@ class DesktopSessionManager(QObject):
         self.state.config = WorkspaceConfig()
 
         self.asset_model.refresh()
-        self.state_changed.emit()
+        self._notify_changed()
 
     def remove_current_file(self) -> None:
         """
@@ -429,6 +493,7 @@ class DesktopSessionManager(QObject):
         idx = self.state.selected_file_idx
         if 0 <= idx < len(self.state.uploaded_files):
             file_info = self.state.uploaded_files.pop(idx)
+            self._uploaded_paths.discard(file_info["path"])
             self.state.thumbnails.pop(file_info["name"], None)
 
             if not self.state.uploaded_files:
@@ -442,4 +507,4 @@ class DesktopSessionManager(QObject):
                 self.select_file(new_idx)
 
             self.asset_model.refresh()
-            self.state_changed.emit()
+            self._notify_changed()
@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (
     QFrame,
 )
 from PyQt6.QtCore import QSize, Qt
-import qtawesome as qta
+from negpy.desktop.view.styles.icons import icon
 from negpy.desktop.controller import AppController
 from negpy.desktop.view.styles.theme import THEME
 
@@ -56,27 +56,27 @@ class ActionToolbar(QWidget):
         btn_height = 32
 
         self.btn_prev = QToolButton()
-        self.btn_prev.setIcon(qta.icon("fa5s.chevron-left", color=icon_color))
+        self.btn_prev.setIcon(icon("fa5s.chevron-left", icon_color))
         self.btn_prev.setToolTip("Previous Image (Left Arrow)")
 
         self.btn_next = QToolButton()
-        self.btn_next.setIcon(qta.icon("fa5s.chevron-right", color=icon_color))
+        self.btn_next.setIcon(icon("fa5s.chevron-right", icon_color))
         self.btn_next.setToolTip("Next Image (Right Arrow)")
 
         self.btn_rot_l = QToolButton()
-        self.btn_rot_l.setIcon(qta.icon("fa5s.undo", color=icon_color))
+        self.btn_rot_l.setIcon(icon("fa5s.undo", icon_color))
         self.btn_rot_l.setToolTip("Rotate CCW ([)")
 
         self.btn_rot_r = QToolButton()
-        self.btn_rot_r.setIcon(qta.icon("fa5s.redo", color=icon_color))
+        self.btn_rot_r.setIcon(icon("fa5s.redo", icon_color))
         self.btn_rot_r.setToolTip("Rotate CW (])")
 
         self.btn_flip_h = QToolButton()
-        self.btn_flip_h.setIcon(qta.icon("fa5s.arrows-alt-h", color=icon_color))
+        self.btn_flip_h.setIcon(icon("fa5s.arrows-alt-h", icon_color))
         self.btn_flip_h.setToolTip("Flip Horizontal (H)")
 
         self.btn_flip_v = QToolButton()
-        self.btn_flip_v.setIcon(qta.icon("fa5s.arrows-alt-v", color=icon_color))
+        self.btn_flip_v.setIcon(icon("fa5s.arrows-alt-v", icon_color))
         self.btn_flip_v.setToolTip("Flip Vertical (V)")
 
         for btn in [
@@ -92,23 +92,23 @@ class ActionToolbar(QWidget):
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
 
         self.btn_copy = QPushButton(" Copy")
-        self.btn_copy.setIcon(qta.icon("fa5s.copy", color=icon_color))
+        self.btn_copy.setIcon(icon("fa5s.copy", icon_color))
 
         self.btn_paste = QPushButton(" Paste")
-        self.btn_paste.setIcon(qta.icon("fa5s.paste", color=icon_color))
+        self.btn_paste.setIcon(icon("fa5s.paste", icon_color))
 
         self.btn_reset = QPushButton(" Reset")
-        self.btn_reset.setIcon(qta.icon("fa5s.history", color=icon_color))
+        self.btn_reset.setIcon(icon("fa5s.history", icon_color))
 
         self.btn_unload = QPushButton(" Unload")
-        self.btn_unload.setIcon(qta.icon("fa5s.times-circle", color=icon_color))
+        self.btn_unload.setIcon(icon("fa5s.times-circle", icon_color))
 
         self.btn_save = QPushButton(" Save")
-        self.btn_save.setIcon(qta.icon("fa5s.save", color=icon_color))
+        self.btn_save.setIcon(icon("fa5s.save", icon_color))
 
         self.btn_export = QPushButton(" Export")
         self.btn_export.setObjectName("export_btn")
-        self.btn_export.setIcon(qta.icon("fa5s.check-circle", color="white"))
+        self.btn_export.setIcon(icon("fa5s.check-circle", "white"))
         self.btn_export.setIconSize(icon_size)
         self.btn_export.setToolTip("Export the current image with applied settings (E)")
 
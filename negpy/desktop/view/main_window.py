@@ -99,7 +99,7 @@ class MainWindow(QMainWindow):
         self.controller.export_progress.connect(self._on_export_progress)
         self.controller.export_finished.connect(self._on_export_finished)
         self.controller.tool_sync_requested.connect(self._sync_tool_buttons)
-        self.controller.config_updated.connect(self.canvas.overlay.update)
+        self.controller.config_updated.connect(lambda _: self.canvas.overlay.update())
 
         self.controller.status_message_requested.connect(self.top_status.showMessage)
         self.controller.status_progress_requested.connect(self.top_status.set_progress)
@@ -166,13 +166,11 @@ class MainWindow(QMainWindow):
         self.top_status.showMessage(f"Clicked at: {nx:.3f}, {ny:.3f}")
 
     def _on_export_progress(self, current: int, total: int, filename: str) -> None:
-        self.top_status.progress.setVisible(True)
-        self.top_status.progress.setRange(0, total)
-        self.top_status.progress.setValue(current)
+        self.top_status.set_progress(current, total)
         self.top_status.showMessage(f"Exporting {filename} ({current}/{total})...")
 
     def _on_export_finished(self, elapsed: float) -> None:
-        self.top_status.progress.setVisible(False)
+        self.top_status.hide_progress()
         self.top_status.showMessage(f"Export Complete in {elapsed:.2f}s", 5000)
 
     def _sync_tool_buttons(self) -> None:
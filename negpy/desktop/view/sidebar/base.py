@@ -1,5 +1,7 @@
-from typing import Any
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Tuple
 from dataclasses import replace
+from PyQt6.QtCore import QTimer, QSignalBlocker
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
 from negpy.desktop.controller import AppController
 
@@ -10,11 +12,22 @@ class BaseSidebar(QWidget):
     Handles common setup and configuration updates.
     """
 
+    # Widgets silenced while sync_ui pushes state; subclasses assign it once at the end of _init_ui
+    _blocked_widgets: Tuple[QWidget, ...] = ()
+
     def __init__(self, controller: AppController):
         super().__init__()
         self.controller = controller
         self.state = controller.state
 
+        # section -> (merged field changes, merged update flags) awaiting the flush timer
+        self._pending_updates: Dict[str, Tuple[Dict[str, Any], Dict[str, bool]]] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self.flush_pending_updates)
+        self.controller.session.file_switching.connect(self.flush_pending_updates)
+
         self._init_layout()
         self._init_ui()
         self._connect_signals()
@@ -37,6 +50,19 @@ class BaseSidebar(QWidget):
         """Override to update widgets from current AppState."""
         pass
 
+    @contextmanager
+    def signals_blocked(self) -> Iterator[None]:
+        """
+        Blocks signals of _blocked_widgets for the duration of the block.
+        QSignalBlocker restores each widget's previous state instead of force-unblocking it.
+        """
+        blockers = [QSignalBlocker(w) for w in self._blocked_widgets]
+        try:
+            yield
+        finally:
+            for blocker in blockers:
+                blocker.unblock()
+
     def update_config_section(
         self,
         section_name: str,
@@ -66,6 +92,41 @@ class BaseSidebar(QWidget):
         if render:
             self.controller.request_render(readback_metrics=readback_metrics)
 
+    def queue_config_section(
+        self,
+        section_name: str,
+        render: bool = True,
+        persist: bool = False,
+        readback_metrics: bool = True,
+        **changes: Any,
+    ) -> None:
+        """
+        Debounced update_config_section for continuous inputs such as slider drags.
+        Changes to a section are merged and applied once the input pauses for a frame.
+        """
+        pending = self._pending_updates.get(section_name)
+        if pending is None:
+            self._pending_updates[section_name] = (
+                dict(changes),
+                {"render": render, "persist": persist, "readback_metrics": readback_metrics},
+            )
+        else:
+            pending_changes, flags = pending
+            pending_changes.update(changes)
+            flags["render"] |= render
+            flags["persist"] |= persist
+            flags["readback_metrics"] |= readback_metrics
+        self._flush_timer.start()
+
+    def flush_pending_updates(self) -> None:
+        """
+        Applies queued section changes immediately.
+        """
+        self._flush_timer.stop()
+        pending, self._pending_updates = self._pending_updates, {}
+        for section_name, (changes, flags) in pending.items():
+            self.update_config_section(section_name, **flags, **changes)
+
     def update_config_root(
         self,
         render: bool = True,
@@ -1,13 +1,15 @@
+from typing import Dict, Tuple, Type
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
 )
 from PyQt6.QtCore import Qt
-import qtawesome as qta
 
 from negpy.desktop.controller import AppController
 from negpy.desktop.view.widgets.collapsible import CollapsibleSection
 from negpy.desktop.view.styles.theme import THEME
+from negpy.desktop.view.styles.icons import icon
+from negpy.desktop.view.sidebar.base import BaseSidebar
 
 # Sidebar Components
 from negpy.desktop.view.sidebar.presets import PresetsSidebar
@@ -19,6 +21,20 @@ from negpy.desktop.view.sidebar.toning import ToningSidebar
 from negpy.desktop.view.sidebar.retouch import RetouchSidebar
 from negpy.desktop.view.sidebar.icc import ICCSidebar
 
+_ICON_COLOR = "#aaa"
+
+# (key, title, sidebar class, icon) in display order
+_SECTIONS: Tuple[Tuple[str, str, Type[BaseSidebar], str], ...] = (
+    ("presets", "Presets", PresetsSidebar, "fa5s.magic"),
+    ("geometry", "Geometry", GeometrySidebar, "fa5s.crop"),
+    ("process", "Process", ProcessSidebar, "fa5s.cogs"),
+    ("exposure", "Exposure", ExposureSidebar, "fa5s.sun"),
+    ("lab", "Lab", LabSidebar, "fa5s.flask"),
+    ("retouch", "Retouch", RetouchSidebar, "fa5s.brush"),
+    ("toning", "Toning", ToningSidebar, "fa5s.tint"),
+    ("icc", "ICC", ICCSidebar, "fa5s.eye"),
+)
+
 
 class ControlsPanel(QWidget):
     """
@@ -38,71 +54,20 @@ class ControlsPanel(QWidget):
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.setSpacing(8)
 
-        icon_color = "#aaa"
-
-        self.presets_sidebar = PresetsSidebar(self.controller)
-        self._add_sidebar_section(
-            "Presets",
-            "presets",
-            self.presets_sidebar,
-            icon=qta.icon("fa5s.magic", color=icon_color),
-        )
-
-        self.geometry_sidebar = GeometrySidebar(self.controller)
-        self._add_sidebar_section(
-            "Geometry",
-            "geometry",
-            self.geometry_sidebar,
-            icon=qta.icon("fa5s.crop", color=icon_color),
-        )
-
-        self.process_sidebar = ProcessSidebar(self.controller)
-        self._add_sidebar_section(
-            "Process",
-            "process",
-            self.process_sidebar,
-            icon=qta.icon("fa5s.cogs", color=icon_color),
-        )
-
-        self.exposure_sidebar = ExposureSidebar(self.controller)
-        self._add_sidebar_section(
-            "Exposure",
-            "exposure",
-            self.exposure_sidebar,
-            icon=qta.icon("fa5s.sun", color=icon_color),
-        )
-
-        self.lab_sidebar = LabSidebar(self.controller)
-        self._add_sidebar_section(
-            "Lab",
-            "lab",
-            self.lab_sidebar,
-            icon=qta.icon("fa5s.flask", color=icon_color),
-        )
-
-        self.retouch_sidebar = RetouchSidebar(self.controller)
-        self._add_sidebar_section(
-            "Retouch",
-            "retouch",
-            self.retouch_sidebar,
-            icon=qta.icon("fa5s.brush", color=icon_color),
-        )
-
-        self.toning_sidebar = ToningSidebar(self.controller)
-        self._add_sidebar_section(
-            "Toning",
-            "toning",
-            self.toning_sidebar,
-            icon=qta.icon("fa5s.tint", color=icon_color),
-        )
-
-        self.icc_sidebar = ICCSidebar(self.controller)
-        self._add_sidebar_section(
-            "ICC",
-            "icc",
-            self.icc_sidebar,
-            icon=qta.icon("fa5s.eye", color=icon_color),
-        )
+        for key, title, sidebar_cls, icon_name in _SECTIONS:
+            sidebar = sidebar_cls(self.controller)
+            setattr(self, f"{key}_sidebar", sidebar)
+            self._add_sidebar_section(title, key, sidebar, icon=icon(icon_name, _ICON_COLOR))
+
+        # Sidebars reading other sections (e.g. process_mode) are synced alongside the owning one
+        self._section_map: Dict[str, Tuple[BaseSidebar, ...]] = {
+            "process": (self.process_sidebar, self.lab_sidebar, self.toning_sidebar),
+            "exposure": (self.exposure_sidebar,),
+            "geometry": (self.geometry_sidebar,),
+            "lab": (self.lab_sidebar,),
+            "toning": (self.toning_sidebar,),
+            "retouch": (self.retouch_sidebar,),
+        }
 
     def _add_sidebar_section(self, title: str, key: str, widget: QWidget, icon=None) -> None:
         """Helper to create and add a collapsible section."""
@@ -123,9 +88,19 @@ class ControlsPanel(QWidget):
         self.layout.addWidget(section)
 
     def _connect_signals(self) -> None:
-        self.controller.config_updated.connect(self._sync_all_sidebars)
+        self.controller.config_updated.connect(self._on_section_updated)
         self.controller.tool_sync_requested.connect(self._sync_tool_buttons)
 
+    def _on_section_updated(self, section: str) -> None:
+        """Syncs only the sidebars bound to the changed config section, or all of them for "*"."""
+        sidebars = self._section_map.get(section)
+        if sidebars is None:
+            if section != "export":
+                self._sync_all_sidebars()
+            return
+        for sidebar in sidebars:
+            sidebar.sync_ui()
+
     def _sync_all_sidebars(self) -> None:
         """Force all sidebar panels to update their widgets from current AppState."""
         self.process_sidebar.sync_ui()
@@ -1,3 +1,4 @@
+from typing import Optional
 from PyQt6.QtWidgets import (
     QComboBox,
     QPushButton,
@@ -11,12 +12,30 @@ from PyQt6.QtWidgets import (
     QLabel,
 )
 from PyQt6.QtGui import QColor
-from PyQt6.QtCore import QTimer
-import qtawesome as qta
+from PyQt6.QtCore import QTimer, QStringListModel
 from negpy.desktop.view.styles.theme import THEME
+from negpy.desktop.view.styles.icons import icon
 from negpy.desktop.view.sidebar.base import BaseSidebar
 from negpy.domain.models import ColorSpace, AspectRatio, ExportFormat
 
+_FMT_ITEMS = [f.value for f in ExportFormat]
+_CS_ITEMS = [cs.value for cs in ColorSpace] + ["Same as Source"]
+# "Original" is first, then the rest
+_RATIO_ITEMS = [AspectRatio.ORIGINAL.value] + [r.value for r in AspectRatio if r != AspectRatio.ORIGINAL]
+
+_APPLY_ALL_CHECKED_STYLE = f"""
+    QPushButton {{
+        background-color: {THEME.accent_primary};
+        color: white;
+        font-weight: bold;
+        border-radius: 4px;
+    }}
+    QPushButton:hover {{
+        background-color: {THEME.accent_secondary};
+    }}
+"""
+_APPLY_ALL_UNCHECKED_STYLE = "font-weight: bold;"
+
 
 class ExportSidebar(BaseSidebar):
     """
@@ -35,27 +54,26 @@ class ExportSidebar(BaseSidebar):
 
         fmt_row = QHBoxLayout()
         self.fmt_combo = QComboBox()
-        self.fmt_combo.addItems([f.value for f in ExportFormat])
+        # Single-shot model population instead of per-item inserts
+        self.fmt_combo.setModel(QStringListModel(_FMT_ITEMS, self.fmt_combo))
         self.fmt_combo.setCurrentText(conf.export_fmt)
 
         self.cs_combo = QComboBox()
-        self.cs_combo.addItems([cs.value for cs in ColorSpace] + ["Same as Source"])
+        self.cs_combo.setModel(QStringListModel(_CS_ITEMS, self.cs_combo))
         self.cs_combo.setCurrentText(conf.export_color_space)
         fmt_row.addWidget(self.fmt_combo)
         fmt_row.addWidget(self.cs_combo)
         self.layout.addLayout(fmt_row)
 
         self.ratio_combo = QComboBox()
-        # "Original" is first, then the rest
-        ratios = [AspectRatio.ORIGINAL] + [r.value for r in AspectRatio if r != AspectRatio.ORIGINAL]
-        self.ratio_combo.addItems(ratios)
+        self.ratio_combo.setModel(QStringListModel(_RATIO_ITEMS, self.ratio_combo))
         self.ratio_combo.setCurrentText(conf.paper_aspect_ratio)
         self.layout.addWidget(self.ratio_combo)
 
         self.orig_res_btn = QPushButton(" Use Original Resolution")
         self.orig_res_btn.setCheckable(True)
         self.orig_res_btn.setChecked(conf.use_original_res)
-        self.orig_res_btn.setIcon(qta.icon("fa5s.compress-arrows-alt", color=THEME.text_primary))
+        self.orig_res_btn.setIcon(icon("fa5s.compress-arrows-alt", THEME.text_primary))
         self.layout.addWidget(self.orig_res_btn)
 
         self.size_container = QWidget()
@@ -82,7 +100,7 @@ class ExportSidebar(BaseSidebar):
         print_row.addLayout(vbox_dpi)
         size_layout.addLayout(print_row)
         self.layout.addWidget(self.size_container)
-        self.size_container.setVisible(not conf.use_original_res)
+        self._set_visible(self.size_container, not conf.use_original_res)
 
         border_row = QHBoxLayout()
         vbox_border = QVBoxLayout()
@@ -98,6 +116,7 @@ class ExportSidebar(BaseSidebar):
         vbox_color.addWidget(QLabel("Color"))
         self.color_btn = QPushButton()
         self.color_btn.setFixedHeight(30)
+        self._last_border_hex: Optional[str] = None
         self._update_color_btn(conf.export_border_color)
         vbox_color.addWidget(self.color_btn)
 
@@ -123,7 +142,7 @@ class ExportSidebar(BaseSidebar):
         path_layout = QHBoxLayout()
         self.path_input = QLineEdit(conf.export_path)
         self.browse_btn = QPushButton()
-        self.browse_btn.setIcon(qta.icon("fa5s.folder-open", color=THEME.text_primary))
+        self.browse_btn.setIcon(icon("fa5s.folder-open", THEME.text_primary))
         self.browse_btn.setFixedWidth(40)
         path_layout.addWidget(self.path_input)
         path_layout.addWidget(self.browse_btn)
@@ -133,7 +152,7 @@ class ExportSidebar(BaseSidebar):
         self.batch_export_btn = QPushButton(" EXPORT ALL LOADED")
         self.batch_export_btn.setObjectName("batch_export_btn")
         self.batch_export_btn.setFixedHeight(40)
-        self.batch_export_btn.setIcon(qta.icon("fa5s.images", color="white"))
+        self.batch_export_btn.setIcon(icon("fa5s.images", "white"))
 
         self.apply_all_btn = QPushButton(" Apply to all")
         self.apply_all_btn.setFixedHeight(40)
@@ -147,6 +166,18 @@ class ExportSidebar(BaseSidebar):
 
         self.layout.addStretch()
 
+        self._blocked_widgets = (
+            self.fmt_combo,
+            self.cs_combo,
+            self.ratio_combo,
+            self.orig_res_btn,
+            self.size_input,
+            self.dpi_input,
+            self.border_input,
+            self.pattern_input,
+            self.path_input,
+        )
+
     def _connect_signals(self) -> None:
         # All changes trigger the same debounce timer
         self.fmt_combo.currentTextChanged.connect(lambda _: self.update_timer.start())
@@ -164,30 +195,23 @@ class ExportSidebar(BaseSidebar):
         self.path_input.textChanged.connect(lambda _: self.update_timer.start())
 
         self.apply_all_btn.toggled.connect(self._update_apply_all_style)
-        self.batch_export_btn.clicked.connect(
-            lambda: self.controller.request_batch_export(override_settings=self.apply_all_btn.isChecked())
-        )
+        self.batch_export_btn.clicked.connect(self._on_batch_export)
+
+    def _on_batch_export(self) -> None:
+        """
+        Flushes any pending debounced settings before the batch reads the config.
+        """
+        if self.update_timer.isActive():
+            self.update_timer.stop()
+            self._persist_all_export_settings()
+        self.controller.request_batch_export(override_settings=self.apply_all_btn.isChecked())
 
     def _update_apply_all_style(self, checked: bool) -> None:
         """
         Toggles button highlighting to match the Export All button when active.
         """
-        if checked:
-            self.apply_all_btn.setStyleSheet(f"""
-                QPushButton {{
-                    background-color: {THEME.accent_primary};
-                    color: white;
-                    font-weight: bold;
-                    border-radius: 4px;
-                }}
-                QPushButton:hover {{
-                    background-color: {THEME.accent_secondary};
-                }}
-            """)
-            self.apply_all_btn.setIcon(qta.icon("fa5s.clone", color="white"))
-        else:
-            self.apply_all_btn.setStyleSheet("font-weight: bold;")
-            self.apply_all_btn.setIcon(qta.icon("fa5s.clone", color=THEME.text_primary))
+        self.apply_all_btn.setStyleSheet(_APPLY_ALL_CHECKED_STYLE if checked else _APPLY_ALL_UNCHECKED_STYLE)
+        self.apply_all_btn.setIcon(icon("fa5s.clone", "white" if checked else THEME.text_primary))
 
     def _persist_all_export_settings(self) -> None:
         """Collects all UI values and performs a single debounced config update."""
@@ -207,7 +231,7 @@ class ExportSidebar(BaseSidebar):
         )
 
     def _on_orig_res_toggled(self, checked: bool) -> None:
-        self.size_container.setVisible(not checked)
+        self._set_visible(self.size_container, not checked)
         self.update_timer.start()
 
     def _on_color_clicked(self) -> None:
@@ -225,38 +249,35 @@ class ExportSidebar(BaseSidebar):
         if path:
             self.path_input.setText(path)
 
+    @staticmethod
+    def _set_visible(widget: QWidget, visible: bool) -> None:
+        """
+        Changes visibility only when it differs, avoiding a redundant layout invalidation.
+        Uses isHidden() so the check holds while the export tab itself is not shown.
+        """
+        if widget.isHidden() == visible:
+            widget.setVisible(visible)
+
     def _update_color_btn(self, hex_color: str) -> None:
+        # The app-wide QSS owns QPushButton backgrounds, so the swatch has to stay a stylesheet;
+        # skip the re-parse and re-polish when the color did not change.
+        if hex_color == self._last_border_hex:
+            return
+        self._last_border_hex = hex_color
         self.color_btn.setStyleSheet(f"background-color: {hex_color}; border: 1px solid #555;")
 
     def sync_ui(self) -> None:
         conf = self.state.config.export
-        self.block_signals(True)
-        try:
+        with self.signals_blocked():
             self.fmt_combo.setCurrentText(conf.export_fmt)
             self.cs_combo.setCurrentText(conf.export_color_space)
             self.ratio_combo.setCurrentText(conf.paper_aspect_ratio)
-            self.orig_res_btn.setChecked(conf.use_original_res)
-            self.size_container.setVisible(not conf.use_original_res)
+            if self.orig_res_btn.isChecked() != conf.use_original_res:
+                self.orig_res_btn.setChecked(conf.use_original_res)
+            self._set_visible(self.size_container, not conf.use_original_res)
             self.size_input.setValue(conf.export_print_size)
             self.dpi_input.setValue(conf.export_dpi)
             self.border_input.setValue(conf.export_border_size)
             self._update_color_btn(conf.export_border_color)
             self.pattern_input.setText(conf.filename_pattern)
             self.path_input.setText(conf.export_path)
-        finally:
-            self.block_signals(False)
-
-    def block_signals(self, blocked: bool) -> None:
-        widgets = [
-            self.fmt_combo,
-            self.cs_combo,
-            self.ratio_combo,
-            self.orig_res_btn,
-            self.size_input,
-            self.dpi_input,
-            self.border_input,
-            self.pattern_input,
-            self.path_input,
-        ]
-        for w in widgets:
-            w.blockSignals(blocked)
@@ -1,9 +1,10 @@
+from functools import partial
 from PyQt6.QtWidgets import (
     QPushButton,
     QHBoxLayout,
     QComboBox,
 )
-import qtawesome as qta
+from negpy.desktop.view.styles.icons import icon
 from negpy.desktop.view.widgets.sliders import CompactSlider
 from negpy.desktop.view.styles.theme import THEME
 from negpy.desktop.view.sidebar.base import BaseSidebar
@@ -37,13 +38,13 @@ class ExposureSidebar(BaseSidebar):
         wb_btn_row = QHBoxLayout()
         self.pick_wb_btn = QPushButton(" Pick WB")
         self.pick_wb_btn.setCheckable(True)
-        self.pick_wb_btn.setIcon(qta.icon("fa5s.eye-dropper", color=THEME.text_primary))
+        self.pick_wb_btn.setIcon(icon("fa5s.eye-dropper", THEME.text_primary))
         self.pick_wb_btn.setStyleSheet(f"font-size: {THEME.font_size_base}px; padding: 8px;")
 
         self.camera_wb_btn = QPushButton(" Camera WB")
         self.camera_wb_btn.setCheckable(True)
         self.camera_wb_btn.setChecked(conf.use_camera_wb)
-        self.camera_wb_btn.setIcon(qta.icon("fa5s.camera", color=THEME.text_primary))
+        self.camera_wb_btn.setIcon(icon("fa5s.camera", THEME.text_primary))
         self.camera_wb_btn.setStyleSheet(f"font-size: {THEME.font_size_base}px; padding: 8px;")
 
         wb_btn_row.addWidget(self.pick_wb_btn)
@@ -84,56 +85,53 @@ class ExposureSidebar(BaseSidebar):
 
         self.layout.addStretch()
 
+        # Sliders are updated through set_value_quiet and need no blocking
+        self._blocked_widgets = (
+            self.region_combo,
+            self.pick_wb_btn,
+            self.camera_wb_btn,
+        )
+
     def _connect_signals(self) -> None:
         self.region_combo.currentIndexChanged.connect(self.sync_ui)
 
-        self.cyan_slider.valueChanged.connect(self._on_cyan_changed)
-        self.magenta_slider.valueChanged.connect(self._on_magenta_changed)
-        self.yellow_slider.valueChanged.connect(self._on_yellow_changed)
-
-        self.density_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, density=v))
-        self.grade_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, grade=v))
-
-        self.shadows_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, shadows=v))
-        self.highlights_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, highlights=v))
+        # (axis, region index) -> exposure field, region order matches region_combo
+        self._wb_field_map = {
+            (axis, region): field
+            for axis in ("cyan", "magenta", "yellow")
+            for region, field in enumerate((f"wb_{axis}", f"shadow_{axis}", f"highlight_{axis}"))
+        }
+        self.cyan_slider.valueChanged.connect(partial(self._on_wb_changed, "cyan"))
+        self.magenta_slider.valueChanged.connect(partial(self._on_wb_changed, "magenta"))
+        self.yellow_slider.valueChanged.connect(partial(self._on_wb_changed, "yellow"))
+
+        for slider, field in (
+            (self.density_slider, "density"),
+            (self.grade_slider, "grade"),
+            (self.shadows_slider, "shadows"),
+            (self.highlights_slider, "highlights"),
+            (self.toe_slider, "toe"),
+            (self.toe_w_slider, "toe_width"),
+            (self.toe_h_slider, "toe_hardness"),
+            (self.sh_slider, "shoulder"),
+            (self.sh_w_slider, "shoulder_width"),
+            (self.sh_h_slider, "shoulder_hardness"),
+        ):
+            self._bind_slider(slider, field)
 
         self.pick_wb_btn.toggled.connect(self._on_pick_wb_toggled)
         self.camera_wb_btn.toggled.connect(self._on_camera_wb_toggled)
 
-        self.toe_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, toe=v))
-        self.toe_w_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, toe_width=v))
-        self.toe_h_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, toe_hardness=v))
-
-        self.sh_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, shoulder=v))
-        self.sh_w_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, shoulder_width=v))
-        self.sh_h_slider.valueChanged.connect(lambda v: self.update_config_section("exposure", readback_metrics=False, shoulder_hardness=v))
-
-    def _on_cyan_changed(self, v: float) -> None:
-        idx = self.region_combo.currentIndex()
-        if idx == 0:
-            self.update_config_section("exposure", readback_metrics=False, wb_cyan=v)
-        elif idx == 1:
-            self.update_config_section("exposure", readback_metrics=False, shadow_cyan=v)
-        elif idx == 2:
-            self.update_config_section("exposure", readback_metrics=False, highlight_cyan=v)
-
-    def _on_magenta_changed(self, v: float) -> None:
-        idx = self.region_combo.currentIndex()
-        if idx == 0:
-            self.update_config_section("exposure", readback_metrics=False, wb_magenta=v)
-        elif idx == 1:
-            self.update_config_section("exposure", readback_metrics=False, shadow_magenta=v)
-        elif idx == 2:
-            self.update_config_section("exposure", readback_metrics=False, highlight_magenta=v)
-
-    def _on_yellow_changed(self, v: float) -> None:
-        idx = self.region_combo.currentIndex()
-        if idx == 0:
-            self.update_config_section("exposure", readback_metrics=False, wb_yellow=v)
-        elif idx == 1:
-            self.update_config_section("exposure", readback_metrics=False, shadow_yellow=v)
-        elif idx == 2:
-            self.update_config_section("exposure", readback_metrics=False, highlight_yellow=v)
+    def _bind_slider(self, slider: CompactSlider, field: str) -> None:
+        slider.valueChanged.connect(partial(self._set_field, field))
+
+    def _set_field(self, field: str, v: float) -> None:
+        self.update_config_section("exposure", readback_metrics=False, **{field: v})
+
+    def _on_wb_changed(self, axis: str, v: float) -> None:
+        field = self._wb_field_map.get((axis, self.region_combo.currentIndex()))
+        if field:
+            self.update_config_section("exposure", readback_metrics=False, **{field: v})
 
     def _on_pick_wb_toggled(self, checked: bool) -> None:
         self.controller.set_active_tool(ToolMode.WB_PICK if checked else ToolMode.NONE)
@@ -155,62 +153,34 @@ class ExposureSidebar(BaseSidebar):
     def sync_ui(self) -> None:
         conf = self.state.config.exposure
 
-        self.block_signals(True)
-        try:
+        with self.signals_blocked():
             idx = self.region_combo.currentIndex()
             if idx == 0:
-                self.cyan_slider.setValue(conf.wb_cyan)
-                self.magenta_slider.setValue(conf.wb_magenta)
-                self.yellow_slider.setValue(conf.wb_yellow)
+                self.cyan_slider.set_value_quiet(conf.wb_cyan)
+                self.magenta_slider.set_value_quiet(conf.wb_magenta)
+                self.yellow_slider.set_value_quiet(conf.wb_yellow)
             elif idx == 1:
-                self.cyan_slider.setValue(conf.shadow_cyan)
-                self.magenta_slider.setValue(conf.shadow_magenta)
-                self.yellow_slider.setValue(conf.shadow_yellow)
+                self.cyan_slider.set_value_quiet(conf.shadow_cyan)
+                self.magenta_slider.set_value_quiet(conf.shadow_magenta)
+                self.yellow_slider.set_value_quiet(conf.shadow_yellow)
             elif idx == 2:
-                self.cyan_slider.setValue(conf.highlight_cyan)
-                self.magenta_slider.setValue(conf.highlight_magenta)
-                self.yellow_slider.setValue(conf.highlight_yellow)
+                self.cyan_slider.set_value_quiet(conf.highlight_cyan)
+                self.magenta_slider.set_value_quiet(conf.highlight_magenta)
+                self.yellow_slider.set_value_quiet(conf.highlight_yellow)
 
             self.pick_wb_btn.setChecked(self.state.active_tool == ToolMode.WB_PICK)
             self.camera_wb_btn.setChecked(conf.use_camera_wb)
 
-            self.density_slider.setValue(conf.density)
-            self.grade_slider.setValue(conf.grade)
-
-            self.shadows_slider.setValue(conf.shadows)
-            self.highlights_slider.setValue(conf.highlights)
+            self.density_slider.set_value_quiet(conf.density)
+            self.grade_slider.set_value_quiet(conf.grade)
 
-            self.toe_slider.setValue(conf.toe)
-            self.toe_w_slider.setValue(conf.toe_width)
-            self.toe_h_slider.setValue(conf.toe_hardness)
+            self.shadows_slider.set_value_quiet(conf.shadows)
+            self.highlights_slider.set_value_quiet(conf.highlights)
 
-            self.sh_slider.setValue(conf.shoulder)
-            self.sh_w_slider.setValue(conf.shoulder_width)
-            self.sh_h_slider.setValue(conf.shoulder_hardness)
-        finally:
-            self.block_signals(False)
+            self.toe_slider.set_value_quiet(conf.toe)
+            self.toe_w_slider.set_value_quiet(conf.toe_width)
+            self.toe_h_slider.set_value_quiet(conf.toe_hardness)
 
-    def block_signals(self, blocked: bool) -> None:
-        """
-        Helper to block/unblock all sliders and buttons.
-        """
-        widgets = [
-            self.region_combo,
-            self.cyan_slider,
-            self.magenta_slider,
-            self.yellow_slider,
-            self.pick_wb_btn,
-            self.camera_wb_btn,
-            self.density_slider,
-            self.grade_slider,
-            self.shadows_slider,
-            self.highlights_slider,
-            self.toe_slider,
-            self.toe_w_slider,
-            self.toe_h_slider,
-            self.sh_slider,
-            self.sh_w_slider,
-            self.sh_h_slider,
-        ]
-        for w in widgets:
-            w.blockSignals(blocked)
+            self.sh_slider.set_value_quiet(conf.shoulder)
+            self.sh_w_slider.set_value_quiet(conf.shoulder_width)
+            self.sh_h_slider.set_value_quiet(conf.shoulder_hardness)
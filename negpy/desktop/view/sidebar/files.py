@@ -1,4 +1,5 @@
 import os
+from typing import AbstractSet, List, Optional, Tuple
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -8,35 +9,81 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QGroupBox,
 )
-from PyQt6.QtCore import pyqtSignal, QSize, QTimer, QItemSelectionModel, Qt
+from PyQt6.QtCore import (
+    pyqtSignal,
+    pyqtBoundSignal,
+    QSize,
+    QTimer,
+    QItemSelection,
+    QItemSelectionModel,
+    Qt,
+    QRunnable,
+    QThreadPool,
+    QFileSystemWatcher,
+)
 
-import qtawesome as qta
+from negpy.desktop.view.styles.icons import icon
 from negpy.desktop.controller import AppController
 from negpy.desktop.view.styles.theme import THEME
 from negpy.infrastructure.filesystem.watcher import FolderWatchService
 from negpy.infrastructure.loaders.helpers import get_supported_raw_wildcards
 
 
+class _ScanJob(QRunnable):
+    """
+    One-shot hot folder scan executed on the global thread pool.
+    Only lists the directory; results are delivered back through a queued signal.
+    """
+
+    def __init__(self, folder_path: str, existing: AbstractSet[str], done: pyqtBoundSignal):
+        super().__init__()
+        self._folder_path = folder_path
+        self._existing = existing
+        self._done = done
+
+    def run(self) -> None:
+        self._done.emit(FolderWatchService.scan_for_new_files(self._folder_path, self._existing))
+
+
 class FileBrowser(QWidget):
     """
     Asset management panel for loading and selecting images.
     """
 
     file_selected = pyqtSignal(str)
+    _scan_done = pyqtSignal(list)
 
     def __init__(self, controller: AppController):
         super().__init__()
         self.controller = controller
         self.session = controller.session
 
+        # Watcher events are debounced so a burst of copies triggers a single scan
+        self._fs_watcher = QFileSystemWatcher(self)
+        self._fs_watcher.directoryChanged.connect(lambda _: self.scan_timer.start())
+
         self.scan_timer = QTimer(self)
-        self.scan_timer.setInterval(2000)
+        self.scan_timer.setSingleShot(True)
+        self.scan_timer.setInterval(150)
         self.scan_timer.timeout.connect(self._scan_folder)
+        self._scan_in_flight = False
+
+        # Fallback for folders the OS watcher refuses (e.g. some network mounts)
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(2000)
+        self.poll_timer.timeout.connect(self._scan_folder)
 
         self.selection_timer = QTimer(self)
         self.selection_timer.setSingleShot(True)
         self.selection_timer.setInterval(200)
         self.selection_timer.timeout.connect(self._commit_selection)
+        # Sorted snapshot of the session selection, refreshed on every sync_ui
+        self._session_rows: Tuple[int, ...] = ()
+
+        self.visible_timer = QTimer(self)
+        self.visible_timer.setSingleShot(True)
+        self.visible_timer.setInterval(50)
+        self.visible_timer.timeout.connect(self._emit_visible_rows)
 
         self._init_ui()
         self._connect_signals()
@@ -51,11 +98,11 @@ class FileBrowser(QWidget):
 
         btns_row = QHBoxLayout()
         self.add_files_btn = QPushButton(" File")
-        self.add_files_btn.setIcon(qta.icon("fa5s.file-import", color=THEME.text_primary))
+        self.add_files_btn.setIcon(icon("fa5s.file-import", THEME.text_primary))
         self.add_folder_btn = QPushButton(" Folder")
-        self.add_folder_btn.setIcon(qta.icon("fa5s.folder-plus", color=THEME.text_primary))
+        self.add_folder_btn.setIcon(icon("fa5s.folder-plus", THEME.text_primary))
         self.unload_btn = QPushButton(" Clear")
-        self.unload_btn.setIcon(qta.icon("fa5s.times-circle", color=THEME.text_primary))
+        self.unload_btn.setIcon(icon("fa5s.times-circle", THEME.text_primary))
 
         btns_row.addWidget(self.add_files_btn)
         btns_row.addWidget(self.add_folder_btn)
@@ -65,12 +112,14 @@ class FileBrowser(QWidget):
         hot_sync_row = QHBoxLayout()
         self.hot_folder_btn = QPushButton(" Hot Folder Mode")
         self.hot_folder_btn.setCheckable(True)
-        self.hot_folder_btn.setIcon(qta.icon("fa5s.fire", color=THEME.text_primary))
+        self._fire_on = icon("fa5s.fire", "white")
+        self._fire_off = icon("fa5s.fire", THEME.text_primary)
+        self.hot_folder_btn.setIcon(self._fire_off)
         self.hot_folder_btn.setToolTip("Automatically load new images from the current folder")
         self._update_hot_folder_style(False)
 
         self.sync_btn = QPushButton(" Sync Edits")
-        self.sync_btn.setIcon(qta.icon("fa5s.sync", color=THEME.text_primary))
+        self.sync_btn.setIcon(icon("fa5s.sync", THEME.text_primary))
         self.sync_btn.setToolTip("Apply current settings to all selected images (excluding crop/rotation)")
 
         hot_sync_row.addWidget(self.hot_folder_btn)
@@ -87,6 +136,11 @@ class FileBrowser(QWidget):
         self.list_view.setIconSize(QSize(100, 100))
         self.list_view.setGridSize(QSize(120, 130))
         self.list_view.setSpacing(10)
+        # Every cell shares the grid size, so Qt can skip per-item size hints and lay out in batches
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setLayoutMode(QListView.LayoutMode.Batched)
+        self.list_view.setBatchSize(256)
+        self.list_view.setMovement(QListView.Movement.Static)
         self.list_view.setWordWrap(True)
         self.list_view.setAlternatingRowColors(False)
 
@@ -97,18 +151,22 @@ class FileBrowser(QWidget):
         self.add_folder_btn.clicked.connect(self._on_add_folder)
         self.unload_btn.clicked.connect(self.session.clear_files)
         self.list_view.clicked.connect(self._on_item_clicked)
-        self.list_view.selectionModel().selectionChanged.connect(self._on_selection_changed)
-        self.hot_folder_btn.toggled.connect(self._on_hot_folder_toggled)
+        self.list_view.selectionModel().selectionChanged.connect(self._on_selection_changed, Qt.ConnectionType.DirectConnection)
+        self.session.asset_model.layoutChanged.connect(self._watch_hot_folder)
+        self.session.asset_model.layoutChanged.connect(lambda: self.visible_timer.start())
+        self.list_view.verticalScrollBar().valueChanged.connect(lambda _: self.visible_timer.start(), Qt.ConnectionType.DirectConnection)
+        self.hot_folder_btn.toggled.connect(self._on_hot_folder_toggled, Qt.ConnectionType.DirectConnection)
         self.sync_btn.clicked.connect(self.session.sync_selected_settings)
         self.session.state_changed.connect(self.sync_ui)
+        self._scan_done.connect(self._on_scan_done)
 
     def sync_ui(self) -> None:
         """Updates list selection to match session state."""
         selection_model = self.list_view.selectionModel()
-        current_indices = {idx.row() for idx in selection_model.selectedIndexes()}
-        target_indices = set(self.session.state.selected_indices)
+        rows = tuple(sorted(self.session.state.selected_indices))
+        self._session_rows = rows
 
-        if current_indices == target_indices:
+        if tuple(sorted(idx.row() for idx in selection_model.selectedRows())) == rows:
             active_idx = self.session.state.selected_file_idx
             if active_idx >= 0:
                 qt_idx = self.session.asset_model.index(active_idx, 0)
@@ -118,70 +176,157 @@ class FileBrowser(QWidget):
 
         selection_model.blockSignals(True)
         try:
-            selection_model.clearSelection()
-            for idx in self.session.state.selected_indices:
-                qt_idx = self.session.asset_model.index(idx, 0)
-                selection_model.select(qt_idx, QItemSelectionModel.SelectionFlag.Select)
+            model = self.session.asset_model
+            selection = QItemSelection()
+            start = 0
+            # Contiguous rows collapse into a single range
+            for i in range(1, len(rows) + 1):
+                if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                    selection.select(model.index(rows[start], 0), model.index(rows[i - 1], 0))
+                    start = i
+            selection_model.select(selection, QItemSelectionModel.SelectionFlag.ClearAndSelect)
 
             active_idx = self.session.state.selected_file_idx
             if active_idx >= 0:
                 qt_idx = self.session.asset_model.index(active_idx, 0)
                 self.list_view.setCurrentIndex(qt_idx)
-                self.list_view.scrollTo(qt_idx)
+                if not self.list_view.viewport().rect().contains(self.list_view.visualRect(qt_idx)):
+                    self.list_view.scrollTo(qt_idx)
         finally:
             selection_model.blockSignals(False)
 
+    def resizeEvent(self, event) -> None:
+        super().resizeEvent(event)
+        self.visible_timer.start()
+
+    def _visible_row_bounds(self) -> Tuple[int, int]:
+        """
+        Binary searches the first/last rows intersecting the viewport.
+        Rows not laid out yet (batched layout) have an invalid rect and sort after the viewport.
+        """
+        model = self.session.asset_model
+        count = model.rowCount()
+        height = self.list_view.viewport().height()
+
+        lo, hi = 0, count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            rect = self.list_view.visualRect(model.index(mid, 0))
+            if rect.isValid() and rect.bottom() < 0:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+
+        hi = count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            rect = self.list_view.visualRect(model.index(mid, 0))
+            if rect.isValid() and rect.top() <= height:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo - 1
+
+    def _emit_visible_rows(self) -> None:
+        # A few rows of slack either side so short scrolls find thumbnails ready
+        first, last = self._visible_row_bounds()
+        self.session.asset_model.set_visible_range(max(0, first - 20), max(first, last) + 20)
+
     def _on_selection_changed(self, selected, deselected) -> None:
         self.selection_timer.start()
 
     def _commit_selection(self) -> None:
         """Sends current UI selection to the session after debounce."""
-        indices = [idx.row() for idx in self.list_view.selectionModel().selectedIndexes()]
-        if set(indices) != set(self.session.state.selected_indices):
-            self.session.update_selection(indices)
+        rows = tuple(sorted(idx.row() for idx in self.list_view.selectionModel().selectedRows()))
+        if rows != self._session_rows:
+            self.session.update_selection(list(rows))
 
     def _on_hot_folder_toggled(self, checked: bool) -> None:
         self._update_hot_folder_style(checked)
         if checked:
+            self._watch_hot_folder()
             self.scan_timer.start()
         else:
             self.scan_timer.stop()
+            self.poll_timer.stop()
+            watched = self._fs_watcher.directories()
+            if watched:
+                self._fs_watcher.removePaths(watched)
+
+    def _hot_folder_path(self) -> Optional[str]:
+        if not self.session.state.uploaded_files:
+            return None
+        return os.path.dirname(self.session.state.uploaded_files[-1]["path"])
+
+    def _watch_hot_folder(self) -> None:
+        """
+        Points the watcher at the folder of the newest file, polling when it cannot be watched.
+        """
+        if not self.hot_folder_btn.isChecked():
+            return
+        folder = self._hot_folder_path()
+        watched = self._fs_watcher.directories()
+        if folder is not None and watched == [folder]:
+            return
+        if watched:
+            self._fs_watcher.removePaths(watched)
+        if folder is not None and self._fs_watcher.addPath(folder):
+            self.poll_timer.stop()
+        else:
+            self.poll_timer.start()
 
     def _update_hot_folder_style(self, checked: bool) -> None:
         if checked:
             self.hot_folder_btn.setStyleSheet(f"background-color: {THEME.accent_primary}; color: white; font-weight: bold;")
-            self.hot_folder_btn.setIcon(qta.icon("fa5s.fire", color="white"))
+            self.hot_folder_btn.setIcon(self._fire_on)
         else:
             self.hot_folder_btn.setStyleSheet("")
-            self.hot_folder_btn.setIcon(qta.icon("fa5s.fire", color=THEME.text_primary))
+            self.hot_folder_btn.setIcon(self._fire_off)
 
     def _scan_folder(self) -> None:
-        if not self.session.state.uploaded_files:
+        if self._scan_in_flight:
+            # Retry once the running job has finished so no change event is lost
+            self.scan_timer.start()
+            return
+        folder_path = self._hot_folder_path()
+        if folder_path is None:
             return
 
-        last_file = self.session.state.uploaded_files[-1]
-        folder_path = os.path.dirname(last_file["path"])
-        existing = {f["path"] for f in self.session.state.uploaded_files}
+        # Live set: the job only does membership tests and mutation stays on the GUI thread
+        self._scan_in_flight = True
+        QThreadPool.globalInstance().start(_ScanJob(folder_path, self.session.uploaded_paths, self._scan_done))
 
-        new_files = FolderWatchService.scan_for_new_files(folder_path, existing)
-        if new_files:
+    def _on_scan_done(self, new_files: List[str]) -> None:
+        self._scan_in_flight = False
+        if new_files and self.hot_folder_btn.isChecked():
             self.controller.request_asset_discovery(new_files)
 
     def _on_add_files(self) -> None:
         wildcards = get_supported_raw_wildcards()
-        files, _ = QFileDialog.getOpenFileNames(
-            self,
-            "Select Images",
-            "",
-            f"Supported Images ({wildcards})",
-        )
-        if files:
-            self.controller.request_asset_discovery(files)
+        dialog = QFileDialog(self, "Select Images")
+        dialog.setFileMode(QFileDialog.FileMode.ExistingFiles)
+        dialog.setNameFilter(f"Supported Images ({wildcards})")
+        self._open_dialog(dialog)
 
     def _on_add_folder(self) -> None:
-        folder = QFileDialog.getExistingDirectory(self, "Select Folder")
-        if folder:
-            self.controller.request_asset_discovery([folder])
+        dialog = QFileDialog(self, "Select Folder")
+        dialog.setFileMode(QFileDialog.FileMode.Directory)
+        dialog.setOption(QFileDialog.Option.ShowDirsOnly, True)
+        self._open_dialog(dialog)
+
+    def _open_dialog(self, dialog: QFileDialog) -> None:
+        """
+        Shows the dialog window-modal via open() so the event loop keeps running while
+        slow (e.g. network) directories are enumerated. The dialog is parented to self.
+        """
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.filesSelected.connect(self._on_paths_selected)
+        dialog.open()
+
+    def _on_paths_selected(self, paths: List[str]) -> None:
+        if paths:
+            self.controller.request_asset_discovery(paths)
 
     def _on_item_clicked(self, index) -> None:
         from PyQt6.QtWidgets import QApplication
@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QHBoxLayout,
 )
-import qtawesome as qta
+from negpy.desktop.view.styles.icons import icon
 from negpy.desktop.view.widgets.sliders import CompactSlider
 from negpy.desktop.view.styles.theme import THEME
 from negpy.desktop.view.sidebar.base import BaseSidebar
@@ -32,10 +32,10 @@ class GeometrySidebar(BaseSidebar):
         btn_row = QHBoxLayout()
         self.manual_crop_btn = QPushButton(" Manual")
         self.manual_crop_btn.setCheckable(True)
-        self.manual_crop_btn.setIcon(qta.icon("fa5s.crop-alt", color=THEME.text_primary))
+        self.manual_crop_btn.setIcon(icon("fa5s.crop-alt", THEME.text_primary))
 
         self.reset_crop_btn = QPushButton(" Auto")
-        self.reset_crop_btn.setIcon(qta.icon("fa5s.magic", color=THEME.text_primary))
+        self.reset_crop_btn.setIcon(icon("fa5s.magic", THEME.text_primary))
         btn_row.addWidget(self.manual_crop_btn)
         btn_row.addWidget(self.reset_crop_btn)
         self.layout.addLayout(btn_row)
@@ -55,6 +55,8 @@ class GeometrySidebar(BaseSidebar):
         slider_row.addWidget(self.fine_rot_slider)
         self.layout.addLayout(slider_row)
 
+        self._blocked_widgets = (self.ratio_combo, self.offset_slider, self.fine_rot_slider, self.manual_crop_btn)
+
     def _connect_signals(self) -> None:
         self.ratio_combo.currentTextChanged.connect(lambda t: self.update_config_section("geometry", autocrop_ratio=t))
         self.manual_crop_btn.toggled.connect(self._on_manual_crop_toggled)
@@ -71,19 +73,10 @@ class GeometrySidebar(BaseSidebar):
     def sync_ui(self) -> None:
         conf = self.state.config.geometry
 
-        self.block_signals(True)
-        try:
+        with self.signals_blocked():
             self.ratio_combo.setCurrentText(conf.autocrop_ratio)
 
             self.offset_slider.setValue(float(conf.autocrop_offset))
             self.fine_rot_slider.setValue(conf.fine_rotation)
 
             self.manual_crop_btn.setChecked(self.state.active_tool == ToolMode.CROP_MANUAL)
-        finally:
-            self.block_signals(False)
-
-    def block_signals(self, blocked: bool) -> None:
-        self.ratio_combo.blockSignals(blocked)
-        self.offset_slider.blockSignals(blocked)
-        self.fine_rot_slider.blockSignals(blocked)
-        self.manual_crop_btn.blockSignals(blocked)
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -14,6 +15,24 @@ from negpy.kernel.system.paths import get_resource_path
 from negpy.kernel.system.version import get_app_version
 from negpy.infrastructure.gpu.device import GPUDevice
 
+_APP_VERSION = get_app_version()
+
+
+@lru_cache(maxsize=1)
+def _app_icon_pixmap() -> QPixmap:
+    """
+    Loads and scales the app logo once; needs a QApplication, so it cannot run at import.
+    """
+    pix = QPixmap(get_resource_path("media/icons/icon.png"))
+    if pix.isNull():
+        return pix
+    return pix.scaled(
+        32,
+        32,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        Qt.TransformationMode.SmoothTransformation,
+    )
+
 
 class SidebarHeader(QWidget):
     """
@@ -35,16 +54,9 @@ class SidebarHeader(QWidget):
         header.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         icon_label = QLabel()
-        icon_pix = QPixmap(get_resource_path("media/icons/icon.png"))
+        icon_pix = _app_icon_pixmap()
         if not icon_pix.isNull():
-            icon_label.setPixmap(
-                icon_pix.scaled(
-                    32,
-                    32,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-            )
+            icon_label.setPixmap(icon_pix)
 
         name_label = QLabel("NegPy")
         name_label.setStyleSheet(f"font-size: 24px; font-weight: bold; color: {THEME.text_primary}; margin-left: 5px;")
@@ -53,7 +65,7 @@ class SidebarHeader(QWidget):
         header.addWidget(name_label)
         layout.addLayout(header)
 
-        self.ver_label = QLabel(f"v{get_app_version()}")
+        self.ver_label = QLabel(f"v{_APP_VERSION}")
         self.ver_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.ver_label.setStyleSheet(f"font-size: 14px; color: {THEME.text_secondary}; font-weight: bold;")
         layout.addWidget(self.ver_label)
@@ -53,6 +53,8 @@ class ICCSidebar(BaseSidebar):
 
         self.layout.addStretch()
 
+        self._blocked_widgets = (self.profile_combo, self.radio_input, self.radio_output, self.apply_export_check)
+
     def _connect_signals(self) -> None:
         self.profile_combo.currentIndexChanged.connect(self._on_profile_changed)
         self.radio_input.toggled.connect(self._on_mode_changed)
@@ -72,8 +74,7 @@ class ICCSidebar(BaseSidebar):
         self.controller.request_render()
 
     def sync_ui(self) -> None:
-        self.block_signals(True)
-        try:
+        with self.signals_blocked():
             path = self.state.icc_profile_path
             if path:
                 self.profile_combo.setCurrentText(os.path.basename(path))
@@ -86,11 +87,3 @@ class ICCSidebar(BaseSidebar):
                 self.radio_output.setChecked(True)
 
             self.apply_export_check.setChecked(self.state.apply_icc_to_export)
-        finally:
-            self.block_signals(False)
-
-    def block_signals(self, blocked: bool) -> None:
-        self.profile_combo.blockSignals(blocked)
-        self.radio_input.blockSignals(blocked)
-        self.radio_output.blockSignals(blocked)
-        self.apply_export_check.blockSignals(blocked)
@@ -1,6 +1,10 @@
+from functools import partial
+from typing import Optional
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QHBoxLayout
 from negpy.desktop.view.widgets.sliders import CompactSlider
 from negpy.desktop.view.sidebar.base import BaseSidebar
+from negpy.features.lab.models import LabConfig
 from negpy.features.process.models import ProcessMode
 
 
@@ -12,6 +16,8 @@ class LabSidebar(BaseSidebar):
     def _init_ui(self) -> None:
         self.layout.setSpacing(12)
         conf = self.state.config.lab
+        self._synced_conf: Optional[LabConfig] = None
+        self._synced_bw = False
 
         row1 = QHBoxLayout()
         self.separation_slider = CompactSlider("Separation", 1.0, 2.0, conf.color_separation)
@@ -36,22 +42,38 @@ class LabSidebar(BaseSidebar):
 
         self.layout.addStretch()
 
-    def _connect_signals(self) -> None:
-        self.clahe_slider.valueChanged.connect(lambda v: self.update_config_section("lab", readback_metrics=False, clahe_strength=v))
-        self.sharpen_slider.valueChanged.connect(lambda v: self.update_config_section("lab", readback_metrics=False, sharpen=v))
-        self.saturation_slider.valueChanged.connect(lambda v: self.update_config_section("lab", readback_metrics=False, saturation=v))
-        self.vibrance_slider.valueChanged.connect(lambda v: self.update_config_section("lab", readback_metrics=False, vibrance=v))
-        self.separation_slider.valueChanged.connect(lambda v: self.update_config_section("lab", readback_metrics=False, color_separation=v))
-        self.chroma_denoise_slider.valueChanged.connect(
-            lambda v: self.update_config_section("lab", readback_metrics=False, chroma_denoise=v)
+        self._blocked_widgets = (
+            self.clahe_slider,
+            self.sharpen_slider,
+            self.saturation_slider,
+            self.vibrance_slider,
+            self.separation_slider,
+            self.chroma_denoise_slider,
         )
 
+    def _connect_signals(self) -> None:
+        for slider, field in (
+            (self.clahe_slider, "clahe_strength"),
+            (self.sharpen_slider, "sharpen"),
+            (self.saturation_slider, "saturation"),
+            (self.vibrance_slider, "vibrance"),
+            (self.separation_slider, "color_separation"),
+            (self.chroma_denoise_slider, "chroma_denoise"),
+        ):
+            slider.valueChanged.connect(partial(self._set_field, field), Qt.ConnectionType.DirectConnection)
+
+    def _set_field(self, field: str, v: float) -> None:
+        self.queue_config_section("lab", readback_metrics=False, **{field: v})
+
     def sync_ui(self) -> None:
         conf = self.state.config.lab
         is_bw = self.state.config.process.process_mode == ProcessMode.BW
+        # Config sections are frozen, so an unchanged object means nothing to push
+        if conf is self._synced_conf and is_bw == self._synced_bw:
+            return
+        self._synced_conf, self._synced_bw = conf, is_bw
 
-        self.block_signals(True)
-        try:
+        with self.signals_blocked():
             self.clahe_slider.setValue(conf.clahe_strength)
             self.sharpen_slider.setValue(conf.sharpen)
             self.saturation_slider.setValue(conf.saturation)
@@ -63,17 +85,3 @@ class LabSidebar(BaseSidebar):
             self.saturation_slider.setEnabled(not is_bw)
             self.vibrance_slider.setEnabled(not is_bw)
             self.chroma_denoise_slider.setEnabled(not is_bw)
-        finally:
-            self.block_signals(False)
-
-    def block_signals(self, blocked: bool) -> None:
-        widgets = [
-            self.clahe_slider,
-            self.sharpen_slider,
-            self.saturation_slider,
-            self.vibrance_slider,
-            self.separation_slider,
-            self.chroma_denoise_slider,
-        ]
-        for w in widgets:
-            w.blockSignals(blocked)
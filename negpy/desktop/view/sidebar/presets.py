@@ -4,7 +4,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLineEdit,
 )
-import qtawesome as qta
+from negpy.desktop.view.styles.icons import icon
 from negpy.desktop.view.sidebar.base import BaseSidebar
 from negpy.services.assets.presets import Presets
 from negpy.domain.models import WorkspaceConfig
@@ -23,7 +23,7 @@ class PresetsSidebar(BaseSidebar):
         self._refresh_presets()
 
         self.load_btn = QPushButton(" Load")
-        self.load_btn.setIcon(qta.icon("fa5s.upload", color=THEME.text_primary))
+        self.load_btn.setIcon(icon("fa5s.upload", THEME.text_primary))
 
         row_load.addWidget(self.preset_combo, stretch=1)
         row_load.addWidget(self.load_btn)
@@ -34,7 +34,7 @@ class PresetsSidebar(BaseSidebar):
         self.name_input = QLineEdit()
         self.name_input.setPlaceholderText("New Preset Name")
         self.save_btn = QPushButton(" Save")
-        self.save_btn.setIcon(qta.icon("fa5s.save", color=THEME.text_primary))
+        self.save_btn.setIcon(icon("fa5s.save", THEME.text_primary))
 
         row_save.addWidget(self.name_input, stretch=1)
         row_save.addWidget(self.save_btn)
@@ -1,14 +1,16 @@
+from typing import Dict, List, Optional
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import (
     QPushButton,
     QComboBox,
     QHBoxLayout,
     QInputDialog,
 )
-import qtawesome as qta
+from negpy.desktop.view.styles.icons import icon
 from negpy.desktop.view.widgets.sliders import CompactSlider
 from negpy.desktop.view.styles.theme import THEME
 from negpy.desktop.view.sidebar.base import BaseSidebar
-from negpy.features.process.models import ProcessMode
+from negpy.features.process.models import ProcessConfig, ProcessMode
 
 
 class ProcessSidebar(BaseSidebar):
@@ -19,10 +21,12 @@ class ProcessSidebar(BaseSidebar):
     def _init_ui(self) -> None:
         self.layout.setSpacing(12)
         conf = self.state.config.process
+        self._synced_conf: Optional[ProcessConfig] = None
 
         self.mode_combo = QComboBox()
         self.mode_combo.addItems([m.value for m in ProcessMode])
-        self.mode_combo.setCurrentText(conf.process_mode)
+        self._mode_index: Dict[str, int] = {m.value: i for i, m in enumerate(ProcessMode)}
+        self.mode_combo.setCurrentIndex(self._mode_index.get(conf.process_mode, -1))
         self.layout.addWidget(self.mode_combo)
 
         sliders_row = QHBoxLayout()
@@ -43,7 +47,7 @@ class ProcessSidebar(BaseSidebar):
         self.normalize_e6_btn = QPushButton(" Normalize")
         self.normalize_e6_btn.setFixedHeight(35)
         self.normalize_e6_btn.setCheckable(True)
-        self.normalize_e6_btn.setIcon(qta.icon("fa5s.magic", color=THEME.text_primary))
+        self.normalize_e6_btn.setIcon(icon("fa5s.magic", THEME.text_primary))
         self.normalize_e6_btn.setChecked(conf.e6_normalize)
         self.normalize_e6_btn.setToolTip("Automatically stretch the histogram to full dynamic range")
         self.layout.addWidget(self.normalize_e6_btn)
@@ -51,12 +55,12 @@ class ProcessSidebar(BaseSidebar):
         btns_row = QHBoxLayout()
         self.analyze_roll_btn = QPushButton(" Batch Analysis")
         self.analyze_roll_btn.setFixedHeight(35)
-        self.analyze_roll_btn.setIcon(qta.icon("fa5s.search", color=THEME.text_primary))
+        self.analyze_roll_btn.setIcon(icon("fa5s.search", THEME.text_primary))
 
         self.use_roll_avg_btn = QPushButton(" Use Roll Average")
         self.use_roll_avg_btn.setFixedHeight(35)
         self.use_roll_avg_btn.setCheckable(True)
-        self.use_roll_avg_btn.setIcon(qta.icon("mdi6.film", color=THEME.text_primary))
+        self.use_roll_avg_btn.setIcon(icon("mdi6.film", THEME.text_primary))
 
         btns_row.addWidget(self.analyze_roll_btn)
         btns_row.addWidget(self.use_roll_avg_btn)
@@ -64,18 +68,21 @@ class ProcessSidebar(BaseSidebar):
 
         self.roll_combo = QComboBox()
         self.roll_combo.setPlaceholderText("Select Roll...")
+        self._rolls_cache: List[str] = []
+        self._roll_index: Dict[str, int] = {}
+        self._rolls_dirty = True
         self._refresh_rolls()
         self.layout.addWidget(self.roll_combo)
 
         roll_actions = QHBoxLayout()
         self.load_roll_btn = QPushButton(" Load")
-        self.load_roll_btn.setIcon(qta.icon("fa5s.upload", color=THEME.text_primary))
+        self.load_roll_btn.setIcon(icon("fa5s.upload", THEME.text_primary))
 
         self.save_roll_btn = QPushButton(" Save")
-        self.save_roll_btn.setIcon(qta.icon("fa5s.save", color=THEME.text_primary))
+        self.save_roll_btn.setIcon(icon("fa5s.save", THEME.text_primary))
 
         self.delete_roll_btn = QPushButton(" Delete")
-        self.delete_roll_btn.setIcon(qta.icon("fa5s.trash", color=THEME.text_primary))
+        self.delete_roll_btn.setIcon(icon("fa5s.trash", THEME.text_primary))
 
         roll_actions.addWidget(self.load_roll_btn)
         roll_actions.addWidget(self.save_roll_btn)
@@ -84,28 +91,43 @@ class ProcessSidebar(BaseSidebar):
 
         self.layout.addStretch()
 
+        self._blocked_widgets = (
+            self.mode_combo,
+            self.analysis_buffer_slider,
+            self.shadow_cast_strength_slider,
+            self.white_point_slider,
+            self.black_point_slider,
+            self.normalize_e6_btn,
+            self.analyze_roll_btn,
+            self.use_roll_avg_btn,
+            self.roll_combo,
+            self.load_roll_btn,
+            self.save_roll_btn,
+            self.delete_roll_btn,
+        )
+
     def _connect_signals(self) -> None:
         self.mode_combo.currentTextChanged.connect(self._on_mode_changed)
-        self.analysis_buffer_slider.valueChanged.connect(self._on_buffer_changed)
-        self.shadow_cast_strength_slider.valueChanged.connect(self._on_shadow_cast_strength_changed)
-        self.white_point_slider.valueChanged.connect(self._on_white_point_changed)
-        self.black_point_slider.valueChanged.connect(self._on_black_point_changed)
-        self.normalize_e6_btn.toggled.connect(self._on_normalize_e6_toggled)
+        self.analysis_buffer_slider.valueChanged.connect(self._on_buffer_changed, Qt.ConnectionType.DirectConnection)
+        self.shadow_cast_strength_slider.valueChanged.connect(self._on_shadow_cast_strength_changed, Qt.ConnectionType.DirectConnection)
+        self.white_point_slider.valueChanged.connect(self._on_white_point_changed, Qt.ConnectionType.DirectConnection)
+        self.black_point_slider.valueChanged.connect(self._on_black_point_changed, Qt.ConnectionType.DirectConnection)
+        self.normalize_e6_btn.toggled.connect(self._on_normalize_e6_toggled, Qt.ConnectionType.DirectConnection)
         self.analyze_roll_btn.clicked.connect(self.controller.request_batch_normalization)
-        self.use_roll_avg_btn.toggled.connect(self._on_use_roll_average_toggled)
+        self.use_roll_avg_btn.toggled.connect(self._on_use_roll_average_toggled, Qt.ConnectionType.DirectConnection)
 
         self.load_roll_btn.clicked.connect(self._on_load_roll)
         self.save_roll_btn.clicked.connect(self._on_save_roll)
         self.delete_roll_btn.clicked.connect(self._on_delete_roll)
 
     def _on_shadow_cast_strength_changed(self, val: float) -> None:
-        self.update_config_section("process", shadow_cast_strength=val, persist=True)
+        self.queue_config_section("process", shadow_cast_strength=val, persist=True)
 
     def _on_white_point_changed(self, val: float) -> None:
-        self.update_config_section("process", white_point_offset=val, persist=True)
+        self.queue_config_section("process", white_point_offset=val, persist=True)
 
     def _on_black_point_changed(self, val: float) -> None:
-        self.update_config_section("process", black_point_offset=val, persist=True)
+        self.queue_config_section("process", black_point_offset=val, persist=True)
 
     def _on_mode_changed(self, mode: str) -> None:
         self.update_config_section("process", process_mode=mode, persist=True)
@@ -118,7 +140,7 @@ class ProcessSidebar(BaseSidebar):
         """
         Updates analysis buffer and forces local re-analysis.
         """
-        self.update_config_section(
+        self.queue_config_section(
             "process",
             persist=True,
             render=True,
@@ -148,16 +170,21 @@ class ProcessSidebar(BaseSidebar):
     def _refresh_rolls(self) -> None:
         """
         Populates roll dropdown from database.
+        Only re-queries after a save/delete marked the cached list dirty.
         """
+        if self._rolls_dirty:
+            self._rolls_cache = self.controller.session.repo.list_normalization_rolls()
+            self._rolls_dirty = False
+        rolls = self._rolls_cache
+        if rolls == [self.roll_combo.itemText(i) for i in range(self.roll_combo.count())]:
+            return
+
         current = self.roll_combo.currentText()
+        self._roll_index = {name: i for i, name in enumerate(rolls)}
         self.roll_combo.blockSignals(True)
         self.roll_combo.clear()
-        rolls = self.controller.session.repo.list_normalization_rolls()
         self.roll_combo.addItems(rolls)
-        if current in rolls:
-            self.roll_combo.setCurrentText(current)
-        else:
-            self.roll_combo.setCurrentIndex(-1)
+        self.roll_combo.setCurrentIndex(self._roll_index.get(current, -1))
         self.roll_combo.blockSignals(False)
 
     def _on_load_roll(self) -> None:
@@ -174,9 +201,10 @@ class ProcessSidebar(BaseSidebar):
         """
         name, ok = QInputDialog.getText(self, "Save Roll", "Enter name for this roll:")
         if ok and name:
+            self._rolls_dirty = True
             self.controller.save_current_normalization_as_roll(name)
             self._refresh_rolls()
-            self.roll_combo.setCurrentText(name)
+            self.roll_combo.setCurrentIndex(self._roll_index.get(name, -1))
 
     def _on_delete_roll(self) -> None:
         """
@@ -185,13 +213,17 @@ class ProcessSidebar(BaseSidebar):
         name = self.roll_combo.currentText()
         if name:
             self.controller.session.repo.delete_normalization_roll(name)
+            self._rolls_dirty = True
             self._refresh_rolls()
 
     def sync_ui(self) -> None:
         conf = self.state.config.process
-        self.block_signals(True)
-        try:
-            self.mode_combo.setCurrentText(conf.process_mode)
+        if conf is self._synced_conf:
+            return
+        self._synced_conf = conf
+
+        with self.signals_blocked():
+            self.mode_combo.setCurrentIndex(self._mode_index.get(conf.process_mode, -1))
             self.analysis_buffer_slider.setValue(conf.analysis_buffer)
             self.shadow_cast_strength_slider.setValue(conf.shadow_cast_strength)
             self.white_point_slider.setValue(conf.white_point_offset)
@@ -204,27 +236,4 @@ class ProcessSidebar(BaseSidebar):
             self.use_roll_avg_btn.setChecked(conf.use_roll_average)
             self._refresh_rolls()
             if conf.roll_name:
-                self.roll_combo.setCurrentText(conf.roll_name)
-        finally:
-            self.block_signals(False)
-
-    def block_signals(self, blocked: bool) -> None:
-        """
-        Helper to block/unblock all sliders and buttons.
-        """
-        widgets = [
-            self.mode_combo,
-            self.analysis_buffer_slider,
-            self.shadow_cast_strength_slider,
-            self.white_point_slider,
-            self.black_point_slider,
-            self.normalize_e6_btn,
-            self.analyze_roll_btn,
-            self.use_roll_avg_btn,
-            self.roll_combo,
-            self.load_roll_btn,
-            self.save_roll_btn,
-            self.delete_roll_btn,
-        ]
-        for w in widgets:
-            w.blockSignals(blocked)
+                self.roll_combo.setCurrentIndex(self._roll_index.get(conf.roll_name, -1))
@@ -1,9 +1,12 @@
+from typing import Optional
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QPushButton, QHBoxLayout
-import qtawesome as qta
+from negpy.desktop.view.styles.icons import icon
 from negpy.desktop.view.widgets.sliders import CompactSlider
 from negpy.desktop.view.sidebar.base import BaseSidebar
 from negpy.desktop.session import ToolMode
 from negpy.desktop.view.styles.theme import THEME
+from negpy.features.retouch.models import RetouchConfig
 
 
 class RetouchSidebar(BaseSidebar):
@@ -14,6 +17,8 @@ class RetouchSidebar(BaseSidebar):
     def _init_ui(self) -> None:
         self.layout.setSpacing(10)
         conf = self.state.config.retouch
+        self._synced_conf: Optional[RetouchConfig] = None
+        self._synced_tool: Optional[ToolMode] = None
 
         auto_row = QHBoxLayout()
         self.threshold_slider = CompactSlider("Threshold", 0.01, 1.0, conf.dust_threshold)
@@ -26,11 +31,11 @@ class RetouchSidebar(BaseSidebar):
         self.auto_dust_btn = QPushButton(" Auto Dust")
         self.auto_dust_btn.setCheckable(True)
         self.auto_dust_btn.setChecked(conf.dust_remove)
-        self.auto_dust_btn.setIcon(qta.icon("fa5s.magic", color=THEME.text_primary))
+        self.auto_dust_btn.setIcon(icon("fa5s.magic", THEME.text_primary))
 
         self.pick_dust_btn = QPushButton(" Heal Tool")
         self.pick_dust_btn.setCheckable(True)
-        self.pick_dust_btn.setIcon(qta.icon("fa5s.eye-dropper", color=THEME.text_primary))
+        self.pick_dust_btn.setIcon(icon("fa5s.eye-dropper", THEME.text_primary))
 
         buttons_row.addWidget(self.auto_dust_btn)
         buttons_row.addWidget(self.pick_dust_btn)
@@ -41,10 +46,10 @@ class RetouchSidebar(BaseSidebar):
 
         actions_row = QHBoxLayout()
         self.undo_btn = QPushButton(" Undo Last")
-        self.undo_btn.setIcon(qta.icon("fa5s.undo", color=THEME.text_primary))
+        self.undo_btn.setIcon(icon("fa5s.undo", THEME.text_primary))
 
         self.clear_btn = QPushButton(" Clear All")
-        self.clear_btn.setIcon(qta.icon("fa5s.trash-alt", color=THEME.text_primary))
+        self.clear_btn.setIcon(icon("fa5s.trash-alt", THEME.text_primary))
 
         actions_row.addWidget(self.undo_btn)
         actions_row.addWidget(self.clear_btn)
@@ -52,47 +57,52 @@ class RetouchSidebar(BaseSidebar):
 
         self.layout.addStretch()
 
-    def _connect_signals(self) -> None:
-        self.auto_dust_btn.toggled.connect(lambda c: self.update_config_section("retouch", dust_remove=c))
-        self.threshold_slider.valueChanged.connect(
-            lambda v: self.update_config_section("retouch", readback_metrics=False, dust_threshold=v)
-        )
-        self.auto_size_slider.valueChanged.connect(
-            lambda v: self.update_config_section("retouch", readback_metrics=False, dust_size=int(v))
+        self._blocked_widgets = (
+            self.auto_dust_btn,
+            self.threshold_slider,
+            self.auto_size_slider,
+            self.manual_size_slider,
+            self.pick_dust_btn,
         )
-        self.pick_dust_btn.toggled.connect(self._on_pick_toggled)
-        self.manual_size_slider.valueChanged.connect(
-            lambda v: self.update_config_section("retouch", render=False, persist=True, manual_dust_size=int(v))
+
+    def _connect_signals(self) -> None:
+        self.auto_dust_btn.toggled.connect(
+            lambda c: self.update_config_section("retouch", dust_remove=c), Qt.ConnectionType.DirectConnection
         )
+        self.threshold_slider.valueChanged.connect(self._on_threshold_changed, Qt.ConnectionType.DirectConnection)
+        self.auto_size_slider.valueChanged.connect(self._on_auto_size_changed, Qt.ConnectionType.DirectConnection)
+        self.pick_dust_btn.toggled.connect(self._on_pick_toggled, Qt.ConnectionType.DirectConnection)
+        self.manual_size_slider.valueChanged.connect(self._on_manual_size_changed, Qt.ConnectionType.DirectConnection)
         self.undo_btn.clicked.connect(self.controller.undo_last_retouch)
         self.clear_btn.clicked.connect(self.controller.clear_retouch)
 
+    def _on_threshold_changed(self, v: float) -> None:
+        self.queue_config_section("retouch", readback_metrics=False, dust_threshold=v)
+
+    def _on_auto_size_changed(self, v: float) -> None:
+        self.queue_config_section("retouch", readback_metrics=False, dust_size=int(v))
+
+    def _on_manual_size_changed(self, v: float) -> None:
+        self.queue_config_section("retouch", render=False, persist=True, manual_dust_size=int(v))
+
     def _on_pick_toggled(self, checked: bool) -> None:
         self.controller.set_active_tool(ToolMode.DUST_PICK if checked else ToolMode.NONE)
 
     def sync_ui(self) -> None:
         conf = self.state.config.retouch
-        self.block_signals(True)
-        try:
+        tool = self.state.active_tool
+        # Skip when neither the section nor the active tool moved
+        if conf is self._synced_conf and tool == self._synced_tool:
+            return
+        self._synced_conf, self._synced_tool = conf, tool
+
+        with self.signals_blocked():
             self.auto_dust_btn.setChecked(conf.dust_remove)
             self.threshold_slider.setValue(conf.dust_threshold)
             self.auto_size_slider.setValue(float(conf.dust_size))
             self.manual_size_slider.setValue(float(conf.manual_dust_size))
-            self.pick_dust_btn.setChecked(self.state.active_tool == ToolMode.DUST_PICK)
+            self.pick_dust_btn.setChecked(tool == ToolMode.DUST_PICK)
 
             has_spots = len(conf.manual_dust_spots) > 0
             self.undo_btn.setEnabled(has_spots)
             self.clear_btn.setEnabled(has_spots)
-        finally:
-            self.block_signals(False)
-
-    def block_signals(self, blocked: bool) -> None:
-        widgets = [
-            self.auto_dust_btn,
-            self.threshold_slider,
-            self.auto_size_slider,
-            self.manual_size_slider,
-            self.pick_dust_btn,
-        ]
-        for w in widgets:
-            w.blockSignals(blocked)
@@ -9,9 +9,9 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QScrollArea,
 )
-from typing import Dict, Any
-from PyQt6.QtCore import pyqtSignal, Qt, QThread
-import qtawesome as qta
+from typing import Dict, Any, Optional
+from PyQt6.QtCore import pyqtBoundSignal, pyqtSignal, Qt, QRunnable, QThreadPool
+from negpy.desktop.view.styles.icons import icon
 from negpy.desktop.view.styles.theme import THEME
 from negpy.desktop.controller import AppController
 from negpy.desktop.view.widgets.charts import HistogramWidget, PhotometricCurveWidget
@@ -20,16 +20,40 @@ from negpy.desktop.view.sidebar.files import FileBrowser
 from negpy.desktop.view.sidebar.export import ExportSidebar
 from negpy.kernel.system.version import check_for_updates
 
+_TAB_BUTTON_STYLE = f"""
+    QPushButton {{
+        text-align: center;
+        font-weight: bold;
+        font-size: {THEME.font_size_header}px;
+        background-color: #0D0D0D;
+        border: none;
+        border-bottom: 1px solid #262626;
+        border-right: 1px solid #262626;
+        color: #A0A0A0;
+    }}
+    QPushButton:hover {{
+        background-color: #262626;
+        color: #FFFFFF;
+    }}
+    QPushButton:checked {{
+        background-color: #222222;
+        color: #FFFFFF;
+        border-bottom: none;
+    }}
+"""
+
+
+class _UpdateCheckJob(QRunnable):
+    """One-shot release check executed on the global thread pool."""
+
+    def __init__(self, found: pyqtBoundSignal):
+        super().__init__()
+        self._found = found
 
-class UpdateCheckWorker(QThread):
-    """Background worker to check for new releases."""
-
-    finished = pyqtSignal(str)
-
-    def run(self):
+    def run(self) -> None:
         new_ver = check_for_updates()
         if new_ver:
-            self.finished.emit(new_ver)
+            self._found.emit(new_ver)
 
 
 class SessionPanel(QWidget):
@@ -37,6 +61,8 @@ class SessionPanel(QWidget):
     Left sidebar panel containing file browser, update check, and analysis/export tabs.
     """
 
+    _update_found = pyqtSignal(str)
+
     def __init__(self, controller: AppController):
         super().__init__()
         self.controller = controller
@@ -58,9 +84,8 @@ class SessionPanel(QWidget):
         self.header = SidebarHeader(self.controller)
         layout.addWidget(self.header)
 
-        self.update_worker = UpdateCheckWorker()
-        self.update_worker.finished.connect(self._on_update_found)
-        self.update_worker.start()
+        self._update_found.connect(self._on_update_found)
+        QThreadPool.globalInstance().start(_UpdateCheckJob(self._update_found))
 
         self.splitter = QSplitter(Qt.Orientation.Vertical)
 
@@ -78,34 +103,14 @@ class SessionPanel(QWidget):
         switcher_layout.setSpacing(0)
 
         self.btn_tab_analysis = QPushButton(" Analysis")
-        self.btn_tab_analysis.setIcon(qta.icon("fa5s.chart-bar", color=THEME.text_secondary))
+        self.btn_tab_analysis.setIcon(icon("fa5s.chart-bar", THEME.text_secondary))
         self.btn_tab_export = QPushButton(" Export")
-        self.btn_tab_export.setIcon(qta.icon("fa5s.file-export", color=THEME.text_secondary))
+        self.btn_tab_export.setIcon(icon("fa5s.file-export", THEME.text_secondary))
 
         for btn in [self.btn_tab_analysis, self.btn_tab_export]:
             btn.setCheckable(True)
             btn.setFixedHeight(38)
-            btn.setStyleSheet(f"""
-                QPushButton {{
-                    text-align: center;
-                    font-weight: bold;
-                    font-size: {THEME.font_size_header}px;
-                    background-color: #0D0D0D;
-                    border: none;
-                    border-bottom: 1px solid #262626;
-                    border-right: 1px solid #262626;
-                    color: #A0A0A0;
-                }}
-                QPushButton:hover {{
-                    background-color: #262626;
-                    color: #FFFFFF;
-                }}
-                QPushButton:checked {{
-                    background-color: #222222;
-                    color: #FFFFFF;
-                    border-bottom: none;
-                }}
-            """)
+            btn.setStyleSheet(_TAB_BUTTON_STYLE)
             switcher_layout.addWidget(btn)
 
         tab_vbox.addLayout(switcher_layout)
@@ -114,13 +119,6 @@ class SessionPanel(QWidget):
         self.stack.setContentsMargins(0, 8, 0, 0)
         tab_vbox.addWidget(self.stack)
 
-        def wrap_scroll(widget: QWidget) -> QScrollArea:
-            scroll = QScrollArea()
-            scroll.setWidgetResizable(True)
-            scroll.setWidget(widget)
-            scroll.setStyleSheet("QScrollArea { border: none; }")
-            return scroll
-
         self.analysis_group = QGroupBox()
         analysis_layout = QVBoxLayout(self.analysis_group)
         analysis_layout.setContentsMargins(5, 5, 5, 5)
@@ -131,10 +129,12 @@ class SessionPanel(QWidget):
         analysis_layout.addWidget(self.hist_widget, 1)
         analysis_layout.addWidget(self.curve_widget, 1)
 
-        self.stack.addWidget(wrap_scroll(self.analysis_group))
+        self.stack.addWidget(self._wrap_scroll(self.analysis_group))
 
-        self.export_sidebar = ExportSidebar(self.controller)
-        self.stack.addWidget(wrap_scroll(self.export_sidebar))
+        # Export page is built on first use
+        self.export_sidebar: Optional[ExportSidebar] = None
+        self._export_placeholder = QWidget()
+        self.stack.addWidget(self._export_placeholder)
 
         # Default state
         self.btn_tab_analysis.setChecked(True)
@@ -146,22 +146,44 @@ class SessionPanel(QWidget):
 
         layout.addWidget(self.splitter)
 
+    @staticmethod
+    def _wrap_scroll(widget: QWidget) -> QScrollArea:
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setWidget(widget)
+        scroll.setStyleSheet("QScrollArea { border: none; }")
+        return scroll
+
+    def _ensure_export_page(self) -> None:
+        if self.export_sidebar is not None:
+            return
+        self.export_sidebar = ExportSidebar(self.controller)
+        self.stack.removeWidget(self._export_placeholder)
+        self._export_placeholder.deleteLater()
+        self.stack.insertWidget(1, self._wrap_scroll(self.export_sidebar))
+
     def _connect_signals(self) -> None:
         self.controller.image_updated.connect(self._update_analysis)
         self.controller.metrics_available.connect(self._on_metrics_available)
-        self.controller.config_updated.connect(self.export_sidebar.sync_ui)
+        self.controller.config_updated.connect(self._on_config_updated)
 
         self.btn_tab_analysis.clicked.connect(lambda: self._switch_tab(0))
         self.btn_tab_export.clicked.connect(lambda: self._switch_tab(1))
 
+    def _on_config_updated(self, section: str) -> None:
+        if section in ("export", "*") and self.export_sidebar is not None:
+            self.export_sidebar.sync_ui()
+
     def _switch_tab(self, index: int) -> None:
+        if index == 1:
+            self._ensure_export_page()
         self.stack.setCurrentIndex(index)
         self.btn_tab_analysis.setChecked(index == 0)
         self.btn_tab_export.setChecked(index == 1)
 
         # Sync icon colors
-        self.btn_tab_analysis.setIcon(qta.icon("fa5s.chart-bar", color="white" if index == 0 else THEME.text_secondary))
-        self.btn_tab_export.setIcon(qta.icon("fa5s.file-export", color="white" if index == 1 else THEME.text_secondary))
+        self.btn_tab_analysis.setIcon(icon("fa5s.chart-bar", "white" if index == 0 else THEME.text_secondary))
+        self.btn_tab_export.setIcon(icon("fa5s.file-export", "white" if index == 1 else THEME.text_secondary))
 
     def _on_metrics_available(self, metrics: Dict[str, Any]) -> None:
         hist_data = metrics.get("histogram_raw")
@@ -179,7 +201,7 @@ class SessionPanel(QWidget):
             if buffer is None:
                 buffer = metrics.get("base_positive")
             if buffer is not None:
-                self.hist_widget.update_data(buffer)
+                self.hist_widget.update_data(buffer, source_key=metrics.get("render_seq"))
 
         self.curve_widget.update_curve(self.controller.session.state.config.exposure)
 
@@ -26,6 +26,12 @@ class ToningSidebar(BaseSidebar):
 
         self.layout.addStretch()
 
+        self._blocked_widgets = (
+            self.paper_combo,
+            self.selenium_slider,
+            self.sepia_slider,
+        )
+
     def _connect_signals(self) -> None:
         self.paper_combo.currentTextChanged.connect(lambda v: self.update_config_section("toning", paper_profile=v))
         self.selenium_slider.valueChanged.connect(
@@ -37,22 +43,10 @@ class ToningSidebar(BaseSidebar):
         conf = self.state.config.toning
         is_bw = self.state.config.process.process_mode == ProcessMode.BW
 
-        self.block_signals(True)
-        try:
+        with self.signals_blocked():
             self.paper_combo.setCurrentText(conf.paper_profile)
             self.selenium_slider.setValue(conf.selenium_strength)
             self.sepia_slider.setValue(conf.sepia_strength)
 
             self.selenium_slider.setEnabled(is_bw)
             self.sepia_slider.setEnabled(is_bw)
-        finally:
-            self.block_signals(False)
-
-    def block_signals(self, blocked: bool) -> None:
-        widgets = [
-            self.paper_combo,
-            self.selenium_slider,
-            self.sepia_slider,
-        ]
-        for w in widgets:
-            w.blockSignals(blocked)
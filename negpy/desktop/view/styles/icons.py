@@ -0,0 +1,14 @@
+from functools import lru_cache
+
+from PyQt6.QtGui import QIcon
+
+
+@lru_cache(maxsize=128)
+def icon(name: str, color: str) -> QIcon:
+    """
+    Returns a shared qtawesome icon, rendered once per (name, color) pair.
+    """
+    # Deferred so the icon fonts are only loaded once the first icon is requested
+    import qtawesome as qta
+
+    return qta.icon(name, color=color)
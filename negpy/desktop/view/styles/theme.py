@@ -1,5 +1,21 @@
-from dataclasses import dataclass, field
-from typing import Dict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping
+
+# Shared and read-only; THEME is a process-wide constant
+_SIDEBAR_EXPANDED_DEFAULTS: Mapping[str, bool] = MappingProxyType(
+    {
+        "analysis": True,
+        "presets": False,
+        "exposure": True,
+        "geometry": True,
+        "lab": True,
+        "toning": False,
+        "retouch": True,
+        "icc": False,
+        "export": True,
+    }
+)
 
 
 @dataclass(frozen=True)
@@ -32,19 +48,7 @@ class ThemeConfig:
     slider_height_compact: int = 18
     header_padding: int = 10
 
-    sidebar_expanded_defaults: Dict[str, bool] = field(
-        default_factory=lambda: {
-            "analysis": True,
-            "presets": False,
-            "exposure": True,
-            "geometry": True,
-            "lab": True,
-            "toning": False,
-            "retouch": True,
-            "icc": False,
-            "export": True,
-        }
-    )
+    sidebar_expanded_defaults: Mapping[str, bool] = _SIDEBAR_EXPANDED_DEFAULTS
 
 
 THEME = ThemeConfig()
@@ -1,10 +1,33 @@
 import numpy as np
-from typing import Any
-from PyQt6.QtWidgets import QWidget, QSizePolicy
+from typing import Any, Optional, Tuple
+from PyQt6.QtWidgets import QGraphicsItem, QWidget, QSizePolicy
 from PyQt6.QtCharts import QChart, QChartView, QLineSeries, QValueAxis
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPainterPath
-from PyQt6.QtCore import Qt, QPointF, QMargins
-from negpy.kernel.image.logic import get_luminance
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QPixmap, QPolygonF
+from PyQt6.QtCore import Qt, QPointF, QMargins, QTimer
+from negpy.kernel.image.logic import calculate_histograms
+
+_NO_DATA = np.empty(0, dtype=np.float32)
+
+
+def _channel_style(color_hex: str, alpha_fill: int, alpha_line: int) -> Tuple[QBrush, QPen]:
+    c_fill = QColor(color_hex)
+    c_fill.setAlpha(alpha_fill)
+    c_line = QColor(color_hex)
+    c_line.setAlpha(alpha_line)
+    return QBrush(c_fill), QPen(c_line, 1.5)
+
+
+def _array_to_polygon(points: np.ndarray) -> QPolygonF:
+    """
+    Copies an (N, 2) float64 array straight into a QPolygonF's point storage.
+    """
+    n = points.shape[0]
+    poly = QPolygonF()
+    poly.resize(n)
+    ptr = poly.data()
+    ptr.setsize(n * 2 * 8)
+    np.frombuffer(ptr, dtype=np.float64).reshape(n, 2)[:] = points
+    return poly
 
 
 class HistogramWidget(QWidget):
@@ -13,135 +36,184 @@ class HistogramWidget(QWidget):
     Offers additive blending-like visuals and reliable updates.
     """
 
+    SAMPLE_TARGET = 256
+
+    # Built once; paintEvent runs on every repaint
+    _BG_COLOR = QColor("#050505")
+    _BORDER_PEN = QPen(QColor("#262626"), 1)
+    _GRID_PEN = QPen(QColor("#1A1A1A"), 1)
+    # Luminance, R, G, B
+    _CHANNEL_STYLES = (
+        _channel_style("#D4D4D4", 30, 150),
+        _channel_style("#D32F2F", 80, 200),
+        _channel_style("#388E3C", 80, 200),
+        _channel_style("#1976D2", 80, 200),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
         self.setMinimumHeight(40)
-        self._data_r = []
-        self._data_g = []
-        self._data_b = []
-        self._data_l = []
+        self._data_r = _NO_DATA
+        self._data_g = _NO_DATA
+        self._data_b = _NO_DATA
+        self._data_l = _NO_DATA
+        self._hist_buf = np.empty((4, 256), dtype=np.int32)
+
+        # Coalesces slider-driven bursts into a single recompute. The flush fires after the
+        # next frame is dispatched, so it overlaps the render worker: keep this path free of
+        # parallel Numba kernels (the workqueue layer aborts on concurrent launches)
+        self._pending: Any = None
+        self._pending_key: Any = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(30)
+        self._update_timer.timeout.connect(self._flush_update)
+
+        # Key of the last image buffer histogrammed (e.g. the render sequence number)
+        self._last_key: Any = None
+        self._last_hist_bytes = b""
+
+        self._cache_pm: Optional[QPixmap] = None
+        self._cache_size: Any = None
+
+    def update_data(self, buffer: Any, source_key: Any = None) -> None:
+        """
+        Schedules a histogram recompute; only the latest buffer is kept.
+        An image buffer passed with the same non-None source_key as the last one is skipped.
+        """
+        self._pending = buffer
+        self._pending_key = source_key
+        self._update_timer.start()
+
+    def _flush_update(self) -> None:
+        buffer, self._pending = self._pending, None
+        self._do_update(buffer, self._pending_key)
 
-    def update_data(self, buffer: Any) -> None:
+    def _do_update(self, buffer: Any, source_key: Any = None) -> None:
         """
         Calculates histograms and triggers repaint.
         """
         if buffer is None:
-            self._data_r = []
-            self._data_g = []
-            self._data_b = []
-            self._data_l = []
-            self.update()
+            self._last_key = None
+            self._last_hist_bytes = b""
+            self._data_r = _NO_DATA
+            self._data_g = _NO_DATA
+            self._data_b = _NO_DATA
+            self._data_l = _NO_DATA
+            self._invalidate()
             return
 
         if isinstance(buffer, np.ndarray) and buffer.shape == (4, 256):
+            # Precomputed counts are only 4 KB, so compare by content
+            hist_bytes = buffer.tobytes()
+            if hist_bytes == self._last_hist_bytes:
+                return
+            self._last_key = None
+            self._last_hist_bytes = hist_bytes
             self._data_r = self._normalize(buffer[0])
             self._data_g = self._normalize(buffer[1])
             self._data_b = self._normalize(buffer[2])
             self._data_l = self._normalize(buffer[3])
-            self.update()
+            self._invalidate()
             return
 
         if not isinstance(buffer, np.ndarray):
             return
 
-        if buffer.shape[0] > 500:
-            buffer = buffer[::4, ::4]
+        if source_key is not None and source_key == self._last_key:
+            return
+        self._last_key = source_key
+        self._last_hist_bytes = b""
 
-        lum = get_luminance(buffer)
+        # ~256x256 samples is plenty for 256 bins
+        sy = max(1, buffer.shape[0] // self.SAMPLE_TARGET)
+        sx = max(1, buffer.shape[1] // self.SAMPLE_TARGET)
+        buffer = np.ascontiguousarray(buffer[::sy, ::sx])
 
-        self._data_r = self._calc_hist(buffer[..., 0])
-        self._data_g = self._calc_hist(buffer[..., 1])
-        self._data_b = self._calc_hist(buffer[..., 2])
-        self._data_l = self._calc_hist(lum)
-        self.update()
+        hist = calculate_histograms(buffer, self._hist_buf)
 
-    def _normalize(self, counts: np.ndarray) -> list:
+        self._data_r = self._normalize(hist[0])
+        self._data_g = self._normalize(hist[1])
+        self._data_b = self._normalize(hist[2])
+        self._data_l = self._normalize(hist[3])
+        self._invalidate()
+
+    def _normalize(self, counts: np.ndarray) -> np.ndarray:
         max_val = float(np.max(counts))
         if max_val <= 0:
-            return []
-        return (counts.astype(float) / max_val).tolist()
+            return _NO_DATA
+        return counts.astype(np.float32) * np.float32(1.0 / max_val)
 
-    def _calc_hist(self, data: np.ndarray) -> list:
-        hist, _ = np.histogram(data, bins=256, range=(0, 1))
-        max_val = hist.max()
-        if max_val <= 0:
-            return []
-        return (hist.astype(float) / max_val).tolist()
+    def _invalidate(self) -> None:
+        self._cache_pm = None
+        self.update()
 
     def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        # Exposes and window moves blit the last render; only data or size changes redraw
+        dpr = self.devicePixelRatioF()
+        size = self.size()
+        if self._cache_pm is None or self._cache_size != (size, dpr):
+            pm = QPixmap(size * dpr)
+            pm.setDevicePixelRatio(dpr)
+            pm.fill(Qt.GlobalColor.transparent)
+            pm_painter = QPainter(pm)
+            self._render_into(pm_painter, self.width(), self.height())
+            pm_painter.end()
+            self._cache_pm = pm
+            self._cache_size = (size, dpr)
 
-        w = self.width()
-        h = self.height()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._cache_pm)
 
+    def _render_into(self, painter: QPainter, w: int, h: int) -> None:
         # Background and Border
         rect = self.rect().adjusted(0, 0, -1, -1)
-        painter.fillRect(rect, QColor("#050505"))
-        painter.setPen(QPen(QColor("#262626"), 1))
+        painter.fillRect(rect, self._BG_COLOR)
+        painter.setPen(self._BORDER_PEN)
         painter.drawRect(rect)
 
         # Grid lines
-        painter.setPen(QPen(QColor("#1A1A1A"), 1))
+        painter.setPen(self._GRID_PEN)
         for i in range(1, 4):
             x = int(w * i / 4)
             painter.drawLine(x, 0, x, h)
             y = int(h * i / 4)
             painter.drawLine(0, y, w, y)
 
-        self._draw_channel(painter, self._data_l, "#D4D4D4", 30, 150, w, h)
-        self._draw_channel(painter, self._data_r, "#D32F2F", 80, 200, w, h)
-        self._draw_channel(painter, self._data_g, "#388E3C", 80, 200, w, h)
-        self._draw_channel(painter, self._data_b, "#1976D2", 80, 200, w, h)
+        # Only the curves benefit from AA; the frame and grid are pixel-aligned
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        channels = (self._data_l, self._data_r, self._data_g, self._data_b)
+        for data, (fill, line) in zip(channels, self._CHANNEL_STYLES):
+            self._draw_channel(painter, data, fill, line, w, h)
 
     def _draw_channel(
         self,
         painter: QPainter,
-        data: list,
-        color_hex: str,
-        alpha_fill: int,
-        alpha_line: int,
+        data: np.ndarray,
+        fill: QBrush,
+        line: QPen,
         w: int,
         h: int,
     ):
-        if not data:
-            return
-
-        if len(data) < 2:
+        n = data.size
+        if n < 2:
             return
 
-        path = QPainterPath()
-        path.moveTo(0, h)
-
-        step = w / (len(data) - 1)
+        # Curve points followed by the two baseline corners that close the fill
+        pts = np.empty((n + 2, 2), dtype=np.float64)
+        pts[:n, 0] = np.linspace(0.0, w, n)
+        pts[:n, 1] = h - data * h
+        pts[n] = (w, h)
+        pts[n + 1] = (0, h)
 
-        for i, val in enumerate(data):
-            x = i * step
-            y = h - (val * h)
-            path.lineTo(x, y)
-
-        path.lineTo(w, h)
-        path.closeSubpath()
-
-        c_fill = QColor(color_hex)
-        c_fill.setAlpha(alpha_fill)
-        painter.setBrush(QBrush(c_fill))
+        painter.setBrush(fill)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(path)
+        painter.drawPolygon(_array_to_polygon(pts))
 
-        path_line = QPainterPath()
-        path_line.moveTo(0, h - (data[0] * h))
-        for i, val in enumerate(data):
-            x = i * step
-            y = h - (val * h)
-            path_line.lineTo(x, y)
-
-        c_line = QColor(color_hex)
-        c_line.setAlpha(alpha_line)
         painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.setPen(QPen(c_line, 1.5))
-        painter.drawPath(path_line)
+        painter.setPen(line)
+        painter.drawPolyline(_array_to_polygon(pts[:n]))
 
 
 class PhotometricCurveWidget(QChartView):
@@ -158,6 +230,7 @@ class PhotometricCurveWidget(QChartView):
         self._chart.setBackgroundVisible(False)
         self._chart.setMargins(QMargins(0, 0, 0, 0))
         self._chart.legend().hide()
+        self._chart.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
 
         # diagonal
         self.series_ref = QLineSeries()
@@ -192,11 +265,33 @@ class PhotometricCurveWidget(QChartView):
         self.setChart(self._chart)
         self.setMinimumHeight(40)
 
+        self._plt_x = np.linspace(-0.1, 1.1, 50)
+        # Reused across updates; x never changes, only y is rewritten
+        self._qpoints = [QPointF(float(x), 0.0) for x in self._plt_x]
+        self._last_key: Any = None
+
     def update_curve(self, params) -> None:
         from negpy.features.exposure.logic import LogisticSigmoid
         from negpy.features.exposure.models import EXPOSURE_CONSTANTS
         from negpy.kernel.image.validation import ensure_image
 
+        # Only the tone-curve fields matter; colour/WB edits leave the plot unchanged
+        key = (
+            params.density,
+            params.grade,
+            params.toe,
+            params.toe_width,
+            params.toe_hardness,
+            params.shoulder,
+            params.shoulder_width,
+            params.shoulder_hardness,
+            params.shadows,
+            params.highlights,
+        )
+        if key == self._last_key:
+            return
+        self._last_key = key
+
         master_ref = 1.0
         exposure_shift = 0.1 + (params.density * EXPOSURE_CONSTANTS["density_multiplier"])
         pivot = master_ref - exposure_shift
@@ -216,12 +311,13 @@ class PhotometricCurveWidget(QChartView):
             highlights=params.highlights,
         )
 
-        plt_x = np.linspace(-0.1, 1.1, 50)
+        plt_x = self._plt_x
         x_log_exp = 1.0 - plt_x
 
         d = curve(ensure_image(x_log_exp))
-        t = np.power(10.0, -d)
-        y = np.power(t, 1.0 / 2.2)
+        # (10 ** -d) ** (1 / 2.2) as a single exp
+        y = np.exp(d * (-np.log(10.0) / 2.2))
 
-        points = [QPointF(px, py) for px, py in zip(plt_x, y)]
-        self.series.replace(points)
+        for p, py in zip(self._qpoints, y.tolist()):
+            p.setY(py)
+        self.series.replace(self._qpoints)
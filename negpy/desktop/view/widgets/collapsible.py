@@ -1,9 +1,46 @@
+from functools import lru_cache
 from typing import Optional
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QFrame, QHBoxLayout, QLabel
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QIcon, QPixmap
 from PyQt6.QtCore import Qt
 from negpy.desktop.view.styles.theme import THEME
-import qtawesome as qta
+from negpy.desktop.view.styles.icons import icon
+
+_TOGGLE_STYLE = f"""
+    QPushButton {{
+        text-align: left;
+        background-color: #1A1A1A;
+        border: none;
+        border-bottom: 1px solid #262626;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        color: #FFFFFF;
+        padding: 0;
+    }}
+    QPushButton:hover {{
+        background-color: #222222;
+    }}
+    QPushButton:checked {{
+        background-color: #1A1A1A;
+        border-bottom: 1px solid {THEME.accent_primary};
+    }}
+"""
+_TITLE_STYLE = f"font-weight: bold; font-size: {THEME.font_size_header}px; background: transparent;"
+_CONTENT_STYLE = """
+    QFrame {
+        background-color: #121212;
+        border-bottom-left-radius: 4px;
+        border-bottom-right-radius: 4px;
+        border: 1px solid #1A1A1A;
+        border-top: none;
+    }
+"""
+
+
+@lru_cache(maxsize=2)
+def _chevron_pixmap(expanded: bool) -> QPixmap:
+    name = "fa5s.chevron-down" if expanded else "fa5s.chevron-right"
+    return icon(name, "#A0A0A0").pixmap(12, 12)
 
 
 class CollapsibleSection(QWidget):
@@ -31,27 +68,7 @@ class CollapsibleSection(QWidget):
         self.toggle_button.setCursor(Qt.CursorShape.PointingHandCursor)
         self.toggle_button.setFixedHeight(38)
 
-        self.toggle_button.setStyleSheet(
-            f"""
-            QPushButton {{
-                text-align: left;
-                background-color: #1A1A1A;
-                border: none;
-                border-bottom: 1px solid #262626;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                color: #FFFFFF;
-                padding: 0;
-            }}
-            QPushButton:hover {{
-                background-color: #222222;
-            }}
-            QPushButton:checked {{
-                background-color: #1A1A1A;
-                border-bottom: 1px solid {THEME.accent_primary};
-            }}
-        """
-        )
+        self.toggle_button.setStyleSheet(_TOGGLE_STYLE)
 
         # Create a layout inside the toggle button for custom icon/text/chevron placement
         btn_layout = QHBoxLayout(self.toggle_button)
@@ -64,7 +81,7 @@ class CollapsibleSection(QWidget):
             btn_layout.addWidget(icon_label)
 
         title_label = QLabel(self._title_text)
-        title_label.setStyleSheet(f"font-weight: bold; font-size: {THEME.font_size_header}px; background: transparent;")
+        title_label.setStyleSheet(_TITLE_STYLE)
         btn_layout.addWidget(title_label)
 
         btn_layout.addStretch()
@@ -76,15 +93,7 @@ class CollapsibleSection(QWidget):
         btn_layout.addWidget(self.chevron_label)
 
         self.content_area = QFrame()
-        self.content_area.setStyleSheet("""
-            QFrame {
-                background-color: #121212;
-                border-bottom-left-radius: 4px;
-                border-bottom-right-radius: 4px;
-                border: 1px solid #1A1A1A;
-                border-top: none;
-            }
-        """)
+        self.content_area.setStyleSheet(_CONTENT_STYLE)
         self.content_layout = QVBoxLayout(self.content_area)
         self.content_layout.setContentsMargins(0, 5, 0, 10)
         self.content_layout.setSpacing(5)
@@ -102,10 +111,7 @@ class CollapsibleSection(QWidget):
         self.content_layout.addWidget(widget)
 
     def _update_chevron(self, expanded: bool) -> None:
-        if expanded:
-            self.chevron_label.setPixmap(qta.icon("fa5s.chevron-down", color="#A0A0A0").pixmap(12, 12))
-        else:
-            self.chevron_label.setPixmap(qta.icon("fa5s.chevron-right", color="#A0A0A0").pixmap(12, 12))
+        self.chevron_label.setPixmap(_chevron_pixmap(expanded))
 
     def _on_toggle(self, checked: bool) -> None:
         self.content_area.setVisible(checked)
@@ -1,3 +1,4 @@
+from typing import Optional, Tuple
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
@@ -6,7 +7,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QDoubleSpinBox,
 )
-from PyQt6.QtGui import QPainter, QColor, QPen
+from PyQt6.QtGui import QBrush, QPainter, QColor, QPen
 from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QRect
 from negpy.desktop.view.styles.theme import THEME
 
@@ -36,6 +37,7 @@ class BaseSlider(QWidget):
         self.slider = QSlider(Qt.Orientation.Horizontal)
         if has_neutral:
             self.slider.setObjectName("neutral_slider")
+        self.slider.setTickPosition(QSlider.TickPosition.NoTicks)
         self.slider.setRange(int(min_val * self._precision), int(max_val * self._precision))
         self.slider.setValue(int(default_val * self._precision))
 
@@ -48,36 +50,69 @@ class BaseSlider(QWidget):
         self.timer.setSingleShot(True)
         self.timer.setInterval(100)
 
+        # Caps the debounce so a continuous drag still previews a few times per second
+        self._max_wait_timer = QTimer()
+        self._max_wait_timer.setSingleShot(True)
+        self._max_wait_timer.setInterval(250)
+
         self._connect_base_signals()
 
     def _connect_base_signals(self) -> None:
         self.slider.valueChanged.connect(self._on_slider_changed)
         self.spin.valueChanged.connect(self._on_spin_changed)
+        self.slider.sliderReleased.connect(self._flush_pending)
+        self.spin.editingFinished.connect(self._flush_pending)
         self.timer.timeout.connect(self._emit_value)
+        self._max_wait_timer.timeout.connect(self._emit_value)
+
+    def _schedule_emit(self) -> None:
+        self.timer.start()
+        if not self._max_wait_timer.isActive():
+            self._max_wait_timer.start()
 
     def _on_slider_changed(self, value: int) -> None:
         f_val = value / self._precision
         self.spin.blockSignals(True)
         self.spin.setValue(f_val)
         self.spin.blockSignals(False)
-        self.timer.start()
+        # Drags are a preview stream; keyboard/wheel steps are discrete edits
+        if self.slider.isSliderDown():
+            self._schedule_emit()
+        else:
+            self._emit_value()
 
     def _on_spin_changed(self, value: float) -> None:
         self.slider.blockSignals(True)
         self.slider.setValue(int(value * self._precision))
         self.slider.blockSignals(False)
-        self.timer.start()
+        self._schedule_emit()
+
+    def _flush_pending(self) -> None:
+        if self.timer.isActive():
+            self._emit_value()
 
     def _emit_value(self) -> None:
+        self.timer.stop()
+        self._max_wait_timer.stop()
         self.valueChanged.emit(self.spin.value())
 
     def setValue(self, value: float) -> None:
-        self.slider.blockSignals(True)
-        self.spin.blockSignals(True)
-        self.slider.setValue(int(value * self._precision))
-        self.spin.setValue(value)
-        self.slider.blockSignals(False)
-        self.spin.blockSignals(False)
+        self.set_value_quiet(value)
+
+    def set_value_quiet(self, value: float) -> None:
+        """
+        Programmatic update that never emits valueChanged.
+        Inner widgets already showing the value are left untouched (no repaint, no re-polish).
+        """
+        pos = int(value * self._precision)
+        if self.slider.value() != pos:
+            self.slider.blockSignals(True)
+            self.slider.setValue(pos)
+            self.slider.blockSignals(False)
+        if self.spin.value() != round(value, self.spin.decimals()):
+            self.spin.blockSignals(True)
+            self.spin.setValue(value)
+            self.spin.blockSignals(False)
 
     def value(self) -> float:
         return self.spin.value()
@@ -119,7 +154,6 @@ class CompactSlider(BaseSlider):
         self.spin.setSingleStep(step)
         if step >= 1.0:
             self.spin.setDecimals(0)
-            self.slider.setTickInterval(int(step))
             self.slider.setSingleStep(int(step))
 
         self.spin.setButtonSymbols(QDoubleSpinBox.ButtonSymbols.NoButtons)
@@ -142,6 +176,12 @@ class RangeSlider(QWidget):
 
     rangeChanged = pyqtSignal(float, float)
 
+    # Built once; paintEvent runs at mouse-move rate while dragging
+    _LABEL_COLOR = QColor(THEME.text_secondary)
+    _GROOVE_PEN = QPen(QColor("#444"), 4)
+    _ACTIVE_PEN = QPen(QColor(THEME.accent_primary), 4)
+    _HANDLE_BRUSH = QBrush(QColor(THEME.accent_primary))
+
     def __init__(self, label: str, parent=None):
         super().__init__(parent)
         self.setMinimumHeight(50)
@@ -159,6 +199,14 @@ class RangeSlider(QWidget):
         self.timer.setInterval(50)
         self.timer.timeout.connect(lambda: self.rangeChanged.emit(self._min_val, self._max_val))
 
+        # Repaints during a drag are capped at the display refresh rate
+        self._paint_throttle = QTimer(self)
+        self._paint_throttle.setSingleShot(True)
+        self._paint_throttle.setInterval(16)
+        self._paint_throttle.timeout.connect(self._on_paint_throttle)
+        self._pending_paint = False
+        self._painted_px: Optional[Tuple[int, int]] = None
+
     def setRange(self, low: float, high: float) -> None:
         self._min_val = low
         self._max_val = high
@@ -166,30 +214,26 @@ class RangeSlider(QWidget):
 
     def paintEvent(self, event) -> None:
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
         # Draw Label
-        painter.setPen(QColor(THEME.text_secondary))
-        painter.setFont(painter.font())
+        painter.setPen(self._LABEL_COLOR)
         painter.drawText(QRect(0, 0, self.width(), 15), Qt.AlignmentFlag.AlignLeft, self._label)
 
-        # Track math
-        w = self.width() - 2 * self._margin
         y = 35
 
         # Draw Groove
-        painter.setPen(QPen(QColor("#444"), 4))
+        painter.setPen(self._GROOVE_PEN)
         painter.drawLine(self._margin, y, self.width() - self._margin, y)
 
         # Draw Active Part
-        x1 = self._margin + int(self._min_val * w)
-        x2 = self._margin + int(self._max_val * w)
-        painter.setPen(QPen(QColor(THEME.accent_primary), 4))
+        x1, x2 = self._painted_px = self._handle_px()
+        painter.setPen(self._ACTIVE_PEN)
         painter.drawLine(x1, y, x2, y)
 
-        # Draw Handles
+        # Draw Handles; only the circles need antialiasing
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(THEME.accent_primary))
+        painter.setBrush(self._HANDLE_BRUSH)
         painter.drawEllipse(
             x1 - self._handle_r,
             y - self._handle_r,
@@ -203,6 +247,10 @@ class RangeSlider(QWidget):
             self._handle_r * 2,
         )
 
+    def _handle_px(self) -> Tuple[int, int]:
+        w = self.width() - 2 * self._margin
+        return self._margin + int(self._min_val * w), self._margin + int(self._max_val * w)
+
     def _get_val(self, x: int) -> float:
         w = self.width() - 2 * self._margin
         val = (x - self._margin) / max(1, w)
@@ -210,9 +258,11 @@ class RangeSlider(QWidget):
 
     def mousePressEvent(self, event) -> None:
         x = int(event.position().x())
-        w = self.width() - 2 * self._margin
-        x1 = self._margin + int(self._min_val * w)
-        x2 = self._margin + int(self._max_val * w)
+        x1, x2 = self._handle_px()
+
+        screen = self.screen()
+        if screen is not None and screen.refreshRate() > 0:
+            self._paint_throttle.setInterval(max(4, int(1000 / screen.refreshRate())))
 
         if abs(x - x1) < 15:
             self._active_handle = "min"
@@ -231,11 +281,29 @@ class RangeSlider(QWidget):
         else:
             self._max_val = max(val, self._min_val + 0.05)
 
-        self.update()
+        # Sub-pixel moves leave the handles where they were drawn
+        if self._handle_px() != self._painted_px:
+            self._request_paint()
         self.timer.start()
 
+    def _request_paint(self) -> None:
+        if self._paint_throttle.isActive():
+            self._pending_paint = True
+            return
+        self.update()
+        self._paint_throttle.start()
+
+    def _on_paint_throttle(self) -> None:
+        if self._pending_paint:
+            self._pending_paint = False
+            self.update()
+            self._paint_throttle.start()
+
     def mouseReleaseEvent(self, event) -> None:
         self._active_handle = None
+        if self._pending_paint:
+            self._pending_paint = False
+            self.update()
 
     def mouseDoubleClickEvent(self, event) -> None:
         """Reset for the entire range."""
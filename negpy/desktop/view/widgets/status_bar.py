@@ -62,6 +62,13 @@ class TopStatusBar(QWidget):
 
         layout.addLayout(self.system_info)
 
+        # Last applied state; repeated updates skip the Qt calls (and re-polish) entirely
+        self._msg_text = "Ready"
+        self._gpu_state: tuple = ("CPU", False)
+        self._progress_total = -1
+        self._progress_current = -1
+        self._progress_visible = False
+
     def _create_separator(self) -> QFrame:
         line = QFrame()
         line.setFrameShape(QFrame.Shape.VLine)
@@ -74,21 +81,40 @@ class TopStatusBar(QWidget):
     def showMessage(self, text: str, timeout: int = 0):
         if text == "Image Updated":
             return
-        self.msg_label.setText(text.upper())
+        self._set_message(text.upper())
         if timeout > 0:
-            QTimer.singleShot(timeout, lambda: self.msg_label.setText("READY"))
+            QTimer.singleShot(timeout, lambda: self._set_message("READY"))
+
+    def _set_message(self, text: str) -> None:
+        if text != self._msg_text:
+            self._msg_text = text
+            self.msg_label.setText(text)
 
     def set_gpu_info(self, backend: str, active: bool = False):
+        if (backend, active) == self._gpu_state:
+            return
+        self._gpu_state = (backend, active)
         self.gpu_label.setText(backend.upper())
         color = THEME.accent_primary if active else THEME.text_muted
         self.gpu_label.setStyleSheet(f"color: {color}; font-weight: bold;")
 
     def set_progress(self, current: int, total: int):
         if total <= 0:
-            self.progress.setVisible(False)
+            self.hide_progress()
             return
-        self.progress.setVisible(True)
-        self.progress.setRange(0, total)
-        self.progress.setValue(current)
+        if not self._progress_visible:
+            self._progress_visible = True
+            self.progress.setVisible(True)
+        if total != self._progress_total:
+            self._progress_total = total
+            self.progress.setRange(0, total)
+        if current != self._progress_current:
+            self._progress_current = current
+            self.progress.setValue(current)
         if current >= total:
-            QTimer.singleShot(1000, lambda: self.progress.setVisible(False))
+            QTimer.singleShot(1000, self.hide_progress)
+
+    def hide_progress(self) -> None:
+        if self._progress_visible:
+            self._progress_visible = False
+            self.progress.setVisible(False)
@@ -1,17 +1,36 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 import numpy as np
 from PyQt6.QtCore import QObject, pyqtSignal, pyqtSlot
 from negpy.domain.models import WorkspaceConfig
 from negpy.services.rendering.image_processor import ImageProcessor
-from negpy.features.exposure.normalization import analyze_log_exposure_bounds
-from negpy.kernel.system.config import DEFAULT_WORKSPACE_CONFIG
+from negpy.services.assets import thumbnails as thumb_service
+from negpy.features.exposure.normalization import analyze_log_exposure_bounds, normalize_linear_image
+from negpy.features.exposure.shadows import analyze_shadow_cast
+from negpy.infrastructure.gpu.resources import GPUTexture
+from negpy.kernel.image.logic import calculate_file_hash
+from negpy.kernel.system.config import APP_CONFIG, DEFAULT_WORKSPACE_CONFIG
 from negpy.kernel.system.logging import get_logger
 
 logger = get_logger(__name__)
 
+_LOG_EPSILON = 1e-6
+_HASH_WORKERS = 8
 
-@dataclass(frozen=True)
+
+def _safe_file_hash(path: str) -> Optional[str]:
+    try:
+        return calculate_file_hash(path)
+    except Exception as e:
+        logger.error(f"Skipping invalid file {path}: {e}")
+        return None
+
+
+# slots: a drag queues one of these per slider tick
+@dataclass(frozen=True, slots=True)
 class RenderTask:
     """Immutable rendering request payload."""
 
@@ -25,6 +44,12 @@ class RenderTask:
     gpu_enabled: bool = True
     readback_metrics: bool = True
 
+    def __post_init__(self) -> None:
+        # The worker renders straight from this buffer, so writes through the task must fail
+        view = self.buffer.view()
+        view.flags.writeable = False
+        object.__setattr__(self, "buffer", view)
+
 
 @dataclass(frozen=True)
 class ThumbnailUpdateTask:
@@ -58,7 +83,6 @@ class RenderWorker(QObject):
     """
 
     finished = pyqtSignal(object, dict)  # (ndarray|GPUTexture, metrics)
-    metrics_updated = pyqtSignal(dict)  # Late-arriving metrics (histogram, etc.)
     error = pyqtSignal(str)
 
     def __init__(self) -> None:
@@ -81,10 +105,8 @@ class RenderWorker(QObject):
     def process(self, task: RenderTask) -> None:
         """Executes the rendering pipeline for a single frame."""
         try:
-            img_src = task.buffer.copy()
-
             result, metrics = self._processor.run_pipeline(
-                img_src,
+                task.buffer,
                 task.config,
                 task.source_hash,
                 render_size_ref=task.preview_size,
@@ -92,27 +114,22 @@ class RenderWorker(QObject):
                 readback_metrics=task.readback_metrics,
             )
 
-            from negpy.infrastructure.gpu.resources import GPUTexture
-
             if task.icc_profile_path and isinstance(result, GPUTexture):
                 result = result.readback()
 
             if task.icc_profile_path and isinstance(result, np.ndarray):
-                pil_img = self._processor.buffer_to_pil(result, task.config)
-                pil_proof, _ = self._processor._apply_color_management(
-                    pil_img,
+                result = self._processor.apply_soft_proof(
+                    result,
+                    task.config,
                     task.color_space,
                     task.icc_profile_path,
                     task.icc_invert,
                 )
-                arr = np.array(pil_proof)
-                result = arr.astype(np.float32) / (65535.0 if arr.dtype == np.uint16 else 255.0)
 
             # Ensure ground truth is stored in metrics for view consumption
             metrics["base_positive"] = result
 
             self.finished.emit(result, metrics)
-            self.metrics_updated.emit(metrics)
 
         except Exception as e:
             self.error.emit(str(e))
@@ -124,45 +141,46 @@ class ThumbnailWorker(QObject):
     """
 
     progress = pyqtSignal(int, int, str)
-    finished = pyqtSignal(dict)
+    # (thumbnails by name, names that were requested); the second list lets the
+    # receiver release names whose thumbnail failed or was never produced.
+    finished = pyqtSignal(dict, list)
 
     def __init__(self, asset_store) -> None:
         super().__init__()
         self._store = asset_store
+        # Loop (and its to_thread executor) is created on first run and reused across batches
+        self._runner = asyncio.Runner()
+
+    def cleanup(self) -> None:
+        """Closes the event loop. Call once the owning thread has stopped."""
+        self._runner.close()
 
     @pyqtSlot(list)
     def generate(self, files: list) -> None:
         """
         Generates thumbnails for a list of files with progress reporting.
         """
-        import asyncio
-        from negpy.services.assets import thumbnails as thumb_service
-
+        requested = [f["name"] for f in files]
+        new_thumbs: dict = {}
         try:
             total = len(files)
 
             async def _progress_callback(current: int, name: str):
                 self.progress.emit(current, total, name)
 
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            new_thumbs = loop.run_until_complete(
-                thumb_service.generate_batch_thumbnails(files, self._store, progress_callback=_progress_callback)
-            )
-            self.finished.emit(new_thumbs)
+            new_thumbs = self._runner.run(thumb_service.generate_batch_thumbnails(files, self._store, progress_callback=_progress_callback))
         except Exception as e:
             logger.error(f"Thumbnail generation failure: {e}")
+        self.finished.emit(new_thumbs, requested)
 
     @pyqtSlot(ThumbnailUpdateTask)
     def update_rendered(self, task: ThumbnailUpdateTask) -> None:
         """Updates thumbnail from a rendered positive buffer."""
-        from negpy.services.assets.thumbnails import get_rendered_thumbnail
-
         try:
             buf = task.buffer.copy()
-            thumb = get_rendered_thumbnail(buf, task.file_hash, self._store)
+            thumb = thumb_service.get_rendered_thumbnail(buf, task.file_hash, self._store)
             if thumb:
-                self.finished.emit({task.filename: thumb})
+                self.finished.emit({task.filename: thumb}, [])
         except Exception as e:
             logger.error(f"Thumbnail update failure: {e}")
 
@@ -181,18 +199,21 @@ class AssetDiscoveryWorker(QObject):
         """
         Scans paths for supported images and calculates hashes.
         """
-        import os
-        from negpy.kernel.image.logic import calculate_file_hash
-
+        exts = frozenset(e.lower() for e in task.supported_extensions)
         discovered_paths = []
         for path in task.paths:
             try:
                 if os.path.isdir(path):
-                    for f in os.listdir(path):
-                        if f.lower().endswith(task.supported_extensions):
-                            discovered_paths.append(os.path.join(path, f))
+                    with os.scandir(path) as it:
+                        for entry in it:
+                            name = entry.name
+                            dot = name.rfind(".")
+                            if dot < 0 or name[dot:].lower() not in exts:
+                                continue
+                            if entry.is_file():
+                                discovered_paths.append(entry.path)
                 else:
-                    if path.lower().endswith(task.supported_extensions):
+                    if os.path.splitext(path)[1].lower() in exts:
                         discovered_paths.append(path)
             except Exception as e:
                 logger.error(f"Discovery error for {path}: {e}")
@@ -200,16 +221,14 @@ class AssetDiscoveryWorker(QObject):
         total = len(discovered_paths)
         valid_assets = []
 
-        for i, path in enumerate(discovered_paths):
-            name = os.path.basename(path)
-            self.progress.emit(i + 1, total, name)
-
-            try:
-                f_hash = calculate_file_hash(path)
-                if not f_hash.startswith("err_"):
+        # Hashing is file reads + sha256, both release the GIL; map keeps input order.
+        with ThreadPoolExecutor(max_workers=min(_HASH_WORKERS, APP_CONFIG.max_workers)) as ex:
+            hashes = ex.map(_safe_file_hash, discovered_paths)
+            for i, (path, f_hash) in enumerate(zip(discovered_paths, hashes)):
+                name = os.path.basename(path)
+                self.progress.emit(i + 1, total, name)
+                if f_hash is not None and not f_hash.startswith("err_"):
                     valid_assets.append({"name": name, "path": path, "hash": f_hash})
-            except Exception as e:
-                logger.error(f"Skipping invalid file {path}: {e}")
 
         self.finished.emit(valid_assets)
 
@@ -229,83 +248,69 @@ class NormalizationWorker(QObject):
         self._preview_service = preview_service
         self._repo = repo
 
+    def _analyze_file(self, f_info: dict, params: Optional[WorkspaceConfig], color_space: str) -> tuple:
+        """
+        Log bounds and shadow cast for a single file.
+        """
+        use_camera_wb = params.exposure.use_camera_wb if params else False
+        analysis_buffer = params.process.analysis_buffer if params else DEFAULT_WORKSPACE_CONFIG.process.analysis_buffer
+        process_mode = params.process.process_mode if params else DEFAULT_WORKSPACE_CONFIG.process.process_mode
+        e6_normalize = params.process.e6_normalize if params else DEFAULT_WORKSPACE_CONFIG.process.e6_normalize
+        shadow_threshold = params.process.shadow_cast_threshold if params else DEFAULT_WORKSPACE_CONFIG.process.shadow_cast_threshold
+
+        raw, _, _ = self._preview_service.load_linear_preview(
+            f_info["path"],
+            color_space,
+            use_camera_wb=use_camera_wb,
+        )
+
+        bounds = analyze_log_exposure_bounds(
+            raw,
+            analysis_buffer=analysis_buffer,
+            process_mode=process_mode,
+            e6_normalize=e6_normalize,
+        )
+
+        res_norm = normalize_linear_image(raw, bounds, _LOG_EPSILON)
+        return bounds.floors, bounds.ceils, analyze_shadow_cast(res_norm, shadow_threshold)
+
     @pyqtSlot(NormalizationTask)
     def process(self, task: NormalizationTask) -> None:
         """
         Executes analysis on a batch of files.
         """
         total = len(task.files)
-        all_floors = []
-        all_ceils = []
-        all_casts = []
+        floors_arr = np.empty((total, 3), dtype=np.float64)
+        ceils_arr = np.empty_like(floors_arr)
+        casts_arr = np.empty_like(floors_arr)
 
         try:
-            for i, f_info in enumerate(task.files):
-                self.progress.emit(i + 1, total, f_info["name"])
-
-                params = self._repo.load_file_settings(f_info["hash"])
-                use_camera_wb = params.exposure.use_camera_wb if params else False
-                analysis_buffer = params.process.analysis_buffer if params else DEFAULT_WORKSPACE_CONFIG.process.analysis_buffer
-                process_mode = params.process.process_mode if params else DEFAULT_WORKSPACE_CONFIG.process.process_mode
-                e6_normalize = params.process.e6_normalize if params else DEFAULT_WORKSPACE_CONFIG.process.e6_normalize
-                shadow_threshold = (
-                    params.process.shadow_cast_threshold if params else DEFAULT_WORKSPACE_CONFIG.process.shadow_cast_threshold
-                )
+            # DB reads first, so the loop below is pure decode + analysis
+            all_params = [self._repo.load_file_settings(f_info["hash"]) for f_info in task.files]
 
-                raw, _, _ = self._preview_service.load_linear_preview(
-                    f_info["path"],
-                    task.workspace_color_space,
-                    use_camera_wb=use_camera_wb,
-                )
-
-                bounds = analyze_log_exposure_bounds(
-                    raw,
-                    analysis_buffer=analysis_buffer,
-                    process_mode=process_mode,
-                    e6_normalize=e6_normalize,
-                )
-                all_floors.append(bounds.floors)
-                all_ceils.append(bounds.ceils)
-
-                from negpy.features.exposure.normalization import normalize_log_image
-                from negpy.features.exposure.shadows import analyze_shadow_cast
-
-                epsilon = 1e-6
-                img_log = np.log10(np.clip(raw, epsilon, 1.0))
-                res_norm = normalize_log_image(img_log, bounds)
-                cast = analyze_shadow_cast(res_norm, shadow_threshold)
-                all_casts.append(cast)
-
-            floors_arr = np.array(all_floors)
-            ceils_arr = np.array(all_ceils)
-            casts_arr = np.array(all_casts)
+            for i, (f_info, params) in enumerate(zip(task.files, all_params)):
+                self.progress.emit(i + 1, total, f_info["name"])
+                floors_arr[i], ceils_arr[i], casts_arr[i] = self._analyze_file(f_info, params, task.workspace_color_space)
 
             def get_robust_mean(data: np.ndarray) -> np.ndarray:
-                results = []
-                for ch in range(3):
-                    ch_data = data[:, ch]
-                    if len(ch_data) < 5:
-                        results.append(np.mean(ch_data))
-                        continue
-
-                    low, high = np.percentile(ch_data, [10, 90])
-                    mask = (ch_data >= low) & (ch_data <= high)
-                    valid = ch_data[mask]
-
-                    if valid.size > 0:
-                        results.append(np.mean(valid))
-                    else:
-                        results.append(np.mean(ch_data))
-                return np.array(results)
+                if data.shape[0] < 5:
+                    return data.mean(axis=0)
+
+                # Per-channel 10-90 percentile trimmed mean
+                low, high = np.percentile(data, [10, 90], axis=0)
+                mask = (data >= low) & (data <= high)
+                counts = mask.sum(axis=0)
+                sums = np.where(mask, data, 0.0).sum(axis=0)
+                return np.where(counts > 0, sums / np.maximum(counts, 1), data.mean(axis=0))
 
             avg_floors = get_robust_mean(floors_arr)
             avg_ceils = get_robust_mean(ceils_arr)
             avg_casts = get_robust_mean(casts_arr)
 
             self.finished.emit(
-                tuple(map(float, avg_floors)),
-                tuple(map(float, avg_ceils)),
-                tuple(map(float, avg_casts)),
+                tuple(avg_floors.tolist()),
+                tuple(avg_ceils.tolist()),
+                tuple(avg_casts.tolist()),
             )
 
         except Exception as e:
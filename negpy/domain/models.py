@@ -1,7 +1,7 @@
 import os
 
-from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, Optional
+from dataclasses import dataclass, field, fields
+from typing import Dict, Any, List, Optional
 from enum import Enum, StrEnum
 from negpy.features.process.models import ProcessConfig
 from negpy.features.exposure.models import ExposureConfig
@@ -57,9 +57,7 @@ class ExportConfig:
     Export parameters (path, format, sizing).
     """
 
-    userDir = paths.get_default_user_dir()
-
-    export_path: str = os.path.join(userDir, "export")
+    export_path: str = field(default_factory=lambda: os.path.join(paths.get_default_user_dir(), "export"))
     export_fmt: str = ExportFormat.JPEG
     export_color_space: str = ColorSpace.ADOBE_RGB.value
     paper_aspect_ratio: str = AspectRatio.ORIGINAL
@@ -75,6 +73,11 @@ class ExportConfig:
     icc_invert: bool = False
 
 
+# Section types in WorkspaceConfig field order, and the section index owning each flat key
+_SECTION_TYPES = (ProcessConfig, ExposureConfig, GeometryConfig, LabConfig, RetouchConfig, ToningConfig, ExportConfig)
+_FIELD_SECTION: Dict[str, int] = {f.name: i for i, section in enumerate(_SECTION_TYPES) for f in fields(section)}
+
+
 @dataclass(frozen=True)
 class WorkspaceConfig:
     """
@@ -93,32 +96,32 @@ class WorkspaceConfig:
         """
         Flattens for serialization.
         """
-        res = {}
-        res.update(asdict(self.process))
-        res.update(asdict(self.exposure))
-        res.update(asdict(self.geometry))
-        res.update(asdict(self.lab))
-        res.update(asdict(self.retouch))
-        res.update(asdict(self.toning))
-        res.update(asdict(self.export))
-        return res
+        # Sections are frozen, but list fields (dust spots, crosstalk matrices) are
+        # mutable; their items are immutable, so a shallow list copy replaces asdict()'s deep copy
+        data = {
+            **self.process.__dict__,
+            **self.exposure.__dict__,
+            **self.geometry.__dict__,
+            **self.lab.__dict__,
+            **self.retouch.__dict__,
+            **self.toning.__dict__,
+            **self.export.__dict__,
+        }
+        for k, v in data.items():
+            if isinstance(v, list):
+                data[k] = list(v)
+        return data
 
     @classmethod
     def from_flat_dict(cls, data: Dict[str, Any]) -> "WorkspaceConfig":
         """
         from DB/JSON.
         """
-
-        def filter_keys(config_cls: Any, d: Dict[str, Any]) -> Dict[str, Any]:
-            valid_keys = config_cls.__dataclass_fields__.keys()
-            return {k: v for k, v in d.items() if k in valid_keys and v is not None}
-
-        return cls(
-            process=ProcessConfig(**filter_keys(ProcessConfig, data)),
-            exposure=ExposureConfig(**filter_keys(ExposureConfig, data)),
-            geometry=GeometryConfig(**filter_keys(GeometryConfig, data)),
-            lab=LabConfig(**filter_keys(LabConfig, data)),
-            retouch=RetouchConfig(**filter_keys(RetouchConfig, data)),
-            toning=ToningConfig(**filter_keys(ToningConfig, data)),
-            export=ExportConfig(**filter_keys(ExportConfig, data)),
-        )
+        # Single pass over the flat keys instead of one intersection per section
+        kwargs: List[Dict[str, Any]] = [{} for _ in _SECTION_TYPES]
+        for k, v in data.items():
+            i = _FIELD_SECTION.get(k)
+            if i is not None and v is not None:
+                kwargs[i][k] = v
+
+        return cls(*(section(**kw) for section, kw in zip(_SECTION_TYPES, kwargs)))
@@ -2,7 +2,7 @@ import numpy as np
 from numba import njit, prange  # type: ignore
 from typing import Tuple, Any
 from negpy.domain.types import ImageBuffer
-from negpy.kernel.image.validation import ensure_image
+from negpy.kernel.image.validation import ensure_contiguous, ensure_image
 
 
 def _expit(x: Any) -> Any:
@@ -10,21 +10,113 @@ def _expit(x: Any) -> Any:
     return 1.0 / (1.0 + np.exp(-x))
 
 
-@njit(inline="always")
-def _fast_sigmoid(x: float) -> float:
+# Per-channel invariants returned by _photometric_channel_coeffs
+_ChannelCoeffs = Tuple[np.float32, np.float32, np.float32, np.float32, np.float32, np.float32, np.float32, np.float32]
+
+
+@njit("f4(f4)", inline="always", fastmath=True)
+def _fast_sigmoid(x: float) -> np.float32:
     """
     Fast implementation of the logistic sigmoid function.
     expit(x) = 1 / (1 + exp(-x))
     """
+    one = np.float32(1.0)
     if x >= 0:
         z = np.exp(-x)
-        return float(1.0 / (1.0 + z))
+        return np.float32(one / (one + z))
     else:
         z = np.exp(x)
-        return float(z / (1.0 + z))
+        return np.float32(z / (one + z))
+
+
+@njit(inline="always")
+def _photometric_channel_coeffs(
+    pivot: float,
+    slope: float,
+    shadow_cmy: float,
+    highlight_cmy: float,
+    toe_width: float,
+    shoulder_width: float,
+) -> _ChannelCoeffs:
+    """
+    Per-channel invariants of the H&D mapping, resolved once per kernel call:
+    (pivot, slope, shadow_cmy, highlight_cmy, s_center, h_center, shoulder_scale, toe_scale).
+    All float32.
+    """
+    epsilon = 1e-6
+    return (
+        np.float32(pivot),
+        np.float32(slope),
+        np.float32(shadow_cmy),
+        np.float32(highlight_cmy),
+        np.float32((1.0 - pivot) * 0.9),
+        np.float32((0.0 - pivot) * 0.9),
+        np.float32(shoulder_width / max(pivot, epsilon)),
+        np.float32(toe_width / max(1.0 - pivot, epsilon)),
+    )
 
 
-@njit(parallel=True, cache=True, fastmath=True)
+@njit(inline="always", fastmath=True, error_model="numpy")
+def _photometric_channel(
+    val: float,
+    coeffs: _ChannelCoeffs,
+    curve: Tuple[float, float, float, float, float, float, float, float],
+) -> np.float32:
+    """
+    H&D mapping of a single channel value (log-exposure + CMY offset) to display value.
+    `coeffs` comes from _photometric_channel_coeffs; `curve` carries the channel-independent
+    strengths and output scale. Everything stays float32: a bare literal would widen the
+    expression to float64.
+    """
+    pivot, slope, shadow_cmy, highlight_cmy, s_center, h_center, shoulder_scale, toe_scale = coeffs
+    toe, toe_hardness, shoulder, shoulder_hardness, shadows, highlights, d_max, out_scale = curve
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+    half = np.float32(0.5)
+    four = np.float32(4.0)
+    mask_weight = np.float32(0.3)
+    mask_scale = np.float32(-1.0 / 0.15)
+    diff = val - pivot
+
+    # Each term below scales by its strength; a zero strength contributes exactly 0,
+    # so its exp/pow work is skipped (the branches are loop-invariant).
+    diff_adj = diff
+
+    if shadows != zero or shadow_cmy != zero:
+        s_mask = np.exp((diff - s_center) * (diff - s_center) * mask_scale)
+        diff_adj += shadow_cmy * s_mask - shadows * s_mask * mask_weight
+
+    if highlights != zero or highlight_cmy != zero:
+        h_mask = np.exp((diff - h_center) * (diff - h_center) * mask_scale)
+        diff_adj += highlight_cmy * h_mask - highlights * h_mask * mask_weight
+
+    damp_shoulder = zero
+    if shoulder != zero:
+        w_s = _fast_sigmoid(diff_adj * shoulder_scale)
+        prot_s = (four * (w_s - half) * (w_s - half)) ** shoulder_hardness
+        damp_shoulder = shoulder * (one - w_s) * prot_s
+
+    damp_toe = zero
+    if toe != zero:
+        w_t = _fast_sigmoid(diff_adj * toe_scale)
+        prot_t = (four * (w_t - half) * (w_t - half)) ** toe_hardness
+        damp_toe = toe * w_t * prot_t
+
+    k_mod = min(max(one - damp_toe - damp_shoulder, np.float32(0.1)), np.float32(2.0))
+
+    density = d_max * _fast_sigmoid(slope * diff_adj * k_mod)
+
+    # (10 ** -D) ** (1 / gamma) == exp(D * -ln(10) / gamma): one exp instead of two pows
+    return np.float32(min(max(np.exp(density * out_scale), zero), one))
+
+
+@njit(
+    "f4[:, :, ::1](f4[:, :, ::1], f4[::1], f4[::1], f4, f4, f4, f4, f4, f4, f4, f4, f4[::1], f4[::1], f4[::1], f4, f4, i8)",
+    parallel=True,
+    cache=True,
+    fastmath=True,
+    error_model="numpy",
+)
 def _apply_photometric_fused_kernel(
     img: np.ndarray,
     pivots: np.ndarray,
@@ -47,60 +139,25 @@ def _apply_photometric_fused_kernel(
     """
     Fused JIT kernel for H&D curve application.
     Maps log-exposure to optical density (D) in a single pass.
+    Runs over flat (N, 3) pixels with the channel loop unrolled so per-channel
+    parameters stay in registers.
     """
     h, w, c = img.shape
-    res = np.empty_like(img)
-    inv_gamma = 1.0 / gamma
-
-    for y in prange(h):
-        for x in range(w):
-            for ch in range(3):
-                val = img[y, x, ch] + cmy_offsets[ch]
-                diff = val - pivots[ch]
-                epsilon = 1e-6
-
-                s_center = (1.0 - pivots[ch]) * 0.9
-                h_center = (0.0 - pivots[ch]) * 0.9
-
-                s_mask = np.exp(-((diff - s_center) ** 2) / 0.15)
-                shadow_density_offset = shadows * s_mask * 0.3
-                shadow_color_offset = shadow_cmy[ch] * s_mask
-
-                h_mask = np.exp(-((diff - h_center) ** 2) / 0.15)
-                highlight_density_offset = highlights * h_mask * 0.3
-                highlight_color_offset = highlight_cmy[ch] * h_mask
-
-                diff_adj = diff + shadow_color_offset + highlight_color_offset - shadow_density_offset - highlight_density_offset
-
-                sw_val = shoulder_width * (diff_adj / max(float(pivots[ch]), epsilon))
-                w_s = _fast_sigmoid(sw_val)
-                prot_s = (4.0 * ((w_s - 0.5) ** 2)) ** shoulder_hardness
-                damp_shoulder = shoulder * (1.0 - w_s) * prot_s
-
-                tw_val = toe_width * (diff_adj / max(1.0 - float(pivots[ch]), epsilon))
-                w_t = _fast_sigmoid(tw_val)
-                prot_t = (4.0 * ((w_t - 0.5) ** 2)) ** toe_hardness
-                damp_toe = toe * w_t * prot_t
-
-                k_mod = 1.0 - damp_toe - damp_shoulder
-                if k_mod < 0.1:
-                    k_mod = 0.1
-                elif k_mod > 2.0:
-                    k_mod = 2.0
-
-                slope = slopes[ch]
-                density = d_max * _fast_sigmoid(float(slope) * diff_adj * k_mod)
-
-                transmittance = 10.0 ** (-density)
-                final_val = transmittance**inv_gamma
+    src = img.reshape(h * w, c)
+    res = np.empty_like(src)
+    out_scale = np.float32(-np.log(10.0) / gamma)
 
-                if final_val < 0.0:
-                    final_val = 0.0
-                elif final_val > 1.0:
-                    final_val = 1.0
+    c0 = _photometric_channel_coeffs(pivots[0], slopes[0], shadow_cmy[0], highlight_cmy[0], toe_width, shoulder_width)
+    c1 = _photometric_channel_coeffs(pivots[1], slopes[1], shadow_cmy[1], highlight_cmy[1], toe_width, shoulder_width)
+    c2 = _photometric_channel_coeffs(pivots[2], slopes[2], shadow_cmy[2], highlight_cmy[2], toe_width, shoulder_width)
+    o0, o1, o2 = cmy_offsets[0], cmy_offsets[1], cmy_offsets[2]
+    curve = (toe, toe_hardness, shoulder, shoulder_hardness, shadows, highlights, d_max, out_scale)
 
-                res[y, x, ch] = final_val
-    return res
+    for i in prange(h * w):
+        res[i, 0] = _photometric_channel(src[i, 0] + o0, c0, curve)
+        res[i, 1] = _photometric_channel(src[i, 1] + o1, c1, curve)
+        res[i, 2] = _photometric_channel(src[i, 2] + o2, c2, curve)
+    return res.reshape(h, w, c)
 
 
 class LogisticSigmoid:
@@ -202,7 +259,7 @@ def apply_characteristic_curve(
     h_cmy = np.ascontiguousarray(np.array(highlight_cmy, dtype=np.float32))
 
     res = _apply_photometric_fused_kernel(
-        np.ascontiguousarray(img.astype(np.float32)),
+        ensure_contiguous(img),
         pivots,
         slopes,
         float(toe),
@@ -216,7 +273,9 @@ def apply_characteristic_curve(
         offsets,
         s_cmy,
         h_cmy,
-        mode=mode,
+        4.0,
+        2.2,
+        int(mode),
     )
 
     return ensure_image(res)
@@ -1,42 +1,150 @@
 from typing import Tuple, Optional
 import numpy as np
-from numba import njit, prange  # type: ignore
+from numba import get_num_threads, njit, prange  # type: ignore
 from negpy.domain.types import ImageBuffer
-from negpy.kernel.image.validation import ensure_image
+from negpy.kernel.image.validation import ensure_contiguous, ensure_image
 from negpy.features.process.models import ProcessMode
 
 
-@njit(parallel=True, cache=True, fastmath=True)
-def _normalize_log_image_jit(img_log: np.ndarray, floors: np.ndarray, ceils: np.ndarray) -> np.ndarray:
+@njit(
+    "f4[:, :, ::1](f4[:, :, ::1], f4[::1], f4[::1], f4[:, :, ::1])",
+    parallel=True,
+    cache=True,
+    fastmath=True,
+    error_model="numpy",
+)
+def _normalize_log_image_jit(img_log: np.ndarray, floors: np.ndarray, scales: np.ndarray, out: np.ndarray) -> np.ndarray:
     """
-    Log -> 0.0-1.0 (Linear stretch).
-    Supports both f < c (Negative) and f > c (Positive) mapping.
+    Log -> 0.0-1.0 (Linear stretch), (x - floor) * scale per channel.
+    `out` may alias `img_log`.
     """
     h, w, c = img_log.shape
-    res = np.empty_like(img_log)
-    epsilon = 1e-6
+    src = img_log.reshape(h * w, c)
+    res = out.reshape(h * w, c)
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+
+    f0, f1, f2 = floors[0], floors[1], floors[2]
+    s0, s1, s2 = scales[0], scales[1], scales[2]
+
+    for i in prange(h * w):
+        res[i, 0] = min(max((src[i, 0] - f0) * s0, zero), one)
+        res[i, 1] = min(max((src[i, 1] - f1) * s1, zero), one)
+        res[i, 2] = min(max((src[i, 2] - f2) * s2, zero), one)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _channel_order_stats_jit(img: np.ndarray, quantiles: np.ndarray, n_bins: int, n_chunks: int) -> np.ndarray:
+    """
+    Exact order statistics per channel without sorting the channel.
+    For each quantile q in [0, 1] returns the values at ranks floor((n-1)q) and the next one,
+    as (3, len(quantiles), 2). A histogram over [min, max] locates the bin holding each rank;
+    only those bins' members are gathered and sorted. NaNs are ignored.
+    """
+    h, w, c = img.shape
+    n_q = quantiles.shape[0]
+    out = np.empty((3, n_q, 2), dtype=np.float64)
+    rows_per_chunk = (h + n_chunks - 1) // n_chunks
+
+    for ch in range(3):
+        # Pass 1: range
+        chunk_min = np.full(n_chunks, np.inf)
+        chunk_max = np.full(n_chunks, -np.inf)
+        for k in prange(n_chunks):
+            lo = np.inf
+            hi = -np.inf
+            for y in range(k * rows_per_chunk, min(h, (k + 1) * rows_per_chunk)):
+                for x in range(w):
+                    v = img[y, x, ch]
+                    if v < lo:
+                        lo = v
+                    if v > hi:
+                        hi = v
+            chunk_min[k] = lo
+            chunk_max[k] = hi
+        v_min = chunk_min.min()
+        v_max = chunk_max.max()
+
+        if not v_max > v_min:
+            out[ch, :, :] = v_min
+            continue
+
+        # Pass 2: histogram (chunk-local bins, reduced after)
+        scale = n_bins / (v_max - v_min)
+        local = np.zeros((n_chunks, n_bins), dtype=np.int64)
+        for k in prange(n_chunks):
+            for y in range(k * rows_per_chunk, min(h, (k + 1) * rows_per_chunk)):
+                for x in range(w):
+                    v = img[y, x, ch]
+                    if v == v:
+                        b = min(n_bins - 1, int((v - v_min) * scale))
+                        local[k, b] += 1
+        hist = local.sum(axis=0)
+        n = hist.sum()
+
+        # Locate the bin and in-bin offset of every requested rank
+        n_r = n_q * 2
+        r_bin = np.empty(n_r, dtype=np.int64)
+        r_off = np.empty(n_r, dtype=np.int64)
+        for qi in range(n_q):
+            base = int(np.floor((n - 1) * quantiles[qi]))
+            for j in range(2):
+                rank = min(base + j, n - 1)
+                cum = 0
+                for b in range(n_bins):
+                    if cum + hist[b] > rank:
+                        r_bin[qi * 2 + j] = b
+                        r_off[qi * 2 + j] = rank - cum
+                        break
+                    cum += hist[b]
+
+        # Pass 3: gather members of the needed bins, then sort just those
+        slot_of_bin = np.full(n_bins, -1, dtype=np.int64)
+        n_slots = 0
+        for i in range(n_r):
+            if slot_of_bin[r_bin[i]] < 0:
+                slot_of_bin[r_bin[i]] = n_slots
+                n_slots += 1
+        slot_start = np.zeros(n_slots + 1, dtype=np.int64)
+        for b in range(n_bins):
+            if slot_of_bin[b] >= 0:
+                slot_start[slot_of_bin[b] + 1] = hist[b]
+        for i in range(n_slots):
+            slot_start[i + 1] += slot_start[i]
+        members = np.empty(slot_start[n_slots], dtype=img.dtype)
+        fill = slot_start[:n_slots].copy()
+        for y in range(h):
+            for x in range(w):
+                v = img[y, x, ch]
+                if v == v:
+                    s = slot_of_bin[min(n_bins - 1, int((v - v_min) * scale))]
+                    if s >= 0:
+                        members[fill[s]] = v
+                        fill[s] += 1
+        for i in range(n_slots):
+            members[slot_start[i] : slot_start[i + 1]].sort()
+
+        for i in range(n_r):
+            s = slot_of_bin[r_bin[i]]
+            out[ch, i // 2, i % 2] = members[slot_start[s] + r_off[i]]
+
+    return out
+
+
+def _percentiles_log(image: ImageBuffer, percentiles: Tuple[float, ...], epsilon: float) -> np.ndarray:
+    """
+    np.percentile(np.log10(np.clip(image, epsilon, 1.0)), p) per channel, as (3, len(percentiles)).
+    Clip and log10 are monotonic, so order statistics are taken on the raw values and only
+    the selected neighbours are transformed and interpolated (numpy's 'linear' method).
+    """
+    q = np.array(percentiles, dtype=np.float64) / 100.0
+    stats = _channel_order_stats_jit(image, q, 4096, max(1, min(image.shape[0], get_num_threads())))
+    logs = np.log10(np.clip(stats, epsilon, 1.0))
 
-    for y in prange(h):
-        for x in range(w):
-            for ch in range(3):
-                f = floors[ch]
-                c_val = ceils[ch]
-                delta = c_val - f
-
-                denom = delta
-                if abs(delta) < epsilon:
-                    if delta >= 0:
-                        denom = epsilon
-                    else:
-                        denom = -epsilon
-
-                norm = (img_log[y, x, ch] - f) / denom
-                if norm < 0.0:
-                    norm = 0.0
-                elif norm > 1.0:
-                    norm = 1.0
-                res[y, x, ch] = norm
-    return res
+    n = image.shape[0] * image.shape[1]
+    t = (n - 1) * q - np.floor((n - 1) * q)
+    return np.asarray(logs[:, :, 0] + (logs[:, :, 1] - logs[:, :, 0]) * t)
 
 
 class LogNegativeBounds:
@@ -66,14 +174,42 @@ def get_analysis_crop(img: ImageBuffer, buffer_ratio: float) -> ImageBuffer:
     return img[cut_h : h - cut_h, cut_w : w - cut_w]
 
 
+def _stretch_params(bounds: LogNegativeBounds) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-channel floors and reciprocal ranges for the log stretch.
+    Supports both f < c (Negative) and f > c (Positive) mapping; near-zero ranges
+    are clamped to +/-epsilon keeping their sign.
+    """
+    epsilon = 1e-6
+    floors = np.array(bounds.floors, dtype=np.float32)
+    delta = np.array(bounds.ceils, dtype=np.float32) - floors
+    sign = np.where(delta >= 0, np.float32(1.0), np.float32(-1.0))
+    denom = np.where(np.abs(delta) < epsilon, sign * np.float32(epsilon), delta)
+    return floors, (np.float32(1.0) / denom).astype(np.float32)
+
+
 def normalize_log_image(img_log: ImageBuffer, bounds: LogNegativeBounds) -> ImageBuffer:
     """
     Stretches log-data to fit [0, 1].
     """
-    floors = np.ascontiguousarray(np.array(bounds.floors, dtype=np.float32))
-    ceils = np.ascontiguousarray(np.array(bounds.ceils, dtype=np.float32))
+    floors, scales = _stretch_params(bounds)
+    img_log = ensure_contiguous(img_log)
+
+    return ensure_image(_normalize_log_image_jit(img_log, floors, scales, np.empty_like(img_log)))
+
+
+def normalize_linear_image(image: ImageBuffer, bounds: LogNegativeBounds, epsilon: float = 1e-6) -> ImageBuffer:
+    """
+    Equivalent to normalize_log_image(np.log10(np.clip(image, epsilon, 1.0)), bounds),
+    with the clip, log and stretch all working in one buffer.
+    """
+    floors, scales = _stretch_params(bounds)
 
-    return ensure_image(_normalize_log_image_jit(np.ascontiguousarray(img_log.astype(np.float32)), floors, ceils))
+    buf = np.empty(image.shape, dtype=np.float32)
+    np.clip(image, epsilon, 1.0, out=buf)
+    np.log10(buf, out=buf)
+
+    return ensure_image(_normalize_log_image_jit(buf, floors, scales, buf))
 
 
 def analyze_log_exposure_bounds(
@@ -87,14 +223,14 @@ def analyze_log_exposure_bounds(
     Performs full analysis pass on a linear image to find density floors/ceils.
     """
     epsilon = 1e-6
-    img_log = np.log10(np.clip(image, epsilon, 1.0))
+    img_view = image
 
     if roi:
         y1, y2, x1, x2 = roi
-        img_log = img_log[y1:y2, x1:x2]
+        img_view = img_view[y1:y2, x1:x2]
 
     if analysis_buffer > 0:
-        img_log = get_analysis_crop(img_log, analysis_buffer)
+        img_view = get_analysis_crop(img_view, analysis_buffer)
 
     p_low, p_high = 0.5, 99.5
     fixed_range = 3.0
@@ -103,18 +239,11 @@ def analyze_log_exposure_bounds(
         p_low, p_high = 99.9, 0.01
         fixed_range = -3.0
 
-    floors = []
-    ceils = []
-    for ch in range(3):
-        data = img_log[:, :, ch]
-        f = np.percentile(data, p_low)
-        floors.append(float(f))
-
-        if process_mode != ProcessMode.E6 or e6_normalize:
-            c = np.percentile(data, p_high)
-            ceils.append(float(c))
-        else:
-            ceils.append(float(f + fixed_range))
+    use_ceils = process_mode != ProcessMode.E6 or e6_normalize
+    pct = _percentiles_log(img_view, (p_low, p_high) if use_ceils else (p_low,), epsilon)
+
+    floors = [float(pct[ch, 0]) for ch in range(3)]
+    ceils = [float(pct[ch, 1]) if use_ceils else floors[ch] + fixed_range for ch in range(3)]
 
     return LogNegativeBounds(
         (floors[0], floors[1], floors[2]),
@@ -1,12 +1,11 @@
-import numpy as np
 from negpy.domain.interfaces import PipelineContext
 from negpy.domain.types import ImageBuffer
 from negpy.features.exposure.models import ExposureConfig, EXPOSURE_CONSTANTS
 from negpy.features.process.models import ProcessConfig, ProcessMode
 from negpy.features.exposure.logic import apply_characteristic_curve
-from negpy.kernel.image.logic import get_luminance
+from negpy.kernel.image.logic import greyscale_inplace
 from negpy.features.exposure.normalization import (
-    normalize_log_image,
+    normalize_linear_image,
     analyze_log_exposure_bounds,
     LogNegativeBounds,
 )
@@ -22,9 +21,6 @@ class NormalizationProcessor:
         self.config = config
 
     def process(self, image: ImageBuffer, context: PipelineContext) -> ImageBuffer:
-        epsilon = 1e-6
-        img_log = np.log10(np.clip(image, epsilon, 1.0))
-
         if self.config.use_roll_average and self.config.is_locked_initialized:
             bounds = LogNegativeBounds(floors=self.config.locked_floors, ceils=self.config.locked_ceils)
         elif self.config.is_local_initialized:
@@ -74,7 +70,7 @@ class NormalizationProcessor:
             )
             bounds = LogNegativeBounds(floors=adj_floors, ceils=adj_ceils)
 
-        res = normalize_log_image(img_log, bounds)
+        res = normalize_linear_image(image, bounds)
 
         cast = (0.0, 0.0, 0.0)
         if self.config.shadow_cast_strength > 0:
@@ -150,8 +146,7 @@ class PhotometricProcessor:
         )
 
         if context.process_mode == ProcessMode.BW:
-            res = get_luminance(img_pos)
-            res = np.stack([res, res, res], axis=-1)
-            return res
+            # img_pos is a fresh kernel output, safe to overwrite
+            return greyscale_inplace(img_pos)
 
         return img_pos
@@ -1,14 +1,66 @@
 import numpy as np
+from numba import njit, prange  # type: ignore
 from negpy.domain.types import ImageBuffer
-from negpy.kernel.image.validation import ensure_image
+from negpy.kernel.image.validation import ensure_contiguous, ensure_image
+
+
+@njit(parallel=True, cache=True)
+def _shadow_cast_sums_jit(image: np.ndarray, threshold: float) -> tuple[float, float, float, int]:
+    """
+    Per-channel sums and count of pixels whose channel mean exceeds threshold, in one pass.
+    """
+    h, w, c = image.shape
+    sum_r = 0.0
+    sum_g = 0.0
+    sum_b = 0.0
+    count = 0
+    for y in prange(h):
+        for x in range(w):
+            r = image[y, x, 0]
+            g = image[y, x, 1]
+            b = image[y, x, 2]
+            if (r + g + b) / 3.0 > threshold:
+                sum_r += r
+                sum_g += g
+                sum_b += b
+                count += 1
+    return sum_r, sum_g, sum_b, count
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _apply_shadow_cast_jit(image: np.ndarray, cv_r: float, cv_g: float, cv_b: float, strength: float, out: np.ndarray) -> np.ndarray:
+    """
+    image + cv * mean(image) ** 1.5 * strength, clipped to [0, 1], in one pass.
+    """
+    h, w, c = image.shape
+    src = image.reshape(h * w, c)
+    dst = out.reshape(h * w, c)
+    zero = np.float32(0.0)
+    one = np.float32(1.0)
+    third = np.float32(1.0 / 3.0)
+    k_r = np.float32(cv_r * strength)
+    k_g = np.float32(cv_g * strength)
+    k_b = np.float32(cv_b * strength)
+
+    for i in prange(h * w):
+        r = src[i, 0]
+        g = src[i, 1]
+        b = src[i, 2]
+        # Clamped so sqrt never sees a negative mean (fastmath assumes no NaNs)
+        d = max((r + g + b) * third, zero)
+        # d ** 1.5 without pow
+        d15 = d * np.sqrt(d)
+        dst[i, 0] = min(max(r + k_r * d15, zero), one)
+        dst[i, 1] = min(max(g + k_g * d15, zero), one)
+        dst[i, 2] = min(max(b + k_b * d15, zero), one)
+    return out
 
 
 def analyze_shadow_cast(image: ImageBuffer, threshold: float = 0.75) -> tuple[float, float, float]:
-    density = np.mean(image, axis=-1)
-    mask = density > threshold
+    sum_r, sum_g, sum_b, count = _shadow_cast_sums_jit(image, float(threshold))
 
-    if np.any(mask):
-        avg_rgb = np.mean(image[mask], axis=0)
+    if count > 0:
+        avg_rgb = np.array((sum_r, sum_g, sum_b)) / count
         target_density = np.mean(avg_rgb)
         correction_vector = target_density - avg_rgb
         return (float(correction_vector[0]), float(correction_vector[1]), float(correction_vector[2]))
@@ -20,9 +72,8 @@ def apply_shadow_cast_correction(image: ImageBuffer, correction_vector: tuple[fl
     if strength <= 0:
         return image
 
-    density = np.mean(image, axis=-1, keepdims=True)
-    cv = np.array(correction_vector, dtype=np.float32)
-    correction = cv * (density**1.5) * strength
-    corrected_image = image + correction
+    image = ensure_contiguous(image)
+    cv_r, cv_g, cv_b = correction_vector
+    res = _apply_shadow_cast_jit(image, float(cv_r), float(cv_g), float(cv_b), float(strength), np.empty_like(image))
 
-    return ensure_image(np.clip(corrected_image, 0.0, 1.0))
+    return ensure_image(res)
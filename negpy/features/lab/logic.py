@@ -1,36 +1,37 @@
 import numpy as np
 import cv2
 from numba import njit, prange  # type: ignore
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from negpy.domain.types import ImageBuffer
-from negpy.kernel.image.validation import ensure_image
+from negpy.kernel.image.validation import ensure_contiguous, ensure_image
 
 
-@njit(parallel=True, cache=True, fastmath=True)
-def _apply_spectral_crosstalk_jit(img_dens: np.ndarray, applied_matrix: np.ndarray) -> np.ndarray:
+@njit("f4[:, :, ::1](f4[:, :, ::1], f4[:, ::1], f4[:, :, ::1])", parallel=True, cache=True, fastmath=True)
+def _apply_spectral_crosstalk_jit(img_dens: np.ndarray, applied_matrix: np.ndarray, res: np.ndarray) -> np.ndarray:
     """
-    3x3 Matrix multiplication.
+    3x3 Matrix multiplication. `res` may alias `img_dens` (each pixel is read before it is written).
     """
     h, w, c = img_dens.shape
-    res = np.empty_like(img_dens)
-    for y in prange(h):
-        for x in range(w):
-            r = img_dens[y, x, 0]
-            g = img_dens[y, x, 1]
-            b = img_dens[y, x, 2]
-            res[y, x, 0] = r * applied_matrix[0, 0] + g * applied_matrix[0, 1] + b * applied_matrix[0, 2]
-            res[y, x, 1] = r * applied_matrix[1, 0] + g * applied_matrix[1, 1] + b * applied_matrix[1, 2]
-            res[y, x, 2] = r * applied_matrix[2, 0] + g * applied_matrix[2, 1] + b * applied_matrix[2, 2]
+    src = img_dens.reshape(h * w, c)
+    dst = res.reshape(h * w, c)
+    m00, m01, m02 = applied_matrix[0, 0], applied_matrix[0, 1], applied_matrix[0, 2]
+    m10, m11, m12 = applied_matrix[1, 0], applied_matrix[1, 1], applied_matrix[1, 2]
+    m20, m21, m22 = applied_matrix[2, 0], applied_matrix[2, 1], applied_matrix[2, 2]
+
+    for i in prange(h * w):
+        r = src[i, 0]
+        g = src[i, 1]
+        b = src[i, 2]
+        dst[i, 0] = r * m00 + g * m01 + b * m02
+        dst[i, 1] = r * m10 + g * m11 + b * m12
+        dst[i, 2] = r * m20 + g * m21 + b * m22
     return res
 
 
-def apply_spectral_crosstalk(img_dens: ImageBuffer, strength: float, matrix: Optional[List[float]]) -> ImageBuffer:
+def _crosstalk_matrix(strength: float, matrix: List[float]) -> np.ndarray:
     """
-    Mixes channels using calibration matrix.
+    Blends the calibration matrix with identity and row-normalizes it.
     """
-    if strength == 0.0 or matrix is None:
-        return img_dens
-
     cal_matrix = np.array(matrix).reshape(3, 3)
     identity = np.eye(3)
 
@@ -38,93 +39,136 @@ def apply_spectral_crosstalk(img_dens: ImageBuffer, strength: float, matrix: Opt
 
     row_sums = np.sum(applied_matrix, axis=1, keepdims=True)
     applied_matrix = applied_matrix / np.maximum(row_sums, 1e-6)
+    return np.ascontiguousarray(applied_matrix.astype(np.float32))
 
-    res = _apply_spectral_crosstalk_jit(
-        np.ascontiguousarray(img_dens.astype(np.float32)),
-        np.ascontiguousarray(applied_matrix.astype(np.float32)),
-    )
+
+def apply_spectral_crosstalk(img_dens: ImageBuffer, strength: float, matrix: Optional[List[float]]) -> ImageBuffer:
+    """
+    Mixes channels using calibration matrix.
+    """
+    if strength == 0.0 or matrix is None:
+        return img_dens
+
+    img_dens = ensure_contiguous(img_dens)
+    res = _apply_spectral_crosstalk_jit(img_dens, _crosstalk_matrix(strength, matrix), np.empty_like(img_dens))
 
     return ensure_image(res)
 
 
-def apply_clahe(img: ImageBuffer, strength: float, scale_factor: float = 1.0) -> ImageBuffer:
+def apply_spectral_crosstalk_linear(img: ImageBuffer, strength: float, matrix: Optional[List[float]], epsilon: float = 1e-6) -> ImageBuffer:
     """
-    L-channel Contrast Limited Adaptive Histogram Equalization.
+    Equivalent to 10 ** -apply_spectral_crosstalk(-log10(clip(img, epsilon, 1)), ...),
+    with every step working in one buffer.
     """
-    if strength <= 0:
+    if strength == 0.0 or matrix is None:
         return img
 
-    lab = cv2.cvtColor(img, cv2.COLOR_RGB2LAB)
-    l_chan, a, b = cv2.split(lab)
+    # The mix is linear, so both density negations cancel: 10 ** mix(log10(x))
+    buf = np.empty(img.shape, dtype=np.float32)
+    np.clip(img, epsilon, 1.0, out=buf)
+    np.log10(buf, out=buf)
+    _apply_spectral_crosstalk_jit(buf, _crosstalk_matrix(strength, matrix), buf)
+    np.multiply(buf, np.float32(np.log(10.0)), out=buf)
+    np.exp(buf, out=buf)
 
-    l_u16 = (l_chan * (65535.0 / 100.0)).astype(np.uint16)
+    return ensure_image(buf)
 
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _l_to_u16_jit(l_chan: np.ndarray) -> np.ndarray:
+    """
+    Quantizes LAB lightness (0-100) to the full uint16 range.
+    """
+    h, w = l_chan.shape
+    res = np.empty((h, w), dtype=np.uint16)
+    scale = np.float32(65535.0 / 100.0)
+    for y in prange(h):
+        for x in range(w):
+            v = l_chan[y, x] * scale
+            if v < 0.0:
+                v = 0.0
+            elif v > 65535.0:
+                v = 65535.0
+            res[y, x] = np.uint16(v)
+    return res
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _blend_u16_l_jit(l_chan: np.ndarray, l_enhanced: np.ndarray, strength: float) -> np.ndarray:
+    """
+    In-place l * (1 - s) + dequantize(enhanced) * s.
+    """
+    h, w = l_chan.shape
+    keep = np.float32(1.0 - strength)
+    gain = np.float32(strength * 100.0 / 65535.0)
+    for y in prange(h):
+        for x in range(w):
+            l_chan[y, x] = l_chan[y, x] * keep + np.float32(l_enhanced[y, x]) * gain
+    return l_chan
+
+
+def _clahe_l(l_chan: np.ndarray, strength: float, scale_factor: float) -> np.ndarray:
+    """
+    CLAHE on a LAB lightness plane (0-100), blended by strength.
+    Overwrites l_chan.
+    """
     clip_limit = strength * 2.5
     grid_dim = max(2, int(8 * scale_factor))
     clahe = cv2.createCLAHE(clipLimit=clip_limit, tileGridSize=(grid_dim, grid_dim))
-    l_enhanced_u16 = clahe.apply(l_u16)
+    l_enhanced_u16 = clahe.apply(_l_to_u16_jit(l_chan))
 
-    l_enhanced = l_enhanced_u16.astype(np.float32) * (100.0 / 65535.0)
+    return ensure_image(_blend_u16_l_jit(l_chan, l_enhanced_u16, float(strength)))
 
-    l_final = l_chan * (1.0 - strength) + l_enhanced * strength
 
-    lab_enhanced = cv2.merge([l_final, a, b])
-    res = cv2.cvtColor(lab_enhanced, cv2.COLOR_LAB2RGB)
-
-    return ensure_image(np.clip(res, 0.0, 1.0))
+def apply_clahe(img: ImageBuffer, strength: float, scale_factor: float = 1.0) -> ImageBuffer:
+    """
+    L-channel Contrast Limited Adaptive Histogram Equalization.
+    """
+    return apply_lab_adjustments(img, clahe_strength=strength, scale_factor=scale_factor)
 
 
-@njit(parallel=True, cache=True, fastmath=True)
-def _apply_unsharp_mask_jit(l_chan: np.ndarray, l_blur: np.ndarray, amount: float, threshold: float) -> np.ndarray:
+@njit("f4[:, ::1](f4[:, ::1], f4[:, ::1], f4, f4, f4[:, ::1])", parallel=True, cache=True, fastmath=True)
+def _apply_unsharp_mask_jit(l_chan: np.ndarray, l_blur: np.ndarray, amount: float, threshold: float, res: np.ndarray) -> np.ndarray:
     """
     USM Kernel (Orig + (Orig - Blur) * Amount).
+    res may alias l_blur.
     """
     h, w = l_chan.shape
-    res = np.empty((h, w), dtype=np.float32)
-    amount_f = amount * 2.5
-
-    for y in prange(h):
-        for x in range(w):
-            orig = l_chan[y, x]
-            blur = l_blur[y, x]
-            diff = orig - blur
-            if abs(diff) > threshold:
-                val = orig + diff * amount_f
-                if val < 0.0:
-                    val = 0.0
-                elif val > 100.0:
-                    val = 100.0
-                res[y, x] = val
-            else:
-                res[y, x] = orig
+    src = l_chan.reshape(h * w)
+    blurred = l_blur.reshape(h * w)
+    dst = res.reshape(h * w)
+    amount_f = np.float32(amount * 2.5)
+    lo = np.float32(0.0)
+    hi = np.float32(100.0)
+
+    for i in prange(h * w):
+        orig = src[i]
+        diff = orig - blurred[i]
+        if abs(diff) > threshold:
+            dst[i] = min(max(orig + diff * amount_f, lo), hi)
+        else:
+            dst[i] = orig
     return res
 
 
-def apply_output_sharpening(img: ImageBuffer, amount: float, scale_factor: float = 1.0) -> ImageBuffer:
+def _sharpen_l(l_chan: np.ndarray, amount: float, scale_factor: float) -> np.ndarray:
     """
-    LAB Lightness sharpening.
+    Unsharp mask on a LAB lightness plane.
     """
-    if amount <= 0:
-        return img
-
-    lab = cv2.cvtColor(img.astype(np.float32), cv2.COLOR_RGB2LAB)
-    l_chan, a, b = cv2.split(lab)
-
     k_size = max(3, int(5 * scale_factor) | 1)
     sigma = 1.0 * scale_factor
+    l_chan = np.ascontiguousarray(l_chan)
     l_blur = cv2.GaussianBlur(l_chan, (k_size, k_size), sigma)
 
-    l_sharpened = _apply_unsharp_mask_jit(
-        np.ascontiguousarray(l_chan),
-        np.ascontiguousarray(l_blur),
-        float(amount),
-        2.0,
-    )
+    # The blur plane is dead once read, so the sharpened values overwrite it
+    return ensure_image(_apply_unsharp_mask_jit(l_chan, l_blur, float(amount), 2.0, l_blur))
 
-    res_lab = cv2.merge([l_sharpened, a, b])
-    res_rgb = cv2.cvtColor(res_lab, cv2.COLOR_LAB2RGB)
 
-    return ensure_image(np.clip(res_rgb, 0.0, 1.0))
+def apply_output_sharpening(img: ImageBuffer, amount: float, scale_factor: float = 1.0) -> ImageBuffer:
+    """
+    LAB Lightness sharpening.
+    """
+    return apply_lab_adjustments(img, sharpen=amount, scale_factor=scale_factor)
 
 
 def apply_saturation(img: ImageBuffer, saturation: float) -> ImageBuffer:
@@ -134,55 +178,89 @@ def apply_saturation(img: ImageBuffer, saturation: float) -> ImageBuffer:
     if saturation == 1.0:
         return img
 
-    hsv = cv2.cvtColor(img.astype(np.float32), cv2.COLOR_RGB2HSV)
-    hsv[:, :, 1] = hsv[:, :, 1] * saturation
-    hsv[:, :, 1] = np.clip(hsv[:, :, 1], 0.0, 1.0)
+    hsv = cv2.cvtColor(ensure_contiguous(img), cv2.COLOR_RGB2HSV)
+    sat = hsv[:, :, 1]
+    np.multiply(sat, np.float32(saturation), out=sat)
+    np.clip(sat, 0.0, 1.0, out=sat)
 
-    res = cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB)
-    return ensure_image(np.clip(res, 0.0, 1.0))
+    res = cv2.cvtColor(hsv, cv2.COLOR_HSV2RGB, dst=hsv)
+    return ensure_image(np.clip(res, 0.0, 1.0, out=res))
 
 
-def apply_chroma_denoise(img: ImageBuffer, radius: float, scale_factor: float = 1.0) -> ImageBuffer:
+def _chroma_denoise_ab(a: np.ndarray, b: np.ndarray, radius: float, scale_factor: float) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Smooths A and B channels in LAB space to reduce color noise.
+    Gaussian smoothing of the LAB chroma planes.
     """
-    if radius <= 0:
-        return img
-
-    lab = cv2.cvtColor(img.astype(np.float32), cv2.COLOR_RGB2LAB)
-    l_chan, a, b = cv2.split(lab)
-
     k_radius = radius * scale_factor
     k_size = max(3, int(k_radius * 2 + 1) | 1)
     sigma = k_radius
 
-    a_blur = cv2.GaussianBlur(a, (k_size, k_size), sigma)
-    b_blur = cv2.GaussianBlur(b, (k_size, k_size), sigma)
-
-    res_lab = cv2.merge([l_chan, a_blur, b_blur])
-    res_rgb = cv2.cvtColor(res_lab, cv2.COLOR_LAB2RGB)
-
-    return ensure_image(np.clip(res_rgb, 0.0, 1.0))
+    return cv2.GaussianBlur(a, (k_size, k_size), sigma), cv2.GaussianBlur(b, (k_size, k_size), sigma)
 
 
-def apply_vibrance(img: ImageBuffer, strength: float) -> ImageBuffer:
+def apply_chroma_denoise(img: ImageBuffer, radius: float, scale_factor: float = 1.0) -> ImageBuffer:
     """
-    Selectively boosts saturation of muted colors in LAB space.
+    Smooths A and B channels in LAB space to reduce color noise.
     """
-    if strength == 1.0:
-        return img
+    return apply_lab_adjustments(img, chroma_denoise=radius, scale_factor=scale_factor)
 
-    lab = cv2.cvtColor(img.astype(np.float32), cv2.COLOR_RGB2LAB)
-    l_chan, a, b = cv2.split(lab)
 
+def _vibrance_ab(a: np.ndarray, b: np.ndarray, strength: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Boosts low-chroma A/B values more than saturated ones.
+    """
     chroma = np.sqrt(a**2 + b**2)
     muted_mask = np.clip(1.0 - (chroma / 60.0), 0.0, 1.0)
 
     boost = (strength - 1.0) * muted_mask
-    a_new = a * (1.0 + boost)
-    b_new = b * (1.0 + boost)
+    return a * (1.0 + boost), b * (1.0 + boost)
 
-    res_lab = cv2.merge([l_chan, a_new, b_new])
-    res_rgb = cv2.cvtColor(res_lab, cv2.COLOR_LAB2RGB)
 
-    return ensure_image(np.clip(res_rgb, 0.0, 1.0))
+def apply_vibrance(img: ImageBuffer, strength: float) -> ImageBuffer:
+    """
+    Selectively boosts saturation of muted colors in LAB space.
+    """
+    return apply_lab_adjustments(img, vibrance=strength)
+
+
+def apply_lab_adjustments(
+    img: ImageBuffer,
+    chroma_denoise: float = 0.0,
+    vibrance: float = 1.0,
+    clahe_strength: float = 0.0,
+    sharpen: float = 0.0,
+    scale_factor: float = 1.0,
+) -> ImageBuffer:
+    """
+    Runs the enabled LAB-space effects (chroma denoise -> vibrance -> CLAHE -> sharpening)
+    within a single RGB -> LAB -> RGB conversion.
+    """
+    do_ab = chroma_denoise > 0 or vibrance != 1.0
+    do_l = clahe_strength > 0 or sharpen > 0
+    if not (do_ab or do_l):
+        return img
+
+    lab = cv2.cvtColor(ensure_contiguous(img), cv2.COLOR_RGB2LAB)
+
+    # Only the planes that get modified are pulled out and written back;
+    # a full split/merge costs several times more than the channel copies.
+    if do_ab:
+        a, b = cv2.extractChannel(lab, 1), cv2.extractChannel(lab, 2)
+        if chroma_denoise > 0:
+            a, b = _chroma_denoise_ab(a, b, chroma_denoise, scale_factor)
+        if vibrance != 1.0:
+            a, b = _vibrance_ab(a, b, vibrance)
+        cv2.insertChannel(a, lab, 1)
+        cv2.insertChannel(b, lab, 2)
+
+    if do_l:
+        l_chan = cv2.extractChannel(lab, 0)
+        if clahe_strength > 0:
+            l_chan = _clahe_l(l_chan, clahe_strength, scale_factor)
+        if sharpen > 0:
+            l_chan = _sharpen_l(l_chan, sharpen, scale_factor)
+        cv2.insertChannel(l_chan, lab, 0)
+
+    res_rgb = cv2.cvtColor(lab, cv2.COLOR_LAB2RGB, dst=lab)
+
+    return ensure_image(np.clip(res_rgb, 0.0, 1.0, out=res_rgb))
@@ -4,12 +4,9 @@ from negpy.domain.types import ImageBuffer
 from negpy.features.process.models import ProcessMode
 from negpy.features.lab.models import LabConfig
 from negpy.features.lab.logic import (
-    apply_spectral_crosstalk,
-    apply_clahe,
-    apply_output_sharpening,
+    apply_spectral_crosstalk_linear,
+    apply_lab_adjustments,
     apply_saturation,
-    apply_chroma_denoise,
-    apply_vibrance,
 )
 
 
@@ -22,14 +19,17 @@ class PhotoLabProcessor:
         Apply effects from logic.py in sequence
         """
         img = image
+        scale = context.scale_factor
 
-        if self.config.chroma_denoise > 0:
-            img = apply_chroma_denoise(img, self.config.chroma_denoise, context.scale_factor)
+        # LAB effects that are adjacent in the chain share one LAB round trip;
+        # the RGB-space steps (crosstalk, saturation) flush what is pending.
+        chroma_denoise = self.config.chroma_denoise
+        vibrance = self.config.vibrance
 
         c_strength = max(0.0, self.config.color_separation - 1.0)
         if c_strength > 0:
-            epsilon = 1e-6
-            img_dens = -np.log10(np.clip(img, epsilon, 1.0))
+            img = apply_lab_adjustments(img, chroma_denoise=chroma_denoise, scale_factor=scale)
+            chroma_denoise = 0.0
 
             matrix = self.config.crosstalk_matrix
             if matrix is None:
@@ -38,19 +38,23 @@ class PhotoLabProcessor:
                 else:
                     matrix = self.config.C41_MATRIX
 
-            img_dens = apply_spectral_crosstalk(img_dens, c_strength, matrix)
-            img = np.power(10.0, -img_dens)
-
-        if self.config.vibrance != 1.0:
-            img = apply_vibrance(img, self.config.vibrance)
+            img = apply_spectral_crosstalk_linear(img, c_strength, matrix)
 
         if self.config.saturation != 1.0:
+            img = apply_lab_adjustments(img, chroma_denoise=chroma_denoise, vibrance=vibrance, scale_factor=scale)
+            chroma_denoise, vibrance = 0.0, 1.0
             img = apply_saturation(img, self.config.saturation)
 
-        if self.config.clahe_strength > 0:
-            img = apply_clahe(img, self.config.clahe_strength, context.scale_factor)
-
-        if self.config.sharpen > 0:
-            img = apply_output_sharpening(img, self.config.sharpen, context.scale_factor)
-
-        return np.clip(img, 0, 1)
+        img = apply_lab_adjustments(
+            img,
+            chroma_denoise=chroma_denoise,
+            vibrance=vibrance,
+            clahe_strength=self.config.clahe_strength,
+            sharpen=self.config.sharpen,
+            scale_factor=scale,
+        )
+
+        if img is image:
+            return np.clip(img, 0, 1)
+        # img is a scratch buffer owned by this stage; clamp it without another allocation
+        return np.clip(img, 0, 1, out=img)
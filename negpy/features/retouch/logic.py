@@ -3,7 +3,7 @@ import cv2
 from numba import njit, prange  # type: ignore
 from typing import List, Tuple
 from negpy.domain.types import ImageBuffer, LUMA_R, LUMA_G, LUMA_B
-from negpy.kernel.image.validation import ensure_image
+from negpy.kernel.image.validation import ensure_contiguous, ensure_image
 from negpy.kernel.image.logic import get_luminance
 
 
@@ -173,10 +173,10 @@ def apply_dust_removal(
         w_std_gray = np.sqrt(np.clip(cv2.blur(gray**2, (w_win, w_win)) - w_mean_gray**2, 0, None))
 
         img = _apply_auto_retouch_jit(
-            np.ascontiguousarray(img.astype(np.float32)),
-            np.ascontiguousarray(mean_gray.astype(np.float32)),
-            np.ascontiguousarray(std_gray.astype(np.float32)),
-            np.ascontiguousarray(w_std_gray.astype(np.float32)),
+            ensure_contiguous(img),
+            ensure_contiguous(mean_gray),
+            ensure_contiguous(std_gray),
+            ensure_contiguous(w_std_gray),
             float(dust_threshold),
             float(dust_size),
             float(scale_factor),
@@ -201,10 +201,10 @@ def apply_dust_removal(
 
         img = ensure_image(
             _apply_inpainting_grain_jit(
-                np.ascontiguousarray(img.astype(np.float32)),
-                np.ascontiguousarray(img_inpainted_u8.astype(np.float32)),
-                np.ascontiguousarray(mask_final.astype(np.float32)),
-                np.ascontiguousarray(noise_arr.astype(np.float32)),
+                ensure_contiguous(img),
+                ensure_contiguous(img_inpainted_u8),
+                ensure_contiguous(mask_final),
+                ensure_contiguous(noise_arr),
             )
         )
 
@@ -2,7 +2,7 @@ import numpy as np
 from numba import njit, prange  # type: ignore
 from typing import Dict
 from negpy.domain.types import ImageBuffer, LUMA_R, LUMA_G, LUMA_B
-from negpy.kernel.image.validation import ensure_image
+from negpy.kernel.image.validation import ensure_contiguous, ensure_image
 from negpy.features.toning.models import PaperSubstrate, PaperProfileName
 
 
@@ -85,7 +85,7 @@ def simulate_paper_substrate(img: ImageBuffer, profile_name: str) -> ImageBuffer
 
     return ensure_image(
         _apply_paper_substrate_jit(
-            np.ascontiguousarray(img.astype(np.float32)),
+            ensure_contiguous(img),
             tint,
             float(profile.dmax_boost),
         )
@@ -105,7 +105,7 @@ def apply_chemical_toning(
 
     return ensure_image(
         _apply_chemical_toning_jit(
-            np.ascontiguousarray(img.astype(np.float32)),
+            ensure_contiguous(img),
             float(selenium_strength),
             float(sepia_strength),
         )
@@ -1,5 +1,5 @@
 import os
-from typing import List, Set
+from typing import AbstractSet, FrozenSet, List
 from negpy.infrastructure.loaders.constants import SUPPORTED_RAW_EXTENSIONS
 
 
@@ -8,27 +8,29 @@ class FolderWatchService:
     Scans for new RAW/TIFF assets.
     """
 
-    SUPPORTED_EXTS = SUPPORTED_RAW_EXTENSIONS
+    SUPPORTED_EXTS: FrozenSet[str] = frozenset(SUPPORTED_RAW_EXTENSIONS)
 
     @classmethod
-    def scan_for_new_files(cls, folder_path: str, existing_paths: Set[str]) -> List[str]:
+    def scan_for_new_files(cls, folder_path: str, existing_paths: AbstractSet[str]) -> List[str]:
         """
         Shallow scan for unindexed files.
+        Relies on readdir type info (DirEntry.is_file) so regular files need no extra stat().
         """
-        if not os.path.exists(folder_path):
-            return []
+        folder_path = os.path.abspath(folder_path)
+        exts = cls.SUPPORTED_EXTS
 
         new_files = []
         try:
             with os.scandir(folder_path) as it:
                 for entry in it:
-                    if entry.is_file():
-                        ext = os.path.splitext(entry.name)[1].lower()
-                        if ext in cls.SUPPORTED_EXTS:
-                            full_path = os.path.abspath(entry.path)
-                            if full_path not in existing_paths:
-                                new_files.append(full_path)
-        except Exception:
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot < 0 or name[dot:].lower() not in exts:
+                        continue
+                    # entry.path is absolute since folder_path is
+                    if entry.path not in existing_paths and entry.is_file():
+                        new_files.append(entry.path)
+        except OSError:
             pass
 
         return new_files
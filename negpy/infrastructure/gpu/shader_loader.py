@@ -9,23 +9,29 @@ class ShaderLoader:
     Reduces pipeline initialization overhead by reusing modules.
     """
 
-    _cache: dict[str, Any] = {}
+    _cache: dict[tuple[str, str], Any] = {}
 
     @classmethod
-    def load(cls, path: str) -> Any:
-        if path in cls._cache:
-            return cls._cache[path]
+    def load(cls, path: str, storage_format: str = "rgba32float") -> Any:
+        """
+        Compiles a shader, optionally retargeting its storage textures to another texel format.
+        """
+        key = (path, storage_format)
+        if key in cls._cache:
+            return cls._cache[key]
 
         if not os.path.exists(path):
             raise FileNotFoundError(f"Shader source missing: {path}")
 
         with open(path, "r") as f:
             code = f.read()
+        if storage_format != "rgba32float":
+            code = code.replace("texture_storage_2d<rgba32float", f"texture_storage_2d<{storage_format}")
 
         gpu = GPUDevice.get()
         if not gpu.device:
             raise RuntimeError("Hardware device required for shader compilation")
 
         module = gpu.device.create_shader_module(code=code)
-        cls._cache[path] = module
+        cls._cache[key] = module
         return module
@@ -1,5 +1,6 @@
 import rawpy
 import numpy as np
+from functools import lru_cache
 from typing import Any
 from negpy.infrastructure.loaders.constants import SUPPORTED_RAW_EXTENSIONS
 
@@ -42,9 +43,11 @@ def get_best_demosaic_algorithm(raw: Any) -> Any:
         return None
 
 
+@lru_cache(maxsize=1)
 def get_supported_raw_wildcards() -> str:
     """
     Returns raw formats as string for file dialogs.
+    The extension set is fixed at import, so the string is built once.
     """
     wildcards = []
     for ext in sorted(SUPPORTED_RAW_EXTENSIONS):
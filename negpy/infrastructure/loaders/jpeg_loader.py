@@ -19,7 +19,7 @@ class JpegLoader(IImageLoader):
             img = img[:, :, :3]
 
         if img.dtype == np.uint8:
-            f32 = uint8_to_float32(np.ascontiguousarray(img))
+            f32 = uint8_to_float32(img)
         else:
             f32 = np.clip(img.astype(np.float32) / 255.0, 0, 1)
 
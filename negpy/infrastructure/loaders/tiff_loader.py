@@ -2,7 +2,7 @@ import numpy as np
 import imageio.v3 as iio
 from typing import Any, ContextManager, Tuple
 from negpy.domain.interfaces import IImageLoader
-from negpy.kernel.image.logic import uint8_to_float32_seq, uint16_to_float32_seq
+from negpy.kernel.image.logic import uint8_to_float32, uint16_to_float32
 from negpy.infrastructure.loaders.helpers import NonStandardFileWrapper
 
 
@@ -19,9 +19,9 @@ class TiffLoader(IImageLoader):
             img = img[:, :, :3]
 
         if img.dtype == np.uint8:
-            f32 = uint8_to_float32_seq(np.ascontiguousarray(img))
+            f32 = uint8_to_float32(img)
         elif img.dtype == np.uint16:
-            f32 = uint16_to_float32_seq(np.ascontiguousarray(img))
+            f32 = uint16_to_float32(img)
         else:
             f32 = np.clip(img.astype(np.float32), 0, 1)
 
@@ -4,7 +4,7 @@ from typing import Any
 import numpy as np
 from numba import njit, prange  # type: ignore
 from negpy.domain.types import LUMA_R, LUMA_G, LUMA_B
-from negpy.kernel.image.validation import ensure_image
+from negpy.kernel.image.validation import ensure_contiguous, ensure_image
 from negpy.kernel.system.logging import get_logger
 
 logger = get_logger(__name__)
@@ -24,6 +24,21 @@ def _get_luminance_jit(img: np.ndarray) -> np.ndarray:
 
 
 @njit(parallel=True, cache=True, fastmath=True)
+def _greyscale_inplace_jit(img: np.ndarray) -> np.ndarray:
+    """
+    Replaces every channel with Rec. 709 luminance.
+    """
+    h, w, _ = img.shape
+    for y in prange(h):
+        for x in range(w):
+            lum = LUMA_R * img[y, x, 0] + LUMA_G * img[y, x, 1] + LUMA_B * img[y, x, 2]
+            img[y, x, 0] = lum
+            img[y, x, 1] = lum
+            img[y, x, 2] = lum
+    return img
+
+
+@njit(parallel=True, cache=True)
 def _to_uint16_jit(img: np.ndarray) -> np.ndarray:
     """
     Scale to uint16 (clips & handles NaNs).
@@ -34,21 +49,13 @@ def _to_uint16_jit(img: np.ndarray) -> np.ndarray:
 
     for i in prange(len(img_flat)):
         val = img_flat[i]
-        if np.isnan(val):
-            v = 0.0
-        else:
-            v = val * 65535.0
-
-        if v < 0.0:
-            v = 0.0
-        elif v > 65535.0:
-            v = 65535.0
-
+        # Select + min/max instead of a branch chain, so the loop stays vectorizable
+        v = 0.0 if np.isnan(val) else min(max(val * 65535.0, 0.0), 65535.0)
         res_flat[i] = np.uint16(v)
     return res
 
 
-@njit(parallel=True, cache=True, fastmath=True)
+@njit(parallel=True, cache=True)
 def _to_uint8_jit(img: np.ndarray) -> np.ndarray:
     """
     Scale to uint8 (clips & handles NaNs).
@@ -59,78 +66,24 @@ def _to_uint8_jit(img: np.ndarray) -> np.ndarray:
 
     for i in prange(len(img_flat)):
         val = img_flat[i]
-        if np.isnan(val):
-            v = 0.0
-        else:
-            v = val * 255.0
-
-        if v < 0.0:
-            v = 0.0
-        elif v > 255.0:
-            v = 255.0
-
+        # Select + min/max instead of a branch chain, so the loop stays vectorizable
+        v = 0.0 if np.isnan(val) else min(max(val * 255.0, 0.0), 255.0)
         res_flat[i] = np.uint8(v)
     return res
 
 
-@njit(parallel=True, cache=True, fastmath=True)
 def uint8_to_float32(img: np.ndarray) -> np.ndarray:
     """
-    Fast JIT conversion from uint8 to float32 [0.0, 1.0].
+    Converts uint8 to float32 [0.0, 1.0] (vectorized ufunc, one pass).
     """
-    h, w, c = img.shape
-    res = np.empty((h, w, c), dtype=np.float32)
-    inv_255 = 1.0 / 255.0
-    for y in prange(h):
-        for x in range(w):
-            for ch in range(3):
-                res[y, x, ch] = np.float32(img[y, x, ch]) * inv_255
-    return res
+    return ensure_image(np.multiply(img, np.float32(1.0 / 255.0), dtype=np.float32))
 
 
-@njit(parallel=True, cache=True, fastmath=True)
 def uint16_to_float32(img: np.ndarray) -> np.ndarray:
     """
-    Fast JIT conversion from uint16 to float32 [0.0, 1.0].
+    Converts uint16 to float32 [0.0, 1.0] (vectorized ufunc, one pass).
     """
-    h, w, c = img.shape
-    res = np.empty((h, w, c), dtype=np.float32)
-    inv_65535 = 1.0 / 65535.0
-    for y in prange(h):
-        for x in range(w):
-            for ch in range(3):
-                res[y, x, ch] = np.float32(img[y, x, ch]) * inv_65535
-    return res
-
-
-@njit(parallel=False, cache=True, fastmath=True)
-def uint8_to_float32_seq(img: np.ndarray) -> np.ndarray:
-    """
-    Fast JIT conversion from uint8 to float32 [0.0, 1.0]. (Sequential)
-    """
-    h, w, c = img.shape
-    res = np.empty((h, w, c), dtype=np.float32)
-    inv_255 = 1.0 / 255.0
-    for y in range(h):
-        for x in range(w):
-            for ch in range(3):
-                res[y, x, ch] = np.float32(img[y, x, ch]) * inv_255
-    return res
-
-
-@njit(parallel=False, cache=True, fastmath=True)
-def uint16_to_float32_seq(img: np.ndarray) -> np.ndarray:
-    """
-    Fast JIT conversion from uint16 to float32 [0.0, 1.0]. (Sequential)
-    """
-    h, w, c = img.shape
-    res = np.empty((h, w, c), dtype=np.float32)
-    inv_65535 = 1.0 / 65535.0
-    for y in range(h):
-        for x in range(w):
-            for ch in range(3):
-                res[y, x, ch] = np.float32(img[y, x, ch]) * inv_65535
-    return res
+    return ensure_image(np.multiply(img, np.float32(1.0 / 65535.0), dtype=np.float32))
 
 
 @njit(parallel=True, cache=True, fastmath=True)
@@ -217,13 +170,13 @@ def float_to_uint_luma(img: np.ndarray, bit_depth: int = 8) -> np.ndarray:
 
 def float_to_uint16(img: np.ndarray) -> np.ndarray:
     """Converts float32 [0,1] buffer to uint16."""
-    res: np.ndarray = _to_uint16_jit(np.ascontiguousarray(img.astype(np.float32)))
+    res: np.ndarray = _to_uint16_jit(ensure_contiguous(img))
     return res
 
 
 def float_to_uint8(img: np.ndarray) -> np.ndarray:
     """Converts float32 [0,1] buffer to uint8."""
-    res: np.ndarray = _to_uint8_jit(np.ascontiguousarray(img.astype(np.float32)))
+    res: np.ndarray = _to_uint8_jit(ensure_contiguous(img))
     return res
 
 
@@ -243,11 +196,52 @@ def get_luminance(img: np.ndarray) -> np.ndarray:
     Calculates relative luminance. Supports (H, W, 3) and (N, 3) arrays.
     """
     if img.ndim == 3:
-        return ensure_image(_get_luminance_jit(np.ascontiguousarray(img.astype(np.float32))))
+        return ensure_image(_get_luminance_jit(ensure_contiguous(img)))
 
     return LUMA_R * img[..., 0] + LUMA_G * img[..., 1] + LUMA_B * img[..., 2]
 
 
+def greyscale_inplace(img: np.ndarray) -> np.ndarray:
+    """
+    Collapses an (H, W, 3) buffer to neutral luminance, overwriting it.
+    """
+    return ensure_image(_greyscale_inplace_jit(img))
+
+
+@njit(cache=True)
+def _histogram4_jit(rgb: np.ndarray, out: np.ndarray) -> None:
+    """
+    R, G, B and Rec. 709 luminance 256-bin histograms over [0, 1] in one pass.
+    Out-of-range and NaN samples are dropped, matching np.histogram.
+    Serial: it runs on the GUI thread, and the workqueue threading layer aborts
+    on concurrent parallel launches from the render worker.
+    """
+    h, w, _ = rgb.shape
+    out[:] = 0
+    for y in range(h):
+        for x in range(w):
+            r = rgb[y, x, 0]
+            g = rgb[y, x, 1]
+            b = rgb[y, x, 2]
+            if r >= 0.0 and r <= 1.0:
+                out[0, min(255, int(r * 256.0))] += 1
+            if g >= 0.0 and g <= 1.0:
+                out[1, min(255, int(g * 256.0))] += 1
+            if b >= 0.0 and b <= 1.0:
+                out[2, min(255, int(b * 256.0))] += 1
+            lum = np.float32(LUMA_R * r + LUMA_G * g + LUMA_B * b)
+            if lum >= 0.0 and lum <= 1.0:
+                out[3, min(255, int(lum * 256.0))] += 1
+
+
+def calculate_histograms(rgb: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Fills a preallocated (4, 256) int32 buffer with R, G, B and luminance counts.
+    """
+    _histogram4_jit(rgb, out)
+    return out
+
+
 def calculate_file_hash(file_path: str) -> str:
     """
     Fingerprint using file size + head/tail samples.
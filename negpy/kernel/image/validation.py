@@ -16,3 +16,12 @@ def ensure_image(arr: Any) -> ImageBuffer:
         arr = arr.astype(np.float32)
 
     return cast(ImageBuffer, arr)
+
+
+def ensure_contiguous(arr: Any) -> ImageBuffer:
+    """
+    Returns a C-contiguous float32 view, copying only when needed.
+    """
+    if isinstance(arr, np.ndarray) and arr.dtype == np.float32 and arr.flags.c_contiguous:
+        return cast(ImageBuffer, arr)
+    return cast(ImageBuffer, np.ascontiguousarray(arr, dtype=np.float32))
@@ -1,6 +1,7 @@
 import os
 import sys
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -26,7 +27,12 @@ def get_default_user_dir() -> str:
     env_path = os.getenv("NEGPY_USER_DIR")
     if env_path:
         return os.path.abspath(env_path)
+    return _detect_documents_user_dir()
 
+
+@lru_cache(maxsize=1)
+def _detect_documents_user_dir() -> str:
+    """Platform lookup (may spawn xdg-user-dir), resolved once per process."""
     docs_dir: Optional[Path] = None
 
     if sys.platform == "win32":
@@ -112,7 +112,8 @@ class DarkroomEngine:
             pipeline_changed,
         )
 
-        context.metrics["retouch_source"] = current_img.copy()
+        # Stage outputs are never written in place downstream, so the cached exposure buffer can be shared
+        context.metrics["retouch_source"] = current_img
 
         def run_retouch(img_in: ImageBuffer, ctx: PipelineContext) -> ImageBuffer:
             return RetouchProcessor(settings.retouch).process(img_in, ctx)
@@ -36,6 +36,7 @@ TILE_HALO = 32
 TILING_THRESHOLD_PX = 12_000_000
 HISTOGRAM_BINS = 256
 METRICS_BUFFER_SIZE = 4096
+PREVIEW_EXPOSURE_FORMAT = "rgba16float"
 
 
 class GPUEngine:
@@ -63,7 +64,7 @@ class GPUEngine:
         self._pipelines: Dict[str, Any] = {}
         self._buffers: Dict[str, GPUBuffer] = {}
         self._sampler: Optional[Any] = None
-        self._tex_cache: Dict[Tuple[int, int, int, str], GPUTexture] = {}
+        self._tex_cache: Dict[Tuple[int, int, int, str, str], GPUTexture] = {}
 
         self._uniform_names = [
             "geometry",
@@ -79,6 +80,7 @@ class GPUEngine:
         self._current_source_hash: Optional[str] = None
         self._last_settings: Optional[WorkspaceConfig] = None
         self._last_scale_factor: float = 1.0
+        self._last_half_precision: bool = False
 
     def _detect_invalidated_stage(self, settings: WorkspaceConfig, scale_factor: float) -> int:
         """
@@ -117,11 +119,11 @@ class GPUEngine:
 
         return 7  # Nothing changed
 
-    def _get_intermediate_texture(self, w: int, h: int, usage: int, label: str) -> GPUTexture:
+    def _get_intermediate_texture(self, w: int, h: int, usage: int, label: str, format: str = "rgba32float") -> GPUTexture:
         """Retrieves or creates a texture from the pool."""
-        key = (w, h, usage, label)
+        key = (w, h, usage, label, format)
         if key not in self._tex_cache:
-            self._tex_cache[key] = GPUTexture(w, h, usage=usage)
+            self._tex_cache[key] = GPUTexture(w, h, format=format, usage=usage)
         return self._tex_cache[key]
 
     def _init_resources(self) -> None:
@@ -136,6 +138,8 @@ class GPUEngine:
 
         for name, path in self._shaders.items():
             self._pipelines[name] = self._create_pipeline(path)
+        # Half-float variant of the H&D pass for previews (FP32 math, FP16 storage)
+        self._pipelines["exposure_f16"] = self._create_pipeline(self._shaders["exposure"], PREVIEW_EXPOSURE_FORMAT)
 
         # Unified Uniform Buffer (UBO)
         self._buffers["unified_u"] = GPUBuffer(
@@ -157,8 +161,8 @@ class GPUEngine:
 
         logger.info("GPU Engine: Hardware resources initialized")
 
-    def _create_pipeline(self, shader_path: str) -> Any:
-        shader_module = ShaderLoader.load(shader_path)
+    def _create_pipeline(self, shader_path: str, storage_format: str = "rgba32float") -> Any:
+        shader_module = ShaderLoader.load(shader_path, storage_format)
         assert self.gpu.device is not None
         return self.gpu.device.create_compute_pipeline(layout="auto", compute={"module": shader_module, "entry_point": "main"})
 
@@ -196,9 +200,11 @@ class GPUEngine:
         render_size_ref: Optional[float] = None,
         source_hash: Optional[str] = None,
         readback_metrics: bool = True,
+        half_precision: bool = False,
     ) -> Tuple[Any, Dict[str, Any]]:
         """
         Executes the full pipeline, returning a GPU texture and associated metrics.
+        half_precision stores the characteristic curve output as FP16 (preview only).
         """
         if not self.gpu.is_available:
             raise RuntimeError("GPU not available")
@@ -219,7 +225,7 @@ class GPUEngine:
             source_tex.upload(img)
             self._current_source_hash = source_hash
             start_stage = 0
-        elif tiling_mode:
+        elif tiling_mode or half_precision != self._last_half_precision:
             start_stage = 0
         else:
             start_stage = self._detect_invalidated_stage(settings, scale_factor)
@@ -313,7 +319,7 @@ class GPUEngine:
             elif any(v != 0.0 for v in settings.process.local_shadow_cast):
                 cast = settings.process.local_shadow_cast
             else:
-                from negpy.features.exposure.normalization import normalize_log_image
+                from negpy.features.exposure.normalization import normalize_linear_image
                 from negpy.features.exposure.shadows import analyze_shadow_cast
 
                 epsilon = 1e-6
@@ -332,8 +338,7 @@ class GPUEngine:
                     ry1, ry2, rx1, rx2 = roi
                     analysis_source = analysis_source[ry1:ry2, rx1:rx2]
 
-                img_log = np.log10(np.clip(analysis_source, epsilon, 1.0))
-                res_norm = normalize_log_image(img_log, bounds)
+                res_norm = normalize_linear_image(analysis_source, bounds, epsilon)
                 cast = analyze_shadow_cast(res_norm, settings.process.shadow_cast_threshold)
 
         pw, ph, cw, ch, ox, oy = self._calculate_layout_dims(settings, crop_w, crop_h, render_size_ref)
@@ -380,6 +385,7 @@ class GPUEngine:
             h_rot,
             wgpu.TextureUsage.STORAGE_BINDING | wgpu.TextureUsage.TEXTURE_BINDING,
             "expo",
+            PREVIEW_EXPOSURE_FORMAT if half_precision else "rgba32float",
         )
         tex_clahe = self._get_intermediate_texture(
             w_rot,
@@ -435,7 +441,7 @@ class GPUEngine:
             )
             self._dispatch_pass(
                 enc,
-                "exposure",
+                "exposure_f16" if half_precision else "exposure",
                 [
                     (0, tex_norm.view),
                     (1, tex_expo.view),
@@ -584,6 +590,7 @@ class GPUEngine:
 
         self._last_settings = settings
         self._last_scale_factor = scale_factor
+        self._last_half_precision = half_precision
         return tex_final, metrics
 
     def _upload_unified_uniforms(
@@ -1057,7 +1064,7 @@ class GPUEngine:
             elif any(v != 0.0 for v in settings.process.local_shadow_cast):
                 global_cast = settings.process.local_shadow_cast
             else:
-                from negpy.features.exposure.normalization import normalize_log_image
+                from negpy.features.exposure.normalization import normalize_linear_image
                 from negpy.features.exposure.shadows import analyze_shadow_cast
 
                 epsilon = 1e-6
@@ -1066,8 +1073,7 @@ class GPUEngine:
                 if roi:
                     analysis_src = img_rot[y1:y2, x1:x2]
 
-                img_log = np.log10(np.clip(analysis_src, epsilon, 1.0))
-                res_norm = normalize_log_image(img_log, global_bounds)
+                res_norm = normalize_linear_image(analysis_src, global_bounds, epsilon)
                 global_cast = analyze_shadow_cast(res_norm, settings.process.shadow_cast_threshold)
         else:
             global_cast = (0.0, 0.0, 0.0)
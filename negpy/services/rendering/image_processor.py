@@ -28,6 +28,7 @@ from negpy.infrastructure.loaders.factory import loader_factory
 from negpy.infrastructure.loaders.helpers import get_best_demosaic_algorithm
 from negpy.services.export.print import PrintService
 from negpy.infrastructure.display.color_spaces import ColorSpaceRegistry
+from negpy.kernel.image.validation import ensure_image
 
 logger = get_logger(__name__)
 
@@ -41,6 +42,7 @@ class ImageProcessor:
     def __init__(self) -> None:
         self.engine_cpu = DarkroomEngine()
         self.engine_gpu: Optional[GPUEngine] = None
+        self._proof_transforms: Dict[Tuple[str, Optional[str], bool, str], Optional[ImageCms.ImageCmsTransform]] = {}
 
         if APP_CONFIG.use_gpu:
             gpu = GPUDevice.get()
@@ -88,6 +90,7 @@ class ImageProcessor:
                     scale_factor=scale_factor,
                     render_size_ref=render_size_ref,
                     readback_metrics=readback_metrics,
+                    half_precision=True,
                 )
                 context.metrics.update(gpu_metrics)
                 return processed, context.metrics
@@ -154,7 +157,7 @@ class ImageProcessor:
                 )
                 rgb = ensure_rgb(rgb)
 
-            f32_buffer = uint16_to_float32(np.ascontiguousarray(rgb))
+            f32_buffer = uint16_to_float32(rgb)
             h_raw, w_raw = f32_buffer.shape[:2]
             export_scale = max(h_raw, w_raw) / float(APP_CONFIG.preview_render_size)
 
@@ -285,6 +288,55 @@ class ImageProcessor:
             logger.error(f"CMS transformation failed: {e}")
             return pil_img, None
 
+    def _get_proof_transform(
+        self,
+        color_space: str,
+        icc_path: Optional[str],
+        inverse: bool,
+        mode: str,
+    ) -> Optional[ImageCms.ImageCmsTransform]:
+        """Builds (once per key) the working <-> target transform used by _apply_color_management."""
+        key = (color_space, icc_path, inverse, mode)
+        if key in self._proof_transforms:
+            return self._proof_transforms[key]
+
+        transform = None
+        try:
+            path_src = ColorSpaceRegistry.get_icc_path(color_space)
+            profile_working = ImageCms.getOpenProfile(path_src) if path_src and os.path.exists(path_src) else ImageCms.createProfile("sRGB")
+            profile_selected: Any = profile_working
+            if icc_path and os.path.exists(icc_path):
+                profile_selected = ImageCms.getOpenProfile(icc_path)
+            p_src, p_dst = (profile_selected, profile_working) if inverse else (profile_working, profile_selected)
+            transform = ImageCms.buildTransform(
+                p_src,
+                p_dst,
+                mode,
+                mode,
+                renderingIntent=ImageCms.Intent.RELATIVE_COLORIMETRIC,
+                flags=ImageCms.Flags.BLACKPOINTCOMPENSATION,
+            )
+        except Exception as e:
+            logger.error(f"CMS transformation failed: {e}")
+
+        self._proof_transforms[key] = transform
+        return transform
+
+    def apply_soft_proof(
+        self,
+        buffer: np.ndarray,
+        settings: WorkspaceConfig,
+        color_space: str,
+        icc_path: Optional[str],
+        inverse: bool = False,
+    ) -> np.ndarray:
+        """Proofs a float32 preview buffer through a cached ICC transform. Returns float32 in [0, 1]."""
+        pil_img = self.buffer_to_pil(buffer, settings)
+        transform = self._get_proof_transform(color_space, icc_path, inverse, pil_img.mode)
+        if transform is not None:
+            transform.apply_in_place(pil_img)
+        return ensure_image(np.multiply(np.asarray(pil_img), np.float32(1.0 / 255.0), dtype=np.float32))
+
     def _save_to_pil_buffer(
         self,
         pil_img: Image.Image,
@@ -1,4 +1,3 @@
-import numpy as np
 import cv2
 from typing import Tuple
 from negpy.kernel.system.config import APP_CONFIG
@@ -49,7 +48,7 @@ class PreviewManager:
             )
             rgb = ensure_rgb(rgb)
 
-            full_linear = uint16_to_float32(np.ascontiguousarray(rgb))
+            full_linear = uint16_to_float32(rgb)
             h_orig, w_orig = full_linear.shape[:2]
 
             max_res = APP_CONFIG.preview_render_size
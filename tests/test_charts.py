@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+
+def test_histogram_flush_alongside_render_kernels() -> None:
+    # The debounced flush runs on the GUI thread while the worker renders the next frame
+    script = textwrap.dedent(
+        """
+        import sys
+        import threading
+        import numpy as np
+        from PyQt6.QtWidgets import QApplication
+        from negpy.desktop.view.widgets.charts import HistogramWidget
+        from negpy.kernel.image.logic import float_to_uint8
+
+        app = QApplication(sys.argv)
+        widget = HistogramWidget()
+        big = np.random.default_rng(0).random((1024, 1024, 3), dtype=np.float32)
+        float_to_uint8(big)
+
+        stop = threading.Event()
+
+        def render() -> None:
+            while not stop.is_set():
+                float_to_uint8(big)
+
+        worker = threading.Thread(target=render)
+        worker.start()
+        try:
+            for seq in range(200):
+                widget.update_data(big, source_key=seq)
+                widget._flush_update()
+        finally:
+            stop.set()
+            worker.join()
+        assert widget._data_l.size == 256
+        """
+    )
+    env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue", QT_QPA_PLATFORM="offscreen")
+    proc = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 0, proc.stderr
@@ -18,6 +18,15 @@ class TestConfigDeserialization(unittest.TestCase):
         self.assertEqual(config.exposure.grade, 3.0)
         self.assertEqual(config.export.export_fmt, "TIFF")
 
+    def test_round_trip_does_not_share_lists(self):
+        source = WorkspaceConfig()
+        copy = WorkspaceConfig.from_flat_dict(source.to_dict())
+        copy.retouch.manual_dust_spots.append((0.5, 0.5, 3.0))
+        copy.lab.C41_MATRIX[0] = 0.0
+
+        self.assertEqual(source.retouch.manual_dust_spots, [])
+        self.assertEqual(source.lab.C41_MATRIX[0], 1.0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -27,6 +27,50 @@ class TestDesktopSessionSync(unittest.TestCase):
         self.assertEqual(self.session.state.selected_file_idx, 1)
         self.assertEqual(self.session.state.selected_indices, [1])
 
+    def test_update_config_emits_changed_section(self):
+        emitted = []
+        self.session.section_changed.connect(emitted.append)
+
+        config = self.session.state.config
+        self.session.update_config(replace(config, exposure=replace(config.exposure, density=1.2)))
+        self.assertEqual(emitted, ["exposure"])
+
+        config = self.session.state.config
+        self.session.update_config(replace(config, lab=replace(config.lab, sharpen=0.5), toning=replace(config.toning, sepia_strength=0.5)))
+        self.assertEqual(emitted[-1], "*")
+
+    def test_update_config_accumulates_unrendered_sections(self):
+        emitted = []
+        self.session.section_changed.connect(emitted.append)
+
+        config = self.session.state.config
+        self.session.update_config(replace(config, process=replace(config.process, analysis_buffer=0.1)), render=False)
+        config = self.session.state.config
+        self.session.update_config(replace(config, exposure=replace(config.exposure, density=1.2)))
+        self.assertEqual(emitted, ["*"])
+
+    def test_uploaded_paths_tracks_file_list(self):
+        self.session.state.uploaded_files = []
+        self.session.add_files([], validated_info=[{"name": "a.dng", "path": "/a.dng", "hash": "ha"}])
+        self.session.add_files([], validated_info=[{"name": "b.dng", "path": "/b.dng", "hash": "hb"}])
+        self.assertEqual(set(self.session.uploaded_paths), {"/a.dng", "/b.dng"})
+
+        self.session.state.selected_file_idx = 1
+        self.session.remove_current_file()
+        self.assertEqual(set(self.session.uploaded_paths), {"/a.dng"})
+
+        self.session.clear_files()
+        self.assertEqual(len(self.session.uploaded_paths), 0)
+
+    def test_trim_thumbnails_keeps_visible_rows(self):
+        model = self.session.asset_model
+        model.MAX_THUMBNAILS = 1
+        self.session.state.thumbnails.update({"file1.dng": "t1", "file2.dng": "t2"})
+
+        model.set_visible_range(0, 0)
+        model.trim_thumbnails()
+        self.assertEqual(list(self.session.state.thumbnails), ["file1.dng"])
+
     def test_sync_selected_settings_exclusions(self):
         source_config = WorkspaceConfig(
             exposure=replace(WorkspaceConfig().exposure, density=1.5),
@@ -64,6 +108,24 @@ class TestDesktopSessionSync(unittest.TestCase):
         self.assertEqual(saved_config.retouch.manual_dust_spots, [])
         self.assertTrue(saved_config.retouch.dust_remove)
 
+    def test_select_file_flushes_queued_sidebar_edits_to_outgoing_file(self):
+        from negpy.desktop.view.sidebar.base import BaseSidebar
+
+        controller = MagicMock()
+        controller.session = self.session
+        controller.state = self.session.state
+        sidebar = BaseSidebar(controller)
+
+        self.session.select_file(0)
+        sidebar.queue_config_section("exposure", density=1.7)
+        self.session.select_file(1)
+
+        args, _ = self.mock_repo.save_file_settings.call_args
+        self.assertEqual(args[0], "hash1")
+        self.assertEqual(args[1].exposure.density, 1.7)
+        self.assertNotEqual(self.session.state.config.exposure.density, 1.7)
+        self.assertEqual(sidebar._pending_updates, {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 import numpy as np
-from negpy.features.exposure.normalization import analyze_log_exposure_bounds, normalize_log_image
+from negpy.features.exposure.normalization import analyze_log_exposure_bounds, normalize_linear_image, normalize_log_image
 from negpy.features.exposure.logic import apply_characteristic_curve
 from negpy.features.process.models import ProcessMode
 
@@ -21,6 +21,20 @@ class TestE6Mode(unittest.TestCase):
         self.assertAlmostEqual(norm[0, 1, 0], 0.0, delta=0.05)
         self.assertAlmostEqual(norm[0, 0, 0], 1.0, delta=0.05)
 
+        fused = normalize_linear_image(img, bounds, epsilon)
+        np.testing.assert_allclose(fused, norm, atol=1e-5)
+
+    def test_bounds_match_log_percentiles(self):
+        rng = np.random.default_rng(7)
+        img = (rng.random((120, 90, 3)) ** 2).astype(np.float32)
+        img[:5] = 0.0
+
+        img_log = np.log10(np.clip(img, 1e-6, 1.0))
+        for mode, p_low, p_high in ((ProcessMode.C41, 0.5, 99.5), (ProcessMode.E6, 99.9, 0.01)):
+            bounds = analyze_log_exposure_bounds(img, process_mode=mode)
+            np.testing.assert_allclose(bounds.floors, np.percentile(img_log, p_low, axis=(0, 1)), atol=1e-5)
+            np.testing.assert_allclose(bounds.ceils, np.percentile(img_log, p_high, axis=(0, 1)), atol=1e-5)
+
     def test_e6_curve_parity(self):
         img_norm = np.array([[[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]]], dtype=np.float32)
 
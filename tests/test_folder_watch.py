@@ -0,0 +1,18 @@
+import os
+from negpy.infrastructure.filesystem.watcher import FolderWatchService
+
+
+def test_scan_for_new_files_filters_extensions_and_existing(tmp_path) -> None:
+    for name in ("a.dng", "b.NEF", "c.txt", "noext", "known.tif"):
+        (tmp_path / name).write_bytes(b"")
+    (tmp_path / "dir.dng").mkdir()
+
+    existing = {os.path.join(str(tmp_path), "known.tif")}
+    found = FolderWatchService.scan_for_new_files(str(tmp_path), existing)
+
+    assert sorted(os.path.basename(p) for p in found) == ["a.dng", "b.NEF"]
+    assert all(os.path.isabs(p) for p in found)
+
+
+def test_scan_for_new_files_missing_folder(tmp_path) -> None:
+    assert FolderWatchService.scan_for_new_files(str(tmp_path / "missing"), set()) == []
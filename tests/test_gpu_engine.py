@@ -43,6 +43,18 @@ class TestGPUEngine(unittest.TestCase):
         self.assertIsInstance(tex, GPUTexture)
         self.assertEqual(tex.width, metrics["base_positive"].width)
 
+    def test_gpu_half_precision_matches_full(self):
+        """FP16 curve storage should stay within display quantization of the FP32 path."""
+        img = np.random.rand(64, 64, 3).astype(np.float32)
+        settings = WorkspaceConfig()
+
+        tex_full, _ = self.engine.process_to_texture(img, settings)
+        full = tex_full.readback()
+        tex_half, _ = self.engine.process_to_texture(img, settings, half_precision=True)
+        half = tex_half.readback()
+
+        np.testing.assert_allclose(half[..., :3], full[..., :3], atol=2.0 / 255.0)
+
     def test_gpu_engine_cleanup(self):
         """Verify cleanup releases resources."""
         img = np.random.rand(64, 64, 3).astype(np.float32)
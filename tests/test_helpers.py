@@ -1,3 +1,7 @@
+import os
+import subprocess
+import sys
+import textwrap
 import numpy as np
 import pytest
 from negpy.kernel.image.logic import (
@@ -9,12 +13,13 @@ from negpy.kernel.image.logic import (
     uint8_to_float32,
     uint16_to_float32,
     float_to_uint_luma,
+    calculate_histograms,
 )
 from negpy.kernel.image.validation import ensure_image
 
 
 def test_float_to_uint8() -> None:
-    img = np.array([[0.0, 0.5, 1.0], [2.0, -1.0, 0.5]], dtype=np.float32)
+    img = np.array([[0.0, 0.5, 1.0], [2.0, -1.0, np.nan]], dtype=np.float32)
     res = float_to_uint8(img)
     assert res.dtype == np.uint8
     assert res[0, 0] == 0
@@ -22,6 +27,56 @@ def test_float_to_uint8() -> None:
     assert res[0, 2] == 255
     assert res[1, 0] == 255  # Clamped
     assert res[1, 1] == 0  # Clamped
+    assert res[1, 2] == 0  # NaN
+
+
+def test_calculate_histograms_matches_numpy() -> None:
+    rng = np.random.default_rng(0)
+    img = rng.uniform(-0.1, 1.1, size=(37, 23, 3)).astype(np.float32)
+    img[0, 0, 0] = np.nan
+    img[1, 1, 1] = 1.0
+    lum = get_luminance(img)
+    res = calculate_histograms(img, np.empty((4, 256), dtype=np.int32))
+    for i, channel in enumerate((img[..., 0], img[..., 1], img[..., 2], lum)):
+        expected, _ = np.histogram(channel[~np.isnan(channel)], bins=256, range=(0, 1))
+        np.testing.assert_array_equal(res[i], expected)
+
+
+def test_calculate_histograms_alongside_parallel_kernel() -> None:
+    # The desktop app pins the workqueue layer, which aborts the process when two
+    # threads launch parallel kernels at once; the GUI-thread histogram must stay serial.
+    script = textwrap.dedent(
+        """
+        import threading
+        import numpy as np
+        from negpy.kernel.image.logic import calculate_histograms, float_to_uint8
+
+        big = np.random.default_rng(0).random((1024, 1024, 3), dtype=np.float32)
+        small = np.ascontiguousarray(big[::4, ::4])
+        out = np.empty((4, 256), dtype=np.int32)
+        float_to_uint8(big)
+        calculate_histograms(small, out)
+
+        stop = threading.Event()
+
+        def render() -> None:
+            while not stop.is_set():
+                float_to_uint8(big)
+
+        worker = threading.Thread(target=render)
+        worker.start()
+        try:
+            for _ in range(200):
+                calculate_histograms(small, out)
+        finally:
+            stop.set()
+            worker.join()
+        assert out.sum() > 0
+        """
+    )
+    env = dict(os.environ, NUMBA_THREADING_LAYER="workqueue")
+    proc = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 0, proc.stderr
 
 
 def test_float_to_uint16() -> None:
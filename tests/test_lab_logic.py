@@ -5,6 +5,7 @@ from negpy.features.lab.logic import (
     apply_output_sharpening,
     apply_saturation,
     apply_spectral_crosstalk,
+    apply_spectral_crosstalk_linear,
     apply_clahe,
     apply_vibrance,
     apply_chroma_denoise,
@@ -25,6 +26,17 @@ class TestLabLogic(unittest.TestCase):
         res_swap = apply_spectral_crosstalk(img, 1.0, matrix_swap)
         assert np.allclose(res_swap[0, 0], [0.5, 1.0, 0.0])
 
+    def test_spectral_crosstalk_linear_matches_density_roundtrip(self) -> None:
+        """Fused linear variant should equal log -> mix -> exp."""
+        img = np.random.rand(16, 16, 3).astype(np.float32)
+        img[0, 0] = [0.0, 1.0, 2.0]
+        matrix = [1.2, -0.1, -0.1, -0.1, 1.2, -0.1, -0.1, -0.1, 1.2]
+
+        dens = -np.log10(np.clip(img, 1e-6, 1.0))
+        expected = np.power(10.0, -apply_spectral_crosstalk(dens, 0.5, matrix))
+        res = apply_spectral_crosstalk_linear(img, 0.5, matrix)
+        assert np.allclose(res, expected, rtol=1e-4, atol=1e-6)
+
     def test_clahe(self) -> None:
         """CLAHE should modify image."""
         img = np.random.rand(100, 100, 3).astype(np.float32)
@@ -39,6 +39,14 @@ class TestShadowCastRemoval(unittest.TestCase):
 
         self.assertGreater(diff_s, diff_h)
 
+    def test_negative_mean_stays_finite(self):
+        img = np.full((4, 4, 3), -0.2, dtype=np.float32)
+
+        res = apply_shadow_cast_correction(img, (0.1, -0.1, 0.05), strength=1.0)
+
+        self.assertTrue(np.all(np.isfinite(res)))
+        np.testing.assert_array_equal(res, 0.0)
+
 
 if __name__ == "__main__":
     unittest.main()